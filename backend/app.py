@@ -1,4 +1,6 @@
-from flask import Flask, jsonify
+from time import perf_counter
+
+from flask import Flask, Response, g, jsonify, request
 from flasgger import Swagger
 from flask_cors import CORS
 import logging
@@ -11,6 +13,14 @@ from backend.routes.rank import rank_bp
 from backend.routes.stats import stats_bp
 from backend.routes.importance import importance_bp
 from backend.routes.docs import docs_bp
+from backend.routes.jobs import jobs_bp
+from backend.routes.model import model_bp
+
+from backend.config import WARMUP_ENABLED, PREFORK_SERVING, METRICS_ENABLED
+from backend.json_provider import ExoJSONProvider
+from backend.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS, HTTP_ERRORS, render_prometheus
+from backend.warmup import readiness, start_warmup
+from backend.prefork import process_memory
 
 
 # ==============================
@@ -27,6 +37,9 @@ app.config["SWAGGER"] = {
     "description": "AI-powered Exoplanet Habitability Prediction System",
 }
 
+# jsonify(): NumPy values / columnar slices encoded directly, NaN → null
+app.json = ExoJSONProvider(app)
+
 # ==============================
 # ⭐ ENABLE EXTENSIONS
 # ==============================
@@ -58,6 +71,34 @@ app.register_blueprint(rank_bp)
 app.register_blueprint(stats_bp)
 app.register_blueprint(importance_bp)
 app.register_blueprint(docs_bp)
+app.register_blueprint(jobs_bp)
+app.register_blueprint(model_bp)
+
+
+# ==============================
+# 📈 REQUEST METRICS
+# ==============================
+@app.before_request
+def start_request_timer():
+    if METRICS_ENABLED:
+        g.request_start = perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    start = g.get("request_start")
+
+    if start is not None:
+        # Route template, not the raw path: bounded label cardinality
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+
+        HTTP_REQUEST_SECONDS.labels(route, request.method).observe(perf_counter() - start)
+        HTTP_REQUESTS.inc(route, request.method, str(response.status_code))
+
+        if response.status_code >= 500:
+            HTTP_ERRORS.inc(route)
+
+    return response
 
 
 # ==============================
@@ -76,6 +117,49 @@ def health():
     return jsonify({"status": "ok"})
 
 
+@app.route("/ready")
+def ready():
+    """
+    Readiness probe (load balancer): 200 only once the model,
+    warm-up inferences and ranked dataset are loaded, else 503.
+    Reports per-component status and load times.
+    """
+    is_ready, report = readiness()
+    report["status"] = "ready" if is_ready else "warming_up"
+    return jsonify(report), 200 if is_ready else 503
+
+
+@app.route("/memory")
+def memory():
+    """
+    RSS / PSS of the worker process answering this request.
+    Sum pss_mb over workers for the real serving footprint.
+    """
+    report = process_memory()
+    report["status"] = "ok"
+    report["prefork"] = PREFORK_SERVING
+    return jsonify(report)
+
+
+@app.route("/metrics")
+def metrics():
+    """
+    Prometheus scrape endpoint (text format 0.0.4): per-route and
+    per-scoring-stage latency histograms, request / error / cache /
+    model-load counters, dataset and model-version gauges.
+    Values are per worker process.
+    """
+    return Response(render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
+# ==============================
+# 🔥 STARTUP WARM-UP
+# (pre-fork: done by the master, see deployment/gunicorn.conf.py)
+# ==============================
+if WARMUP_ENABLED and not PREFORK_SERVING:
+    start_warmup()
+
+
 # ==============================
 # 🚨 GLOBAL ERROR HANDLER
 # ==============================
@@ -20,6 +20,28 @@ CLEANED_DATA_PATH = os.path.join(PROCESSED_DATA_DIR, "cleaned_exoplanets.csv")
 ENGINEERED_DATA_PATH = os.path.join(PROCESSED_DATA_DIR, "feature_engineered_exoplanets.csv")
 RANKED_DATA_PATH = os.path.join(PROCESSED_DATA_DIR, "ranked_exoplanets.csv")
 
+# /rank: sort permutations built with every catalog load (comma separated).
+# They also index ?filter= ranges (binary search); other numeric columns
+# are answered with an argpartition top-k / a vectorized scan
+RANK_PRESORTED_COLUMNS = tuple(
+    c.strip()
+    for c in os.getenv(
+        "EXOHABITAI_RANK_PRESORTED", "habitability_score,prediction,pl_rade,pl_eqt,st_teff"
+    ).split(",")
+    if c.strip()
+)
+
+# A reload of a file that only grew (rows appended at the end) parses
+# just the new rows and extends the /stats aggregates in O(new rows)
+CATALOG_APPEND_RELOAD = os.getenv("EXOHABITAI_CATALOG_APPEND", "1") == "1"
+
+# ======================================================
+# 📈 METRICS (GET /metrics, Prometheus text format)
+# ======================================================
+
+# Per-route and per-scoring-stage latency histograms
+METRICS_ENABLED = os.getenv("EXOHABITAI_METRICS", "1") == "1"
+
 # ======================================================
 # 🤖 MODEL PATHS
 # ======================================================
@@ -29,6 +51,184 @@ MODEL_DIR = os.path.join(BASE_DIR, "models")
 MODEL_PATH = os.path.join(MODEL_DIR, "week4_best_model.pkl")
 BASELINE_MODEL_PATH = os.path.join(MODEL_DIR, "baseline_model.pkl")
 
+# Versioned artifacts published by training (src/model_manifest);
+# without a manifest the registry serves MODEL_PATH
+MODEL_MANIFEST_PATH = os.path.join(MODEL_DIR, "manifest.json")
+
+# Poll manifest / artifact and hot-swap newly published models
+MODEL_WATCH_ENABLED = os.getenv("EXOHABITAI_MODEL_WATCH", "1") == "1"
+MODEL_WATCH_INTERVAL_SECONDS = float(os.getenv("EXOHABITAI_MODEL_WATCH_INTERVAL", "5"))
+
+# POST /model/reload | /model/rollback | /model/shadow: callers must
+# send X-Admin-Token: <token>; unset → only localhost may call them
+MODEL_ADMIN_TOKEN = os.getenv("EXOHABITAI_ADMIN_TOKEN") or None
+
+# Extra versions kept in memory for ?model_version= pinning (LRU);
+# the served + rollback versions always stay and count towards it
+MODEL_CACHE_MAX_MB = float(os.getenv("EXOHABITAI_MODEL_CACHE_MAX_MB", "1024"))
+
+# ======================================================
+# 👥 SHADOW SCORING
+# ======================================================
+
+# Published versions that also score live /predict traffic, off the
+# request path (comma separated; also settable via POST /model/shadow)
+SHADOW_MODEL_VERSIONS = [v for v in os.getenv("EXOHABITAI_SHADOW_VERSIONS", "").split(",") if v]
+
+# Pending shadow requests; beyond this new ones are dropped
+SHADOW_QUEUE_MAX = 1024
+
+# Queued requests scored together per shadow model pass
+SHADOW_MAX_BATCH = 64
+
+# POST /model/shadow writes the versions here; every worker re-reads
+# the file when it changes (checked at most every watch interval), so
+# pre-fork workers share one configuration. Overrides
+# EXOHABITAI_SHADOW_VERSIONS while it exists
+SHADOW_CONFIG_PATH = os.path.join(MODEL_DIR, "shadow.json")
+
+# ======================================================
+# 🔥 STARTUP WARM-UP / READINESS
+# ======================================================
+
+# Load model + dataset and run synthetic inferences before /ready is 200
+WARMUP_ENABLED = os.getenv("EXOHABITAI_WARMUP", "1") == "1"
+
+# Synthetic payloads pushed through every prediction path
+WARMUP_INFERENCES = 3
+
+# ======================================================
+# 🍴 PRE-FORK SERVING (deployment/gunicorn.conf.py)
+# ======================================================
+
+# Set by the gunicorn config: the master preloads model + catalog
+# and background threads are started per worker after fork
+PREFORK_SERVING = os.getenv("EXOHABITAI_PREFORK", "0") == "1"
+
+# ======================================================
+# 🧵 MICRO-BATCHING (REQUEST COALESCER)
+# ======================================================
+
+# Collect concurrent /predict calls into one forest evaluation
+COALESCER_ENABLED = os.getenv("EXOHABITAI_COALESCER", "0") == "1"
+COALESCER_WINDOW_MS = float(os.getenv("EXOHABITAI_COALESCER_WINDOW_MS", "2"))
+COALESCER_MAX_BATCH = int(os.getenv("EXOHABITAI_COALESCER_MAX_BATCH", "64"))
+COALESCER_TIMEOUT_SECONDS = 30
+
+# n_jobs forced on the served estimator: thread fan-out costs more
+# than it saves on single rows / micro-batches
+SERVING_N_JOBS = 1
+
+# ======================================================
+# 🌲 COMPILED FOREST
+# ======================================================
+
+# Serve RandomForest pipelines from flat NumPy arrays (src/forest_compiler)
+USE_COMPILED_FOREST = os.getenv("EXOHABITAI_COMPILED_FOREST", "1") == "1"
+
+# Above this many rows sklearn's Cython traversal is faster
+COMPILED_FOREST_MAX_ROWS = 1024
+
+# ======================================================
+# 🧮 SURROGATE GRID (APPROXIMATE /predict)
+# ======================================================
+
+SURROGATE_GRID_ENABLED = os.getenv("EXOHABITAI_SURROGATE_GRID", "1") == "1"
+
+# Grid nodes per input over VALIDATION_RULES:
+#   (points, spacing[, (band_lo, band_hi, band_points)])
+# spacing: "linear", "log" (geometric) or "log1p" (ranges starting at 0);
+# the optional band adds linear nodes where scores change fastest.
+# Score kinks (ideal, ideal ± scale) are always added as nodes.
+SURROGATE_GRID_AXES = {
+    "pl_rade": (8, "log", (0.5, 2.5, 5)),
+    "pl_eqt": (8, "linear", (180, 420, 5)),
+    "pl_orbper": (6, "log1p", (150, 700, 4)),
+    "st_teff": (6, "linear"),
+    "st_mass": (5, "log"),
+    "st_rad": (5, "log"),
+}
+
+# Stored next to the model: <model>.surrogate.npy + .json metadata
+SURROGATE_GRID_PATH = os.path.splitext(MODEL_PATH)[0] + ".surrogate.npy"
+
+# Random in-range points used to measure the interpolation error
+SURROGATE_ERROR_SAMPLES = 4096
+
+# ======================================================
+# ⚡ PREDICTION CACHE
+# ======================================================
+
+CACHE_DIR = os.path.join(BASE_DIR, "cache")
+
+PREDICTION_CACHE_ENABLED = os.getenv("EXOHABITAI_PREDICTION_CACHE", "1") == "1"
+
+# Tier 1 — in-process LRU
+PREDICTION_CACHE_MAX_ENTRIES = 10_000
+PREDICTION_CACHE_TTL_SECONDS = 3600
+
+# Tier 2 — SQLite file shared by all WSGI workers (survives restarts)
+PREDICTION_CACHE_DB_PATH = os.path.join(CACHE_DIR, "predictions.sqlite3")
+PREDICTION_CACHE_DISK_MAX_ENTRIES = 500_000
+PREDICTION_CACHE_DISK_TTL_SECONDS = 7 * 24 * 3600
+
+# Opt-in: round inputs before building cache keys, so nearby
+# payloads share one cached result (scoring always uses the
+# original payload; off = exact keys, exact results)
+PREDICTION_CACHE_QUANTIZE = os.getenv("EXOHABITAI_CACHE_QUANTIZE", "0") == "1"
+
+# Decimal places kept per input when PREDICTION_CACHE_QUANTIZE is on
+PREDICTION_CACHE_QUANTIZATION = {
+    "pl_rade": 3,
+    "pl_eqt": 1,
+    "pl_orbper": 3,
+    "st_teff": 0,
+    "st_mass": 3,
+    "st_rad": 3,
+}
+
+# ======================================================
+# 🏷️ CONDITIONAL GET / COMPRESSION (/stats, /rank, /importance)
+# ======================================================
+
+# ETags from dataset / model version: repeat polls get 304 without
+# running the route; bodies are kept per version, pre-compressed
+HTTP_CACHE_ENABLED = os.getenv("EXOHABITAI_HTTP_CACHE", "1") == "1"
+
+# Identity + encoded bodies kept in memory (LRU)
+HTTP_CACHE_MAX_MB = float(os.getenv("EXOHABITAI_HTTP_CACHE_MAX_MB", "64"))
+
+# Smaller bodies are sent uncompressed
+COMPRESSION_MIN_BYTES = 1024
+
+# Each body is compressed once per version, so favour ratio.
+# brotli is optional (pip install brotli); without it only gzip is offered
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+# ======================================================
+# 🗂️ SCORING JOBS (LOCAL QUEUE)
+# ======================================================
+
+# Inputs, per-chunk outputs and the SQLite queue live here
+JOBS_DIR = os.path.join(BASE_DIR, "jobs")
+JOBS_DB_PATH = os.path.join(JOBS_DIR, "jobs.sqlite3")
+
+# Background runner inside the API process (disable when running
+# `python -m backend.services.job_queue` as a separate worker)
+JOB_RUNNER_ENABLED = os.getenv("EXOHABITAI_JOB_RUNNER", "1") == "1"
+
+JOB_WORKERS = int(os.getenv("EXOHABITAI_JOB_WORKERS", str(min(4, os.cpu_count() or 1))))
+JOB_CHUNK_ROWS = 5000
+
+# A running job whose heartbeat is older than this is resumed by another runner
+JOB_STALE_SECONDS = 60
+JOB_MAX_ATTEMPTS = 3
+JOB_POLL_SECONDS = 1.0
+
+# Server-side paths accepted by POST /jobs {"path": ...}
+JOB_INPUT_ROOTS = [DATA_DIR, JOBS_DIR]
+
 # ======================================================
 # 📊 REPORTS / FIGURES
 # ======================================================
@@ -44,6 +244,22 @@ API_HOST = "127.0.0.1"
 API_PORT = 5000
 DEBUG_MODE = True
 
+# Scientific input ranges accepted by /predict (min, max)
+VALIDATION_RULES = {
+    "pl_rade": (0.1, 20),
+    "pl_eqt": (50, 2000),
+    "pl_orbper": (0, 5000),
+    "st_teff": (2000, 10000),
+    "st_mass": (0.1, 5),
+    "st_rad": (0.1, 10),
+}
+
+# Max planets accepted by one /predict/batch request
+BATCH_MAX_ROWS = 100_000
+
+# /predict/stream: rows parsed + scored per chunk (bounds memory per request)
+STREAM_CHUNK_ROWS = int(os.getenv("EXOHABITAI_STREAM_CHUNK_ROWS", "1000"))
+
 # ======================================================
 # 🧠 FRONTEND CONFIG
 # ======================================================
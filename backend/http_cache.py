@@ -0,0 +1,243 @@
+# ======================================================
+# 🚀 ExoHabitAI — Conditional GET + Compressed Bodies
+# For read-only endpoints whose output only changes with
+# the dataset or the model (/stats, /rank, /importance)
+#
+# - strong ETag = hash(route, query, dataset / model version),
+#   known from an os.stat() / registry lookup: If-None-Match
+#   (or If-Modified-Since) → 304 before the route runs
+# - 200 bodies are kept per ETag (bounded LRU) together with
+#   their gzip / brotli encodings, each compressed once
+# - Cache-Control: no-cache → browsers store the body and
+#   revalidate every poll, so script.js needs no changes
+# ======================================================
+
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+from urllib.parse import urlencode
+
+from flask import Response, make_response, request
+from werkzeug.http import http_date
+
+from backend.config import (
+    BROTLI_QUALITY,
+    COMPRESSION_MIN_BYTES,
+    GZIP_LEVEL,
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_MAX_MB,
+)
+from backend.metrics import CallbackMetric, Counter, register
+from backend.model_registry import get_snapshot
+from backend.services.catalog import get_ranked_catalog
+
+try:
+    import brotli
+except ImportError:               # optional: gzip only
+    brotli = None
+
+
+# ======================================================
+# 🧠 BODY CACHE (identity + encodings, per ETag)
+# ======================================================
+
+_bodies = OrderedDict()           # (etag, encoding) -> (body, content_type)
+_bodies_lock = threading.Lock()
+_bodies_bytes = 0
+
+HTTP_CACHE = register(Counter(
+    "exohabitai_http_cache_total",
+    "Conditional-GET routes: not_modified (304), hit (cached body), miss (route ran)",
+    ("route", "result"),
+))
+
+register(CallbackMetric(
+    "exohabitai_http_cache_bytes", "gauge", lambda: [({}, _bodies_bytes)],
+    "Bytes of cached response bodies (all encodings)",
+))
+
+
+def _cache_get(key):
+    with _bodies_lock:
+        entry = _bodies.get(key)
+        if entry is not None:
+            _bodies.move_to_end(key)
+        return entry
+
+
+def _cache_put(key, body: bytes, content_type: str):
+    global _bodies_bytes
+
+    budget = HTTP_CACHE_MAX_MB * 1e6
+    if len(body) > budget:
+        return
+
+    with _bodies_lock:
+        previous = _bodies.pop(key, None)
+        if previous is not None:
+            _bodies_bytes -= len(previous[0])
+
+        _bodies[key] = (body, content_type)
+        _bodies_bytes += len(body)
+
+        while _bodies_bytes > budget:
+            _, (evicted, _) = _bodies.popitem(last=False)
+            _bodies_bytes -= len(evicted)
+
+
+def clear():
+    global _bodies_bytes
+
+    with _bodies_lock:
+        _bodies.clear()
+        _bodies_bytes = 0
+
+
+# ======================================================
+# 🏷️ VALIDATORS: (version, last-modified epoch seconds)
+# ======================================================
+
+def catalog_version() -> tuple:
+    snapshot = get_ranked_catalog().get()
+    return f"catalog:{snapshot.version}", snapshot.signature[0] / 1e9
+
+
+def model_version() -> tuple:
+    snapshot = get_snapshot()
+    return f"model:{snapshot.version}", os.path.getmtime(snapshot.path)
+
+
+def _etag(version: str) -> str:
+    query = urlencode(sorted(request.args.items(multi=True)))
+    return hashlib.sha256(f"{request.path}?{query}|{version}".encode("utf-8")).hexdigest()[:24]
+
+
+# ======================================================
+# 🗜️ CONTENT NEGOTIATION
+# ======================================================
+
+def _encodings() -> list:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def _negotiate() -> str:
+    return request.accept_encodings.best_match(_encodings()) or "identity"
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _representation_tag(etag: str, encoding: str) -> str:
+    # Strong ETags name exact bytes: one per content coding
+    return etag if encoding == "identity" else f"{etag}-{encoding}"
+
+
+def _not_modified(etag: str, modified: float, encoding: str):
+    """Encoding of the representation the client already has, else None."""
+
+    if request.if_none_match:
+        for candidate in [encoding, "identity", *_encodings()]:
+            if request.if_none_match.contains_weak(_representation_tag(etag, candidate)):
+                return candidate
+        return None
+
+    since = request.if_modified_since
+    if since is not None and int(modified) <= since.timestamp():
+        return encoding
+
+    return None
+
+
+def _finish(response: Response, etag: str, encoding: str, modified: float) -> Response:
+    response.set_etag(_representation_tag(etag, encoding))
+    response.headers["Last-Modified"] = http_date(int(modified))
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept-Encoding")
+
+    if encoding != "identity" and response.status_code == 200:
+        response.headers["Content-Encoding"] = encoding
+
+    return response
+
+
+# ======================================================
+# ⭐ ROUTE DECORATOR
+# ======================================================
+
+def conditional(validator):
+    """
+    Serve a GET route with ETag / Last-Modified validation and
+    cached, pre-compressed bodies. validator() -> (version,
+    last-modified epoch); if it raises (e.g. dataset missing)
+    the route runs uncached and reports the problem itself.
+    Only 200 responses are cached.
+    """
+
+    def decorate(view):
+
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+
+            if not HTTP_CACHE_ENABLED:
+                return view(*args, **kwargs)
+
+            try:
+                version, modified = validator()
+            except Exception:
+                return view(*args, **kwargs)
+
+            route = request.url_rule.rule if request.url_rule else request.path
+            etag = _etag(version)
+            encoding = _negotiate()
+
+            # --------------------------------------------------
+            # 304: nothing computed, nothing sent
+            # --------------------------------------------------
+            cached_encoding = _not_modified(etag, modified, encoding)
+            if cached_encoding is not None:
+                HTTP_CACHE.inc(route, "not_modified")
+                return _finish(Response(status=304), etag, cached_encoding, modified)
+
+            # --------------------------------------------------
+            # Cached body in the negotiated encoding
+            # --------------------------------------------------
+            entry = _cache_get((etag, encoding))
+
+            if entry is None:
+                identity = _cache_get((etag, "identity"))
+
+                if identity is None:
+                    response = make_response(view(*args, **kwargs))
+
+                    if response.status_code != 200 or response.is_streamed:
+                        return response
+
+                    HTTP_CACHE.inc(route, "miss")
+                    identity = (response.get_data(), response.content_type)
+                    _cache_put((etag, "identity"), *identity)
+                else:
+                    HTTP_CACHE.inc(route, "hit")
+
+                body, content_type = identity
+
+                if encoding != "identity" and len(body) >= COMPRESSION_MIN_BYTES:
+                    entry = (_compress(body, encoding), content_type)
+                    _cache_put((etag, encoding), *entry)
+                else:
+                    entry, encoding = identity, "identity"
+            else:
+                HTTP_CACHE.inc(route, "hit")
+
+            body, content_type = entry
+            return _finish(Response(body, content_type=content_type), etag, encoding, modified)
+
+        return wrapper
+
+    return decorate
+
@@ -0,0 +1,262 @@
+# ======================================================
+# 🚀 ExoHabitAI — JSON Provider (app.json)
+# Standard-library JSON with NumPy support and a fast
+# path for columnar catalog slices
+#
+# - ColumnarSlice / 1-D arrays are encoded column by column
+#   straight from NumPy by the C encoder: no DataFrame
+#   copy, no dict per row; the encoder writes that text in
+#   place of the value
+# - NaN / ±inf → null while encoding (valid JSON everywhere)
+# - same bytes as jsonify() of the equivalent Python data
+# ======================================================
+
+import json
+import re
+from json.encoder import (
+    c_make_encoder,
+    encode_basestring,
+    encode_basestring_ascii,
+    _make_iterencode,
+)
+
+import numpy as np
+from flask.json.provider import DefaultJSONProvider
+
+
+# Non-finite tokens json.dumps writes for floats (numeric arrays only)
+_NON_FINITE = re.compile(r"-?Infinity|NaN")
+
+# ValueError raised by json for NaN / inf when allow_nan=False
+_NON_FINITE_ERROR = "Out of range float values are not JSON compliant"
+
+
+# ======================================================
+# 🔢 COLUMN → JSON TOKENS
+# ======================================================
+
+def column_tokens(values: np.ndarray) -> list:
+    """One JSON token per value of a 1-D array (non-finite → null)."""
+
+    kind = values.dtype.kind
+
+    if kind in "iuf":
+        if len(values) == 0:
+            return []
+
+        # The C encoder writes float.__repr__ / int tokens; no commas inside
+        tokens = json.dumps(values.tolist(), separators=(",", ":"))[1:-1].split(",")
+        if kind == "f":
+            for i in np.flatnonzero(~np.isfinite(values)).tolist():
+                tokens[i] = "null"
+        return tokens
+
+    if kind == "b":
+        return np.where(values, "true", "false").tolist()
+
+    return [_dumps_value(v) for v in values.tolist()]
+
+
+def column_json(values: np.ndarray) -> str:
+    """JSON array of a 1-D array (non-finite → null)."""
+
+    kind = values.dtype.kind
+
+    if kind in "iuf":
+        text = json.dumps(values.tolist(), separators=(",", ":"))
+        if kind == "f" and not np.isfinite(values).all():
+            text = _NON_FINITE.sub("null", text)
+        return text
+
+    return "[" + ",".join(column_tokens(values)) + "]"
+
+
+def _dumps_value(value) -> str:
+    if isinstance(value, float) and not np.isfinite(value):
+        return "null"
+    return json.dumps(finite(value), default=_numpy_default)
+
+
+def finite(obj):
+    """Copy of plain JSON data with non-finite floats as None."""
+
+    if isinstance(obj, float):
+        return obj if np.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [finite(v) for v in obj]
+    return obj
+
+
+def _numpy_default(o):
+    if isinstance(o, np.integer):
+        return int(o)
+    if isinstance(o, np.floating):
+        return float(o) if np.isfinite(o) else None
+    if isinstance(o, np.bool_):
+        return bool(o)
+    if isinstance(o, np.ndarray):
+        return finite(o.tolist())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# ======================================================
+# 📦 COLUMNAR SLICE
+# ======================================================
+
+class ColumnarSlice:
+    """
+    Selected rows of named NumPy columns, for JSON responses.
+
+    orient="records"   [{"col": v, ...}, ...]   (to_dict(orient="records"))
+    orient="columns"   {"col": [v, ...], ...}   (compact columnar shape)
+
+    Only the selected rows are gathered; keys are sorted like
+    every other jsonify() dict.
+    """
+
+    def __init__(self, columns: dict, rows=None, orient: str = "records"):
+        if orient not in ("records", "columns"):
+            raise ValueError(f"unknown orient '{orient}'")
+
+        self.columns = columns
+        self.rows = rows
+        self.orient = orient
+
+    def __len__(self) -> int:
+        if self.rows is not None:
+            return len(self.rows)
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def to_json(self) -> str:
+        names = sorted(self.columns)
+        keys = [json.dumps(name) for name in names]
+        values = [
+            self.columns[name][self.rows] if self.rows is not None else self.columns[name]
+            for name in names
+        ]
+
+        if self.orient == "columns":
+            return "{" + ",".join(f"{key}:{column_json(v)}" for key, v in zip(keys, values)) + "}"
+
+        if not names:
+            return "[" + ",".join(["{}"] * len(self)) + "]"
+
+        # One C-level format per row
+        template = "{" + ",".join(f"{key.replace('%', '%%')}:%s" for key in keys) + "}"
+        tokens = [column_tokens(v) for v in values]
+        return "[" + ",".join([template % row for row in zip(*tokens)]) + "]"
+
+
+# ======================================================
+# 🧩 PRE-ENCODED FRAGMENTS
+# ======================================================
+
+class _Fragment(str):
+    """JSON text of one value; only created by ExoJSONProvider.dumps."""
+    __slots__ = ()
+
+
+class _FragmentFound(Exception):
+    """Plain encoding met a ColumnarSlice / 1-D array."""
+
+
+def _as_fragment(o):
+    if isinstance(o, ColumnarSlice):
+        return _Fragment(o.to_json())
+    if isinstance(o, np.ndarray) and o.ndim == 1:
+        return _Fragment(column_json(o))
+    return None
+
+
+def _is_fragment_source(o) -> bool:
+    return isinstance(o, ColumnarSlice) or (isinstance(o, np.ndarray) and o.ndim == 1)
+
+
+def _floatstr(o, _repr=float.__repr__):
+    # allow_nan=False twin of JSONEncoder's float formatter
+    if o != o or o in (float("inf"), float("-inf")):
+        raise ValueError(f"{_NON_FINITE_ERROR}: {o!r}")
+    return _repr(o)
+
+
+class _FragmentEncoder(json.JSONEncoder):
+    """
+    JSONEncoder that writes _Fragment values as raw JSON text.
+    Fragments are recognized by exact type, never by content,
+    so no user string can be taken for one.
+    """
+
+    def iterencode(self, o, _one_shot=False):
+        plain = encode_basestring_ascii if self.ensure_ascii else encode_basestring
+
+        def strings(s):
+            return str.__str__(s) if s.__class__ is _Fragment else plain(s)
+
+        markers = {} if self.check_circular else None
+
+        if _one_shot and c_make_encoder is not None and self.indent is None:
+            encode = c_make_encoder(
+                markers, self.default, strings, self.indent, self.key_separator,
+                self.item_separator, self.sort_keys, self.skipkeys, self.allow_nan,
+            )
+        else:
+            encode = _make_iterencode(
+                markers, self.default, strings, self.indent, _floatstr, self.key_separator,
+                self.item_separator, self.sort_keys, self.skipkeys, _one_shot,
+            )
+        return encode(o, 0)
+
+
+def _encode(encoder_cls, obj, default, kwargs: dict) -> str:
+    encoder = encoder_cls(default=default, allow_nan=False, **kwargs)
+
+    try:
+        return encoder.encode(obj)
+    except ValueError as e:
+        if not str(e).startswith(_NON_FINITE_ERROR):
+            raise
+
+    # NaN / inf in plain Python data
+    return encoder.encode(finite(obj))
+
+
+# ======================================================
+# ⭐ FLASK PROVIDER
+# ======================================================
+
+class ExoJSONProvider(DefaultJSONProvider):
+    """
+    app.json: jsonify() / request.get_json() for the whole API.
+
+    Adds NumPy scalars / arrays and ColumnarSlice; non-finite
+    floats become null (plain data is only re-walked when it
+    actually contains one).
+    """
+
+    def default(self, o):
+        try:
+            return _numpy_default(o)
+        except TypeError:
+            return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs) -> str:
+        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+        kwargs.setdefault("sort_keys", self.sort_keys)
+        fallback = kwargs.pop("default", self.default)
+
+        def plain(o):
+            if _is_fragment_source(o):
+                raise _FragmentFound
+            return fallback(o)
+
+        def fragments(o):
+            fragment = _as_fragment(o)
+            return fallback(o) if fragment is None else fragment
+
+        # Plain data stays on the stock C encoder (no per-string hook)
+        try:
+            return _encode(json.JSONEncoder, obj, plain, kwargs)
+        except _FragmentFound:
+            return _encode(_FragmentEncoder, obj, fragments, kwargs)
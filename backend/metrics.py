@@ -0,0 +1,264 @@
+# ======================================================
+# 🚀 ExoHabitAI — Lightweight Metrics Primitives
+# Thread-safe histograms / counters / gauges, exported
+# in Prometheus text format at GET /metrics
+# ======================================================
+
+import bisect
+import threading
+
+
+# ======================================================
+# 📊 HISTOGRAM
+# ======================================================
+
+class Histogram:
+    """
+    Fixed-bucket cumulative histogram (Prometheus semantics).
+
+    observe() is O(log buckets) under a short lock, so it is
+    cheap enough for per-request hot paths.
+    """
+
+    def __init__(self, name: str, buckets, description: str = ""):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+
+        self._counts = [0] * (len(self.buckets) + 1)  # last = +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        idx = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        """Cumulative bucket counts + sum / count / mean."""
+
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+            count = self._count
+
+        cumulative = []
+        running = 0
+
+        for bound, c in zip(list(self.buckets) + ["+Inf"], counts):
+            running += c
+            cumulative.append({"le": bound, "count": running})
+
+        return {
+            "name": self.name,
+            "description": self.description,
+            "count": count,
+            "sum": total,
+            "mean": total / count if count else 0.0,
+            "buckets": cumulative,
+        }
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
+
+    def prometheus_samples(self, labels: dict = None):
+        """(suffix, labels, value) rows of the text exposition format."""
+
+        labels = labels or {}
+        snapshot = self.snapshot()
+
+        for bucket in snapshot["buckets"]:
+            yield "_bucket", {**labels, "le": bucket["le"]}, bucket["count"]
+
+        yield "_sum", labels, snapshot["sum"]
+        yield "_count", labels, snapshot["count"]
+
+
+# ======================================================
+# 🏷️ LABELED FAMILIES
+# ======================================================
+
+class HistogramFamily:
+    """
+    One Histogram per label combination.
+
+    Hot paths should resolve labels() once and keep the child:
+    observe() on the child is then the only per-call cost.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, buckets, description: str = "", labelnames=()):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = tuple(labelnames)
+
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values) -> Histogram:
+        child = self._children.get(values)
+
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(
+                    values, Histogram(self.name, self.buckets, self.description)
+                )
+
+        return child
+
+    def children(self) -> list:
+        """(label values, Histogram) pairs observed so far."""
+        return list(self._children.items())
+
+    def samples(self):
+        for values, child in self.children():
+            yield from child.prometheus_samples(dict(zip(self.labelnames, values)))
+
+
+class Counter:
+    """Monotonic counter, optionally labeled."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, description: str = "", labelnames=()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *values, amount: float = 1):
+        with self._lock:
+            self._values[values] = self._values.get(values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+
+        for values, value in items:
+            yield "", dict(zip(self.labelnames, values)), value
+
+
+class CallbackMetric:
+    """
+    Gauge / counter read at scrape time from state another
+    module already keeps: fn() -> [(labels dict, value), ...]
+    """
+
+    def __init__(self, name: str, metric_type: str, fn, description: str = ""):
+        self.name = name
+        self.metric_type = metric_type
+        self.description = description
+        self.fn = fn
+
+    def samples(self):
+        for labels, value in self.fn():
+            yield "", labels, value
+
+
+# ======================================================
+# 📤 PROMETHEUS EXPOSITION
+# ======================================================
+
+_registry = []
+_registry_lock = threading.Lock()
+
+
+def register(metric):
+    """Export a metric at /metrics. Returns it for one-line definitions."""
+
+    with _registry_lock:
+        if metric not in _registry:
+            _registry.append(metric)
+
+    return metric
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus() -> str:
+    """Every registered metric in Prometheus text format 0.0.4."""
+
+    lines = []
+
+    with _registry_lock:
+        metrics = list(_registry)
+
+    for metric in metrics:
+        try:
+            samples = list(metric.samples())
+        except Exception as e:
+            # One broken callback must not hide every other metric
+            lines.append(f"# {metric.name} unavailable: {_escape(e)}")
+            continue
+
+        lines.append(f"# HELP {metric.name} {_escape(metric.description)}")
+        lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            label_text = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{metric.name}{suffix}{label_text} {_format_value(value)}")
+
+    return "\n".join(lines) + "\n"
+
+
+# ======================================================
+# 📈 SERVICE METRICS
+# ======================================================
+
+# Seconds: request / stage latencies from ~50µs to 10s
+LATENCY_BUCKETS_SECONDS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10,
+)
+
+HTTP_REQUEST_SECONDS = register(HistogramFamily(
+    "exohabitai_http_request_duration_seconds", LATENCY_BUCKETS_SECONDS,
+    "Request latency per route (streamed bodies: until the first byte)",
+    ("route", "method"),
+))
+
+HTTP_REQUESTS = register(Counter(
+    "exohabitai_http_requests_total",
+    "Requests per route and status code",
+    ("route", "method", "status"),
+))
+
+HTTP_ERRORS = register(Counter(
+    "exohabitai_http_errors_total",
+    "5xx responses per route",
+    ("route",),
+))
+
+PREDICT_STAGE_SECONDS = register(HistogramFamily(
+    "exohabitai_predict_stage_seconds", LATENCY_BUCKETS_SECONDS,
+    "Time per scoring stage (path: full / fast / batch)",
+    ("path", "stage"),
+))
+
+MODEL_LOADS = register(Counter(
+    "exohabitai_model_loads_total",
+    "Model artifact loads from disk",
+    ("result",),
+))
@@ -1,91 +1,640 @@
 # ======================================================
 # 🚀 ExoHabitAI — Production Model Registry
-# Centralized ML model access layer
+# Single, versioned model access layer
+#
+# - loads the manifest's current version (models/manifest.json)
+#   or, without a manifest, the legacy MODEL_PATH artifact
+# - atomic snapshot swap: in-flight requests keep the
+#   snapshot they started with
+# - mtime/hash watcher hot-swaps newly published models
+# - previous snapshot kept in memory for instant rollback
+# - other versions loaded on demand for per-request pinning,
+#   LRU-evicted under MODEL_CACHE_MAX_MB
 # ======================================================
 
 import os
+import time
+import hashlib
 import joblib
 import threading
+import multiprocessing
+from collections import OrderedDict
+from datetime import datetime, timezone
 
-from backend.config import MODEL_PATH
+from backend.config import (
+    MODEL_DIR,
+    MODEL_PATH,
+    MODEL_MANIFEST_PATH,
+    SERVING_N_JOBS,
+    USE_COMPILED_FOREST,
+    MODEL_WATCH_ENABLED,
+    MODEL_WATCH_INTERVAL_SECONDS,
+    MODEL_CACHE_MAX_MB,
+)
+from backend.metrics import (
+    CallbackMetric,
+    HistogramFamily,
+    LATENCY_BUCKETS_SECONDS,
+    MODEL_LOADS,
+    register,
+)
+from src.forest_compiler import compile_forest
+from src.model_artifact import artifact_path, load_artifact
+from src.model_manifest import (
+    file_sha256,
+    find_version,
+    read_manifest,
+    set_current_version,
+)
 
 
 # ======================================================
-# 🧠 GLOBAL MODEL STORAGE
+# 📸 MODEL SNAPSHOT
 # ======================================================
 
-_model = None
-_model_lock = threading.Lock()
+class ModelSnapshot:
+    """
+    One loaded model version + everything derived from it.
+
+    Snapshots are immutable once published; derived objects
+    (compiled forest) are built lazily and live and die
+    with their version.
+    """
+
+    def __init__(self, model, version: str, path: str, entry: dict = None):
+        self.model = model
+        self.version = version
+        self.path = path
+        self.entry = entry or {}
+        self.loaded_at = datetime.now(timezone.utc).isoformat()
+        self.artifact_bytes = os.path.getsize(path)
+
+        self._compiled = None
+        self._compiled_done = False
+        self._compiled_lock = threading.Lock()
+
+    @property
+    def compiled(self):
+        """CompiledForest for this version, or None (sklearn fallback)."""
+
+        if self._compiled_done:
+            return self._compiled
+
+        with self._compiled_lock:
+            if not self._compiled_done:
+                try:
+                    self._compiled = self._stored_forest() or compile_forest(self.model)
+                    print(
+                        f"🌲 Compiled forest: {self._compiled.n_trees} trees, "
+                        f"{self._compiled.n_nodes} nodes"
+                    )
+                except ValueError as e:
+                    self._compiled = None
+                    print(f"ℹ️ Serving sklearn model (not compilable: {e})")
+
+                self._compiled_done = True
+
+        return self._compiled
+
+    def _stored_forest(self):
+        """
+        Memory-mapped forest artifact written next to the pickle
+        (src/model_artifact), if it was built from these bytes.
+        """
+
+        path = artifact_path(self.path)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            forest, header = load_artifact(path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Ignoring unreadable forest artifact {path}: {e}")
+            return None
+
+        if not (header.get("source_sha256") or "").startswith(self.version):
+            return None
+
+        return forest
+
+    @property
+    def nbytes(self) -> int:
+        """Memory estimate: pickled size (array-dominated) + compiled arrays."""
+
+        compiled = self._compiled if self._compiled_done else None
+        return self.artifact_bytes + (compiled.nbytes if compiled is not None else 0)
+
+    def info(self) -> dict:
+        return {
+            "version": self.version,
+            "artifact": os.path.basename(self.path),
+            "loaded_at": self.loaded_at,
+            "memory_mb": round(self.nbytes / 1e6, 1),
+            "estimator": self.entry.get("estimator") or type(_final_estimator(self.model)).__name__,
+            "features": self.entry.get("features") or [
+                str(f) for f in getattr(self.model, "feature_names_in_", [])
+            ],
+            "metrics": self.entry.get("metrics", {}),
+            "created_at": self.entry.get("created_at"),
+        }
+
+
+# ======================================================
+# 🧠 GLOBAL REGISTRY STATE
+# ======================================================
+
+_current = None                 # ModelSnapshot served to new requests
+_previous = None                # last replaced snapshot (rollback target)
+
+# Other versions loaded for pinned requests: version -> snapshot (LRU)
+_cached = OrderedDict()
+_cached_lock = threading.Lock()
+
+_load_lock = threading.Lock()   # first load / pinned-version loads
+_swap_lock = threading.Lock()   # serializes reload / rollback
+
+# Request latency per (version, endpoint); survives eviction / swaps
+MODEL_LATENCY = register(HistogramFamily(
+    "exohabitai_model_request_duration_seconds", LATENCY_BUCKETS_SECONDS,
+    "Scoring request latency per model version and endpoint",
+    ("version", "endpoint"),
+))
+
+# Callbacks run after every swap (cache invalidation etc.)
+_reload_hooks = []
+
+# Disk signature last seen by the watcher
+_watched_signature = None
+_watcher = None
+_watcher_lock = threading.Lock()
+
+# (model, CompiledForest | None) for models not served by the registry
+_unregistered_compiled = (None, None)
+_unregistered_lock = threading.Lock()
 
 
 # ======================================================
 # 🔧 INTERNAL LOADER
 # ======================================================
 
-def _load_model_from_disk():
+def _final_estimator(model):
+    if hasattr(model, "named_steps"):
+        return list(model.named_steps.values())[-1]
+    return model
+
+
+def _apply_serving_n_jobs(model):
+    """
+    Pin n_jobs of the final estimator for serving.
+    Trained with n_jobs=-1, a forest fans every tiny call out
+    across all cores; predictions are unchanged by this.
+    """
+
+    final_model = _final_estimator(model)
+
+    if hasattr(final_model, "n_jobs"):
+        final_model.n_jobs = SERVING_N_JOBS
+
+
+def _file_version(path: str) -> str:
+    """
+    Content-hash version of a model artifact.
+    Same bytes → same version across workers and restarts.
+    """
+
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()[:12]
+
+
+def _resolve_artifact(version: str = None):
+    """
+    (path, manifest_entry | None) of a version: the given one,
+    else the manifest's current version, else legacy MODEL_PATH.
     """
-    Safely load ML model from disk.
+
+    manifest = read_manifest(MODEL_DIR)
+
+    if version is not None:
+        entry = find_version(manifest, version) if manifest else None
+        if entry is None:
+            raise LookupError(f"unknown model version: {version}")
+        return os.path.join(MODEL_DIR, entry["artifact"]), entry
+
+    if manifest and manifest.get("current"):
+        entry = find_version(manifest, manifest["current"])
+        if entry is None:
+            raise RuntimeError(f"❌ Manifest current version {manifest['current']} is not listed")
+        return os.path.join(MODEL_DIR, entry["artifact"]), entry
+
+    return MODEL_PATH, None
+
+
+def _load_snapshot(version: str = None) -> ModelSnapshot:
+    """
+    Safely load a model version from disk.
     Provides clear production-level error messages.
     """
 
-    if not os.path.exists(MODEL_PATH):
+    path, entry = _resolve_artifact(version)
+
+    if not os.path.exists(path):
         raise FileNotFoundError(
-            f"❌ Model not found at: {MODEL_PATH}\n"
+            f"❌ Model not found at: {path}\n"
             f"Run training pipeline before starting API."
         )
 
     try:
-        print("🚀 Loading ML model (registry)...")
-        model = joblib.load(MODEL_PATH)
-        print("✅ Model loaded successfully")
-        return model
+        if entry is not None:
+            sha256 = file_sha256(path)
+            if sha256 != entry["sha256"]:
+                raise RuntimeError(f"artifact hash mismatch for version {entry['version']}")
+            version = entry["version"]
+        else:
+            version = _file_version(path)
+
+        print(f"🚀 Loading ML model (registry, version {version})...")
+        model = joblib.load(path)
+        _apply_serving_n_jobs(model)
+        print(f"✅ Model loaded successfully (version {version})")
+
+        MODEL_LOADS.inc("success")
+        return ModelSnapshot(model, version, path, entry)
 
     except Exception as e:
+        MODEL_LOADS.inc("failure")
         raise RuntimeError(f"❌ Failed to load model: {str(e)}")
 
 
+def _disk_signature():
+    """Cheap change detector: (mtime_ns, size) of manifest + artifact."""
+
+    signature = []
+
+    for path in (MODEL_MANIFEST_PATH, MODEL_PATH):
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+
+    return tuple(signature)
+
+
 # ======================================================
-# ⭐ PUBLIC ACCESS FUNCTION
+# ⭐ PUBLIC ACCESS FUNCTIONS
 # ======================================================
 
+def get_snapshot(version: str = None) -> ModelSnapshot:
+    """
+    Served snapshot, or the pinned version (manifest version id).
+    Hold on to it for the whole request to score against one
+    consistent version during a swap.
+
+    Raises LookupError for versions not in the manifest.
+    """
+
+    global _current, _watched_signature
+
+    snapshot = _current
+
+    if snapshot is None:
+        with _load_lock:
+            if _current is None:
+                _watched_signature = _disk_signature()
+                _current = _load_snapshot()
+        snapshot = _current
+
+    if version is None or version == snapshot.version:
+        return snapshot
+
+    return _get_pinned(version)
+
+
+def _get_pinned(version: str) -> ModelSnapshot:
+    """Non-served version from the LRU, loaded on first use."""
+
+    previous = _previous
+    if previous is not None and previous.version == version:
+        return previous
+
+    with _cached_lock:
+        snapshot = _cached.get(version)
+        if snapshot is not None:
+            _cached.move_to_end(version)
+            return snapshot
+
+    with _load_lock:
+        with _cached_lock:
+            snapshot = _cached.get(version)
+
+        if snapshot is None:
+            snapshot = _load_snapshot(version)
+            _remember(snapshot)
+
+    return snapshot
+
+
+def _remember(snapshot: ModelSnapshot):
+    """Add a non-served snapshot to the LRU and enforce the budget."""
+
+    with _cached_lock:
+        _cached[snapshot.version] = snapshot
+        _cached.move_to_end(snapshot.version)
+        _evict()
+
+
+def _evict():
+    """
+    Drop least recently used versions above MODEL_CACHE_MAX_MB.
+    Served + rollback snapshots count but are never evicted.
+    Caller holds _cached_lock.
+    """
+
+    budget = MODEL_CACHE_MAX_MB * 1e6
+    pinned = [s for s in (_current, _previous) if s is not None]
+
+    for snapshot in pinned:
+        _cached.pop(snapshot.version, None)
+
+    used = sum(s.nbytes for s in pinned) + sum(s.nbytes for s in _cached.values())
+
+    while _cached and used > budget:
+        version, snapshot = _cached.popitem(last=False)
+        used -= snapshot.nbytes
+        print(f"🧹 Evicted model version {version} from memory (budget {MODEL_CACHE_MAX_MB:.0f} MB)")
+
+
 def get_model():
     """
-    Returns cached ML model instance.
+    Returns the served ML model instance.
 
     Features:
-    - Singleton pattern
-    - Thread-safe loading
-    - Used across API routes & services
+    - Single registry (model_loader delegates here)
+    - Thread-safe lazy loading
+    - Hot-swappable without restarts
+    """
+
+    return get_snapshot().model
+
+
+def get_model_version() -> str:
+    """
+    Returns the content-hash version of the served model.
+    Derived caches scope their keys with it.
+    """
+
+    return get_snapshot().version
+
+
+def get_compiled_model(model=None):
+    """
+    Flat-array CompiledForest for a served model.
+
+    Returns None when disabled or when the model type cannot
+    be compiled — callers then fall back to sklearn.
+    """
+
+    if not USE_COMPILED_FOREST:
+        return None
+
+    global _unregistered_compiled
+
+    with _cached_lock:
+        cached = list(_cached.values())
+
+    for snapshot in [get_snapshot(), _previous, *cached]:
+        if snapshot is not None and (model is None or snapshot.model is model):
+            return snapshot.compiled
+
+    # Model no longer (or never) served by the registry
+    source, compiled = _unregistered_compiled
+    if source is model:
+        return compiled
+
+    with _unregistered_lock:
+        source, compiled = _unregistered_compiled
+
+        if source is not model:
+            try:
+                compiled = compile_forest(model)
+            except ValueError:
+                compiled = None
+            _unregistered_compiled = (model, compiled)
+
+    return compiled
+
+
+def observe_latency(version: str, endpoint: str, seconds: float):
+    """Record one scoring request (endpoint) against a model version."""
+
+    MODEL_LATENCY.labels(version, endpoint).observe(seconds)
+
+
+def _snapshot_ms(histogram) -> dict:
+    """Histogram snapshot in milliseconds (the unit /model reports)."""
+
+    snapshot = histogram.snapshot()
+    snapshot["sum"] *= 1000
+    snapshot["mean"] *= 1000
+    snapshot["unit"] = "ms"
+    snapshot["buckets"] = [
+        {"le": b["le"] if b["le"] == "+Inf" else round(b["le"] * 1000, 6), "count": b["count"]}
+        for b in snapshot["buckets"]
+    ]
+    return snapshot
+
+
+def model_info() -> dict:
+    """Served, rollback and cached versions, the manifest's listing and latencies."""
+
+    snapshot = get_snapshot()
+    manifest = read_manifest(MODEL_DIR)
+
+    with _cached_lock:
+        cached = [s.info() for s in _cached.values()]
+
+    latency = {}
+    for (version, endpoint), histogram in MODEL_LATENCY.children():
+        latency.setdefault(version, {})[endpoint] = _snapshot_ms(histogram)
+
+    return {
+        "current": snapshot.info(),
+        "previous": _previous.info() if _previous is not None else None,
+        "cached": cached,
+        "memory_budget_mb": MODEL_CACHE_MAX_MB,
+        "manifest": {
+            "current": manifest.get("current"),
+            "versions": [
+                {"version": v["version"], "model": v.get("metrics", {}).get("model"), "estimator": v.get("estimator")}
+                for v in manifest.get("versions", [])
+            ],
+        } if manifest else None,
+        "latency": latency,
+        "watching": _watcher is not None,
+    }
+
+
+def register_reload_hook(hook):
+    """
+    Register hook(new_version) to run after every swap.
     """
 
-    global _model
+    if hook not in _reload_hooks:
+        _reload_hooks.append(hook)
+
+
+def _loaded_versions():
+    """/metrics gauge rows; never triggers a load."""
+
+    rows = [({"version": s.version, "role": role}, 1)
+            for role, s in (("current", _current), ("previous", _previous)) if s is not None]
 
-    # Fast return if already loaded
-    if _model is not None:
-        return _model
+    with _cached_lock:
+        rows += [({"version": v, "role": "cached"}, 1) for v in _cached]
 
-    # Thread-safe lazy load
-    with _model_lock:
-        if _model is None:
-            _model = _load_model_from_disk()
+    return rows
 
-    return _model
+
+register(CallbackMetric(
+    "exohabitai_model_info", "gauge", _loaded_versions,
+    "Model versions held in memory (value is always 1)",
+))
 
 
 # ======================================================
-# 🔁 OPTIONAL — FORCE RELOAD (DEV / HOT SWAP)
+# 🔁 ATOMIC SWAP / RELOAD / ROLLBACK
 # ======================================================
 
+def _swap(snapshot: ModelSnapshot):
+    """Publish snapshot (one reference assignment) and run hooks."""
+
+    global _current, _previous
+
+    displaced = _previous
+    _previous, _current = _current, snapshot
+
+    # Still loaded: keep it pinnable until the budget says otherwise
+    with _cached_lock:
+        if displaced is not None and displaced.version != snapshot.version:
+            _cached[displaced.version] = displaced
+        _evict()
+
+    for hook in list(_reload_hooks):
+        try:
+            hook(snapshot.version)
+        except Exception as e:
+            print(f"⚠️ Reload hook failed: {e}")
+
+
 def reload_model():
     """
-    Force reload model from disk.
-    Useful after retraining without restarting server.
+    Load the version on disk and swap it in.
+
+    The new model is loaded while requests keep using the
+    current snapshot; only the final reference swap is
+    serialized. Same version on disk → no swap.
     """
 
-    global _model
+    global _watched_signature
+
+    get_snapshot()
 
-    with _model_lock:
+    with _swap_lock:
         print("♻️ Reloading model from registry...")
-        _model = _load_model_from_disk()
+        _watched_signature = _disk_signature()
+        path, entry = _resolve_artifact()
+
+        if entry is not None and entry["version"] == _current.version:
+            print(f"ℹ️ Model version {entry['version']} already served")
+            return _current.model
+
+        with _cached_lock:
+            snapshot = _cached.get(entry["version"]) if entry is not None else None
+
+        if snapshot is None:
+            snapshot = _load_snapshot()
+
+        if snapshot.version == _current.version:
+            print(f"ℹ️ Model version {snapshot.version} already served")
+            return _current.model
+
+        _swap(snapshot)
+        print(f"🔁 Serving model version {snapshot.version}")
+
+    return snapshot.model
+
+
+def rollback_model() -> str:
+    """
+    Instantly swap back to the previous in-memory snapshot.
+
+    With a manifest, its current version is pointed back too,
+    so other workers (watchers) and restarts follow.
+    Returns the version now served.
+    """
+
+    global _watched_signature
+
+    with _swap_lock:
+        if _previous is None:
+            raise RuntimeError("No previous model version to roll back to")
+
+        target = _previous
+
+        if target.entry:
+            set_current_version(MODEL_DIR, target.version)
+            _watched_signature = _disk_signature()
+
+        _swap(target)
+        print(f"⏪ Rolled back to model version {target.version}")
+
+    return target.version
+
+
+# ======================================================
+# 👀 ARTIFACT WATCHER
+# ======================================================
+
+def check_for_update() -> bool:
+    """
+    Reload when the manifest / artifact changed on disk.
+    mtime+size is checked first; the content hash decides.
+    """
+
+    if _current is None or _disk_signature() == _watched_signature:
+        return False
+
+    before = _current.version
+    reload_model()
+    return _current.version != before
+
+
+def _watch_loop():
+    while True:
+        time.sleep(MODEL_WATCH_INTERVAL_SECONDS)
+        try:
+            check_for_update()
+        except Exception as e:
+            # Keep serving the current snapshot (e.g. half-copied file)
+            print(f"⚠️ Model watcher: {e}")
+
+
+def start_model_watcher():
+    """Start the artifact watcher thread (once per process)."""
+
+    global _watcher
+
+    if not MODEL_WATCH_ENABLED or multiprocessing.parent_process() is not None:
+        return None
+
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = threading.Thread(target=_watch_loop, name="model-watcher", daemon=True)
+            _watcher.start()
 
-    return _model
\ No newline at end of file
+    return _watcher
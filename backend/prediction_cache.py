@@ -0,0 +1,317 @@
+# ======================================================
+# 🚀 ExoHabitAI — Two-Tier Prediction Cache
+# Tier 1: bounded in-process LRU with TTL
+# Tier 2: SQLite file shared by all WSGI workers
+# ======================================================
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+
+from backend.config import (
+    PREDICTION_CACHE_ENABLED,
+    PREDICTION_CACHE_MAX_ENTRIES,
+    PREDICTION_CACHE_TTL_SECONDS,
+    PREDICTION_CACHE_DB_PATH,
+    PREDICTION_CACHE_DISK_MAX_ENTRIES,
+    PREDICTION_CACHE_DISK_TTL_SECONDS,
+    PREDICTION_CACHE_QUANTIZE,
+    PREDICTION_CACHE_QUANTIZATION,
+)
+from backend.metrics import CallbackMetric, register
+from backend.model_registry import register_reload_hook
+
+
+# ======================================================
+# 🧠 GLOBAL CACHE STATE
+# ======================================================
+
+_memory = OrderedDict()          # key -> (expires_at, payload_json)
+_memory_lock = threading.Lock()  # also guards _stats
+
+_local = threading.local()       # per-thread SQLite connection
+_disk_writes = 0
+
+# Disk tier prune cadence (writes between cleanups)
+_PRUNE_EVERY = 1000
+
+_stats = {
+    "memory_hits": 0,
+    "disk_hits": 0,
+    "misses": 0,
+    "evictions": 0,
+    "expirations": 0,
+    "bypassed": 0,
+    "disk_errors": 0,
+    "invalidations": 0,
+}
+
+
+# ======================================================
+# 🔑 CANONICAL KEYS
+# ======================================================
+
+def _count(event: str):
+    with _memory_lock:
+        _stats[event] += 1
+
+
+def canonicalize(data: dict):
+    """
+    Canonical form of a validated payload, used only for its key.
+
+    - configured inputs are rounded to their decimal places when
+      EXOHABITAI_CACHE_QUANTIZE=1 (nearby payloads share a result)
+    - other JSON scalars are kept as-is
+    - nested values → None (payload is not cacheable)
+    """
+
+    canonical = {}
+    quantization = PREDICTION_CACHE_QUANTIZATION if PREDICTION_CACHE_QUANTIZE else {}
+
+    for key, value in data.items():
+
+        decimals = quantization.get(key)
+
+        if decimals is not None and value is not None:
+            canonical[key] = round(float(value), decimals)
+        elif value is None or isinstance(value, (str, int, float, bool)):
+            canonical[key] = value
+        else:
+            return None
+
+    return canonical
+
+
+def make_key(canonical: dict, model_version: str) -> str:
+    """Stable key scoped to the loaded model version."""
+
+    body = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{model_version}|{body}".encode("utf-8")).hexdigest()
+
+
+# ======================================================
+# ⚡ TIER 1 — IN-PROCESS LRU
+# ======================================================
+
+def _memory_get(key: str, now: float):
+
+    with _memory_lock:
+        entry = _memory.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+
+        if expires_at < now:
+            del _memory[key]
+            _stats["expirations"] += 1
+            return None
+
+        _memory.move_to_end(key)
+        return payload
+
+
+def _memory_put(key: str, payload: str, now: float):
+
+    with _memory_lock:
+        _memory[key] = (now + PREDICTION_CACHE_TTL_SECONDS, payload)
+        _memory.move_to_end(key)
+
+        while len(_memory) > PREDICTION_CACHE_MAX_ENTRIES:
+            _memory.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+# ======================================================
+# 💾 TIER 2 — SHARED SQLITE FILE
+# ======================================================
+
+def _connection():
+    """
+    One SQLite connection per thread.
+    WAL mode lets every worker read while one writes.
+    """
+
+    conn = getattr(_local, "conn", None)
+
+    if conn is None:
+        os.makedirs(os.path.dirname(PREDICTION_CACHE_DB_PATH), exist_ok=True)
+
+        conn = sqlite3.connect(PREDICTION_CACHE_DB_PATH, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS predictions ("
+            " key TEXT PRIMARY KEY,"
+            " model_version TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " payload TEXT NOT NULL)"
+        )
+        conn.commit()
+        _local.conn = conn
+
+    return conn
+
+
+def _disk_get(key: str, now: float):
+
+    try:
+        row = _connection().execute(
+            "SELECT payload FROM predictions WHERE key = ? AND expires_at >= ?",
+            (key, now),
+        ).fetchone()
+        return row[0] if row else None
+
+    except sqlite3.Error as e:
+        _count("disk_errors")
+        print(f"⚠️ Prediction cache read failed: {e}")
+        return None
+
+
+def _disk_put(key: str, model_version: str, payload: str, now: float):
+
+    global _disk_writes
+
+    try:
+        conn = _connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?)",
+            (key, model_version, now + PREDICTION_CACHE_DISK_TTL_SECONDS, payload),
+        )
+
+        _disk_writes += 1
+        if _disk_writes % _PRUNE_EVERY == 0:
+            _prune_disk(conn, now)
+
+        conn.commit()
+
+    except sqlite3.Error as e:
+        _count("disk_errors")
+        print(f"⚠️ Prediction cache write failed: {e}")
+
+
+def _prune_disk(conn, now: float):
+    """Drop expired rows, then the oldest rows above the size cap."""
+
+    conn.execute("DELETE FROM predictions WHERE expires_at < ?", (now,))
+    conn.execute(
+        "DELETE FROM predictions WHERE key IN ("
+        " SELECT key FROM predictions ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+        (PREDICTION_CACHE_DISK_MAX_ENTRIES,),
+    )
+
+
+# ======================================================
+# ⭐ PUBLIC API
+# ======================================================
+
+def get_or_compute(data: dict, compute, model_version: str):
+    """
+    Cached prediction for a validated payload.
+
+    compute(payload) scores the original payload and is only
+    called on a miss in both tiers. model_version must be the
+    version of the model compute() scores with (resolve the
+    snapshot once and use it for both).
+    """
+
+    if not PREDICTION_CACHE_ENABLED:
+        return compute(data)
+
+    canonical = canonicalize(data)
+
+    if canonical is None:
+        _count("bypassed")
+        return compute(data)
+
+    key = make_key(canonical, model_version)
+    now = time.time()
+
+    payload = _memory_get(key, now)
+    if payload is not None:
+        _count("memory_hits")
+        return json.loads(payload)
+
+    payload = _disk_get(key, now)
+    if payload is not None:
+        _count("disk_hits")
+        _memory_put(key, payload, now)
+        return json.loads(payload)
+
+    _count("misses")
+
+    result = compute(data)
+    payload = json.dumps(result)
+
+    _memory_put(key, payload, now)
+    _disk_put(key, model_version, payload, now)
+
+    return result
+
+
+def invalidate(model_version: str = None):
+    """
+    Drop cached predictions.
+
+    Called automatically after every model swap with the new
+    version: only the memory tier is cleared. Keys carry the
+    model version, so disk rows of other versions (rollback,
+    pinned requests) stay valid and age out by TTL / size cap.
+    Without a version every row is removed.
+    """
+
+    with _memory_lock:
+        _memory.clear()
+        _stats["invalidations"] += 1
+
+    if model_version is not None:
+        return
+
+    try:
+        conn = _connection()
+        conn.execute("DELETE FROM predictions")
+        conn.commit()
+
+    except sqlite3.Error as e:
+        _count("disk_errors")
+        print(f"⚠️ Prediction cache invalidation failed: {e}")
+
+
+def get_cache_stats() -> dict:
+    """Hit / miss / eviction counters for monitoring."""
+
+    with _memory_lock:
+        memory_entries = len(_memory)
+        stats = dict(_stats)
+
+    lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+    hits = stats["memory_hits"] + stats["disk_hits"]
+
+    return {
+        "enabled": PREDICTION_CACHE_ENABLED,
+        "quantized": PREDICTION_CACHE_QUANTIZE,
+        **stats,
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        "memory_entries": memory_entries,
+        "memory_capacity": PREDICTION_CACHE_MAX_ENTRIES,
+    }
+
+
+register_reload_hook(invalidate)
+
+register(CallbackMetric(
+    "exohabitai_prediction_cache_events_total", "counter",
+    lambda: [({"event": event}, count) for event, count in list(_stats.items())],
+    "Prediction cache hits / misses / evictions / errors",
+))
+register(CallbackMetric(
+    "exohabitai_prediction_cache_entries", "gauge",
+    lambda: [({"tier": "memory"}, len(_memory))],
+    "Entries in the in-process cache tier",
+))
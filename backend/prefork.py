@@ -0,0 +1,116 @@
+# ======================================================
+# 🚀 ExoHabitAI — Pre-Fork Serving Helpers
+# Load once in the WSGI master, share copy-on-write
+# with every forked worker (deployment/gunicorn.conf.py)
+#
+# - preload(): model, compiled forest, warm-up inferences
+#   and ranked catalog are built in the master, then the
+#   heap is gc.freeze()-d so collections in the workers
+#   never write to (and un-share) those pages
+# - after_fork(): per-worker background threads
+# - process_memory(): RSS / PSS of the current process
+#
+# Model / warm-up modules are imported inside the hooks so
+# process_memory() stays importable from a bare process.
+# ======================================================
+
+import gc
+import os
+import time
+
+from backend.config import MODEL_WATCH_ENABLED
+
+
+# /proc/self/smaps_rollup fields reported (kB → MB)
+_SMAPS_FIELDS = {
+    "Rss": "rss_mb",
+    "Pss": "pss_mb",
+    "Shared_Clean": "shared_clean_mb",
+    "Shared_Dirty": "shared_dirty_mb",
+    "Private_Clean": "private_clean_mb",
+    "Private_Dirty": "private_dirty_mb",
+}
+
+
+# ======================================================
+# 📏 MEMORY REPORT
+# ======================================================
+
+def process_memory(pid="self") -> dict:
+    """
+    RSS / PSS breakdown of a process (Linux).
+
+    PSS charges every shared page 1/N to each of the N
+    processes mapping it: summing PSS over all workers
+    gives the real footprint, summing RSS double-counts.
+    """
+
+    report = {"pid": os.getpid() if pid == "self" else int(pid)}
+
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if key in _SMAPS_FIELDS:
+                    report[_SMAPS_FIELDS[key]] = round(int(rest.split()[0]) / 1024, 1)
+
+    except OSError:
+        # Older kernels / non-Linux: RSS only
+        try:
+            import resource
+            report["max_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+        except ImportError:
+            pass
+
+    return report
+
+
+# ======================================================
+# 🍴 MASTER / WORKER HOOKS
+# ======================================================
+
+def preload():
+    """
+    Build everything workers share, in the master, before fork.
+
+    Returns the readiness report. Must run before any
+    background thread starts (fork only copies the caller).
+    """
+
+    from backend.warmup import readiness, run_warmup
+
+    start = time.perf_counter()
+
+    run_warmup()
+
+    # Move every surviving object out of the collector's view:
+    # later collections in the workers skip them instead of
+    # touching their headers (which would copy the pages)
+    gc.collect()
+    gc.freeze()
+
+    ready, report = readiness()
+    memory = process_memory()
+
+    print(
+        f"🍴 Preloaded for fork in {time.perf_counter() - start:.2f}s "
+        f"(ready={ready}, {gc.get_freeze_count():,} objects frozen, "
+        f"RSS {memory.get('rss_mb')} MB)"
+    )
+
+    return report
+
+
+def after_fork():
+    """
+    Start this worker's background threads.
+
+    Scoring jobs are not started here: run one
+    `python -m backend.services.job_queue` process next to
+    the workers instead of one process pool per worker.
+    """
+
+    from backend.model_registry import start_model_watcher
+
+    if MODEL_WATCH_ENABLED:
+        start_model_watcher()
@@ -30,6 +30,32 @@ def docs():
                 "response_example": "ExoHabitAI API Running"
             },
 
+            # ===========================
+            # READINESS
+            # ===========================
+            {
+                "name": "Readiness Probe",
+                "path": "/ready",
+                "method": "GET",
+                "description": "503 until the startup warm-up (model load, compiled forest, synthetic inferences, ranked dataset) has finished, then 200. Reports per-component status and load times."
+            },
+
+            # ===========================
+            # WORKER MEMORY
+            # ===========================
+            {
+                "name": "Worker Memory",
+                "path": "/memory",
+                "method": "GET",
+                "description": "RSS / PSS breakdown (MB) of the worker process that answered. Under deployment/gunicorn.conf.py the model and catalog are shared copy-on-write; sum pss_mb over workers for the real footprint."
+            },
+            {
+                "name": "Prometheus Metrics",
+                "path": "/metrics",
+                "method": "GET",
+                "description": "Prometheus text exposition (per worker): request latency histograms per route, per-stage scoring histograms (clean_data, feature_engineering, alignment, predict_proba, fusion), scoring latency per model version and endpoint, request / 5xx / cache / model-load counters, ranked-dataset rows and loaded model versions. Disable with EXOHABITAI_METRICS=0."
+            },
+
             # ===========================
             # PREDICT
             # ===========================
@@ -38,6 +64,10 @@ def docs():
                 "path": "/predict",
                 "method": "POST",
                 "description": "Predict habitability using planetary + stellar parameters.",
+                "query_params": {
+                    "mode": "approximate — answer from the precomputed surrogate grid (all six inputs required; reports the measured interpolation error)",
+                    "model_version": "score with another published model version (also X-Model-Version header; see GET /model). Works on /predict/batch and /predict/stream too."
+                },
                 "body_schema": {
                     "pl_rade": "Planet radius (Earth = 1)",
                     "pl_eqt": "Equilibrium temperature (Kelvin)",
@@ -56,10 +86,120 @@ def docs():
                 },
                 "example_response": {
                     "prediction": 1,
-                    "habitability_score": 0.83
+                    "habitability_score": 0.83,
+                    "model_version": "5d3ed15662a8"
+                }
+            },
+
+            # ===========================
+            # BATCH PREDICT
+            # ===========================
+            {
+                "name": "Batch Habitability Prediction",
+                "path": "/predict/batch",
+                "method": "POST",
+                "description": "Score an array of planets in one vectorized pass. Each row is validated independently; results keep input order.",
+                "example_request": [
+                    {"pl_rade": 1.2, "pl_eqt": 290, "pl_orbper": 365},
+                    {"pl_rade": 2.1, "pl_eqt": 410, "st_teff": 5200}
+                ],
+                "example_response": {
+                    "metadata": {"total_rows": 2, "scored_rows": 2, "invalid_rows": 0},
+                    "results": [
+                        {"index": 0, "status": "success", "prediction": 1, "habitability_score": 0.71}
+                    ]
                 }
             },
 
+            # ===========================
+            # STREAMING PREDICT
+            # ===========================
+            {
+                "name": "Streaming Habitability Prediction",
+                "path": "/predict/stream",
+                "method": "POST",
+                "description": "Upload a CSV (NASA Archive export) or NDJSON body, optionally chunked. Rows are scored in fixed-size chunks and streamed back as NDJSON, ending with a summary line.",
+                "query_params": {
+                    "format": "csv | ndjson (default: Content-Type, then auto-detect)"
+                },
+                "example_response": [
+                    {"index": 0, "status": "success", "prediction": 1, "habitability_score": 0.71},
+                    {"status": "complete", "metadata": {"total_rows": 1, "scored_rows": 1, "invalid_rows": 0}}
+                ]
+            },
+
+            # ===========================
+            # SCORING JOBS
+            # ===========================
+            {
+                "name": "Submit Scoring Job",
+                "path": "/jobs",
+                "method": "POST",
+                "description": "Queue a long-running scoring job (server-side file path, planets array or CSV/NDJSON upload). The job is pinned to one model version: ?model_version= / X-Model-Version / \"model_version\" in the JSON body, default the version served at submission (404 for unknown versions). Returns 202 with a job id.",
+                "example_request": {"path": "data/processed/ranked_exoplanets.csv"}
+            },
+            {
+                "name": "Scoring Job Status",
+                "path": "/jobs/<job_id>",
+                "method": "GET",
+                "description": "Job status, pinned model_version and progress: rows done, throughput (rows/s) and ETA. GET /jobs lists recent jobs."
+            },
+            {
+                "name": "Scoring Job Result",
+                "path": "/jobs/<job_id>/result",
+                "method": "GET",
+                "description": "Download the NDJSON results file of a completed job; scored lines carry model_version (409 while it is still running)."
+            },
+
+            # ===========================
+            # MODEL REGISTRY
+            # ===========================
+            {
+                "name": "Served Model",
+                "path": "/model",
+                "method": "GET",
+                "description": "Served model version (content hash), metrics and features, the in-memory rollback version, other versions cached for pinning (LRU under the memory budget), per-version latency histograms and the versions published in models/manifest.json."
+            },
+            {
+                "name": "Reload Model",
+                "path": "/model/reload",
+                "method": "POST",
+                "description": "Load the manifest's current version and swap it in atomically; in-flight requests finish on the old version. Newly published versions are also picked up automatically by the file watcher. Admin only: send X-Admin-Token (EXOHABITAI_ADMIN_TOKEN); without a configured token only localhost may call it (403 otherwise)."
+            },
+            {
+                "name": "Rollback Model",
+                "path": "/model/rollback",
+                "method": "POST",
+                "description": "Instantly swap back to the previously served version (409 if there is none). Admin only, like /model/reload."
+            },
+            {
+                "name": "Shadow Scoring",
+                "path": "/model/shadow",
+                "method": "GET | POST",
+                "description": "Candidate versions score the same validated /predict inputs in the background after the response is computed. GET: agreement rate, score deltas and shadow latency per version, plus queued / dropped counts (a full queue drops work instead of slowing /predict). POST {\"versions\": [...]} sets the shadow versions ([] disables) for every worker (stored in models/shadow.json, picked up within the model watch interval) and resets the aggregates; POST is admin only, like /model/reload. Aggregates are per worker.",
+                "example_request": {"versions": ["5d204159720c"]}
+            },
+
+            # ===========================
+            # PREDICTION CACHE
+            # ===========================
+            {
+                "name": "Prediction Cache Stats",
+                "path": "/predict/cache",
+                "method": "GET",
+                "description": "Hit / miss / eviction counters of the two-tier /predict cache (in-process LRU + shared SQLite)."
+            },
+
+            # ===========================
+            # MICRO-BATCHING
+            # ===========================
+            {
+                "name": "Coalescer Histograms",
+                "path": "/predict/coalescer",
+                "method": "GET",
+                "description": "Batch-size and queue-wait histograms of the optional /predict micro-batcher (EXOHABITAI_COALESCER=1)."
+            },
+
             # ===========================
             # RANKING
             # ===========================
@@ -67,7 +207,15 @@ def docs():
                 "name": "Ranked Exoplanets",
                 "path": "/rank",
                 "method": "GET",
-                "description": "Returns ranked exoplanets dataset with AI scores."
+                "description": "Returns ranked exoplanets dataset with AI scores. Conditional GET: ETag (dataset version + query) and Last-Modified; If-None-Match / If-Modified-Since → 304. Bodies above 1 KB are sent gzip / brotli encoded (Accept-Encoding), compressed once per dataset version.",
+                "query_params": {
+                    "limit": "page size (default 20, max 200)",
+                    "sort": "column to sort by: any numeric catalog column, returned or not, or a returned text column such as pl_name (alphabetical); default habitability_score; 400 for anything else",
+                    "order": "desc | asc",
+                    "filter": "AND-ed clauses over any numeric catalog column: habitability_score>=0.7, pl_eqt=200..320 (inclusive range), st_teff<6000, prediction=1, st_mass!=1. Comma separated or repeated; metadata.matched_rows counts the matches",
+                    "format": "records (default: data as [{column: value}]) | columnar (data as {column: [values]}, ~2.5x smaller); NaN / inf are null",
+                    "cursor": "metadata.next_cursor of the previous page: walks the whole catalog in the same order (stable under ties, O(page size) per page); 409 if the dataset was reloaded between pages"
+                }
             },
 
             # ===========================
@@ -77,11 +225,16 @@ def docs():
                 "name": "Dataset Statistics",
                 "path": "/stats",
                 "method": "GET",
-                "description": "Returns dataset analytics used by dashboard.",
+                "description": "Returns dataset analytics used by dashboard. Aggregated once per catalog version (dataset_version); rows appended to the ranked file only add their own contribution. Same ETag / 304 / compression behaviour as /rank.",
                 "response_fields": [
                     "total_planets",
                     "habitable_count",
-                    "avg_score"
+                    "avg_score",
+                    "min_score",
+                    "max_score",
+                    "distribution",
+                    "feature_means",
+                    "dataset_version"
                 ]
             },
 
@@ -92,7 +245,7 @@ def docs():
                 "name": "Model Feature Importance",
                 "path": "/importance",
                 "method": "GET",
-                "description": "Returns ML feature importance values from RandomForest model."
+                "description": "Returns ML feature importance values from RandomForest model. ETag follows the served model version (304 on If-None-Match)."
             },
 
             # ===========================
@@ -1,10 +1,12 @@
 from flask import Blueprint, jsonify
+from backend.http_cache import conditional, model_version
 from backend.model_registry import get_model
 
 importance_bp = Blueprint("importance", __name__)
 
 
 @importance_bp.route("/importance", methods=["GET"])
+@conditional(model_version)
 def importance():
     """
     🚀 Returns model feature importance in production-ready format.
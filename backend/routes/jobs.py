@@ -0,0 +1,171 @@
+import os
+
+from flask import Blueprint, request, jsonify, send_file
+
+from backend.config import BASE_DIR, JOB_RUNNER_ENABLED, PREFORK_SERVING
+from backend.services.job_queue import (
+    submit_job,
+    get_job,
+    list_jobs,
+    result_path,
+    start_job_runner,
+)
+
+jobs_bp = Blueprint("jobs", __name__)
+
+
+@jobs_bp.record_once
+def _start_runner(state):
+    """Resume interrupted jobs and pick up new ones as soon as the app starts."""
+    # Pre-fork: jobs run in a separate `python -m backend.services.job_queue`
+    if JOB_RUNNER_ENABLED and not PREFORK_SERVING:
+        start_job_runner()
+
+
+UPLOAD_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+# =====================================================
+# 🗂️ SUBMIT SCORING JOB
+# =====================================================
+
+@jobs_bp.route("/jobs", methods=["POST"])
+def create_job():
+    """
+    Asynchronous scoring job
+
+    Body (one of):
+    - {"path": "data/raw/export.csv", "format": "csv"}  server-side file
+    - {"planets": [...]} or a JSON array                 inline dataset
+    - raw CSV / NDJSON upload (Content-Type text/csv or application/x-ndjson)
+
+    ?model_version= / X-Model-Version (or "model_version" in a
+    JSON body) pins a published version; default: the version
+    served now. Every row of the job is scored with it.
+
+    Returns 202 with the job id; poll GET /jobs/<id>.
+    """
+
+    try:
+        fmt = request.args.get("format")
+        version = request.args.get("model_version") or request.headers.get("X-Model-Version") or None
+
+        if request.mimetype in UPLOAD_FORMATS:
+            job = submit_job(upload=request.stream, fmt=fmt or UPLOAD_FORMATS[request.mimetype],
+                             model_version=version)
+
+        else:
+            data = request.get_json(silent=True)
+
+            if isinstance(data, list):
+                data = {"planets": data}
+
+            if not isinstance(data, dict) or not (data.get("path") or data.get("planets")):
+                return jsonify({"error": "Expected a file path, a planets array or a CSV/NDJSON upload"}), 400
+
+            version = version or data.get("model_version")
+
+            if data.get("path"):
+                path = data["path"]
+                if not os.path.isabs(path):
+                    path = os.path.join(BASE_DIR, path)
+                job = submit_job(path=path, fmt=data.get("format") or fmt, model_version=version)
+            else:
+                job = submit_job(records=data["planets"], model_version=version)
+
+        return jsonify({
+            "status": "queued",
+            "job": job,
+            "links": {
+                "status": f"/jobs/{job['job_id']}",
+                "result": f"/jobs/{job['job_id']}/result",
+            },
+        }), 202
+
+    except ValueError as e:
+        return jsonify({
+            "status": "invalid_input",
+            "errors": [str(e)]
+        }), 400
+
+    except LookupError as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 404
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+
+# =====================================================
+# 📊 JOB STATUS / PROGRESS
+# =====================================================
+
+@jobs_bp.route("/jobs", methods=["GET"])
+def jobs_index():
+    """
+    Most recent scoring jobs (newest first)
+    """
+
+    limit = request.args.get("limit", default=50, type=int)
+
+    return jsonify({
+        "status": "success",
+        "jobs": list_jobs(max(1, min(limit, 500)))
+    })
+
+
+@jobs_bp.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    """
+    Job status + progress (rows done, throughput, ETA)
+    """
+
+    job = get_job(job_id)
+
+    if job is None:
+        return jsonify({"error": f"Unknown job {job_id}"}), 404
+
+    return jsonify({
+        "status": "success",
+        "job": job
+    })
+
+
+# =====================================================
+# 📦 JOB RESULT FILE
+# =====================================================
+
+@jobs_bp.route("/jobs/<job_id>/result", methods=["GET"])
+def job_result(job_id):
+    """
+    NDJSON results file (one line per input row, input order;
+    scored rows carry the job's model_version)
+    """
+
+    job = get_job(job_id)
+
+    if job is None:
+        return jsonify({"error": f"Unknown job {job_id}"}), 404
+
+    if job["status"] != "completed":
+        return jsonify({
+            "status": job["status"],
+            "message": "Job has not completed yet",
+            "progress": job["progress"]
+        }), 409
+
+    return send_file(
+        result_path(job_id),
+        mimetype="application/x-ndjson",
+        as_attachment=True,
+        download_name=f"exohabitai_job_{job_id}.ndjson",
+    )
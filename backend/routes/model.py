@@ -0,0 +1,205 @@
+import hmac
+from functools import wraps
+
+from flask import Blueprint, jsonify, request
+
+from backend.config import MODEL_ADMIN_TOKEN, MODEL_WATCH_ENABLED, PREFORK_SERVING
+from backend.model_registry import (
+    model_info,
+    reload_model,
+    rollback_model,
+    get_model_version,
+    start_model_watcher,
+    get_snapshot,
+)
+from backend.services.shadow_scoring import (
+    get_shadow_scorer,
+    sync_shadow_config,
+    write_shadow_config,
+)
+
+model_bp = Blueprint("model", __name__)
+
+
+@model_bp.record_once
+def _start_watcher(state):
+    """Hot-swap newly published model versions without a restart."""
+    # Pre-fork: started per worker by backend.prefork.after_fork()
+    if MODEL_WATCH_ENABLED and not PREFORK_SERVING:
+        start_model_watcher()
+
+
+# =====================================================
+# 🔐 ADMIN GUARD (state-changing model routes)
+# =====================================================
+
+_LOCALHOST = ("127.0.0.1", "::1")
+
+
+def admin_only(view):
+    """
+    X-Admin-Token must match EXOHABITAI_ADMIN_TOKEN; without a
+    configured token only localhost callers are allowed.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+
+        if MODEL_ADMIN_TOKEN is not None:
+            token = request.headers.get("X-Admin-Token", "")
+            allowed = hmac.compare_digest(token.encode("utf-8"), MODEL_ADMIN_TOKEN.encode("utf-8"))
+        else:
+            allowed = request.remote_addr in _LOCALHOST
+
+        if not allowed:
+            return jsonify({
+                "status": "forbidden",
+                "message": "Admin token required"
+            }), 403
+
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+# =====================================================
+# 🤖 SERVED MODEL VERSION
+# =====================================================
+
+@model_bp.route("/model", methods=["GET"])
+def model_status():
+    """
+    Served model version + metadata, the in-memory rollback
+    version and the versions listed in models/manifest.json.
+    """
+
+    try:
+        info = model_info()
+        info["status"] = "success"
+        return jsonify(info)
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+
+# =====================================================
+# 🔁 RELOAD / ROLLBACK
+# =====================================================
+
+@model_bp.route("/model/reload", methods=["POST"])
+@admin_only
+def model_reload():
+    """
+    Load the manifest's current version (or the legacy
+    artifact) and swap it in atomically.
+    """
+
+    try:
+        before = get_model_version()
+        reload_model()
+        version = get_model_version()
+
+        return jsonify({
+            "status": "success",
+            "version": version,
+            "swapped": version != before
+        })
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+
+@model_bp.route("/model/rollback", methods=["POST"])
+@admin_only
+def model_rollback():
+    """
+    Swap back to the previously served version (kept in memory).
+    """
+
+    try:
+        return jsonify({
+            "status": "success",
+            "version": rollback_model()
+        })
+
+    except RuntimeError as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 409
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+
+# =====================================================
+# 👥 SHADOW SCORING
+# =====================================================
+
+@model_bp.route("/model/shadow", methods=["GET"])
+def shadow_status():
+    """
+    Shadow model aggregates: agreement rate, score deltas,
+    shadow latency, queue depth and dropped requests.
+    Versions are shared by all workers; aggregates are this
+    worker's.
+    """
+
+    sync_shadow_config(force=True)
+
+    return jsonify({
+        "status": "success",
+        "shadow": get_shadow_scorer().stats()
+    })
+
+
+@model_bp.route("/model/shadow", methods=["POST"])
+@admin_only
+def shadow_configure():
+    """
+    Body: {"versions": ["<version>", ...]} — published versions
+    that shadow /predict ([] disables). Resets the aggregates.
+    Written to SHADOW_CONFIG_PATH: every worker picks it up.
+    """
+
+    try:
+        data = request.get_json(silent=True) or {}
+        versions = data.get("versions")
+
+        if not isinstance(versions, list) or not all(isinstance(v, str) for v in versions):
+            return jsonify({
+                "status": "invalid_input",
+                "errors": ["versions must be a list of model version strings"]
+            }), 400
+
+        # Load (and validate) every shadow model before switching
+        for version in versions:
+            get_snapshot(version)
+
+        write_shadow_config(versions)
+
+        return jsonify({
+            "status": "success",
+            "versions": list(get_shadow_scorer().versions)
+        })
+
+    except LookupError as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 404
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
@@ -1,6 +1,32 @@
-from flask import Blueprint, request, jsonify
+import io
+import json
+import time
 
-from backend.services.prediction_service import predict_planet
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+
+import numpy as np
+import pandas as pd
+
+from backend.config import (
+    BATCH_MAX_ROWS,
+    COALESCER_ENABLED,
+    STREAM_CHUNK_ROWS,
+    SURROGATE_GRID_ENABLED,
+    VALIDATION_RULES,
+)
+from backend.model_registry import get_snapshot, observe_latency
+from backend.prediction_cache import get_or_compute, get_cache_stats
+from backend.services.prediction_service import (
+    model_feature_columns,
+    predict_planet_fast,
+    predict_planets_batch,
+    score_records_ndjson,
+    validate_batch,
+)
+from backend.services.batch_coalescer import get_coalescer, predict_coalesced
+from backend.services.surrogate_grid import predict_approximate
+from backend.services.shadow_scoring import submit_shadow
+from src.data_loader import iter_record_chunks
 
 predict_bp = Blueprint("predict", __name__)
 
@@ -8,17 +34,7 @@ predict_bp = Blueprint("predict", __name__)
 # 🚀 SCIENTIFIC INPUT VALIDATION
 # =====================================================
 
-VALIDATION_RULES = {
-    "pl_rade": (0.1, 20),
-    "pl_eqt": (50, 2000),
-    "pl_orbper": (0, 5000),
-    "st_teff": (2000, 10000),
-    "st_mass": (0.1, 5),
-    "st_rad": (0.1, 10),
-}
-
-
-def validate_inputs(data: dict):
+def validate_inputs(data: dict, model=None):
     errors = []
 
     for key, (min_v, max_v) in VALIDATION_RULES.items():
@@ -32,9 +48,34 @@ def validate_inputs(data: dict):
             except Exception:
                 errors.append(f"{key} must be numeric")
 
+    # Other model inputs: numeric or null (same rule as validate_batch)
+    for key in model_feature_columns(model):
+        if key in VALIDATION_RULES or key not in data:
+            continue
+
+        value = pd.Series([data[key]], dtype=object)
+        if (value.notna() & pd.to_numeric(value, errors="coerce").isna()).iloc[0]:
+            errors.append(f"{key} must be numeric")
+
     return errors
 
 
+# =====================================================
+# 🏷️ MODEL VERSION PINNING
+# =====================================================
+
+def requested_model_version():
+    """?model_version= or X-Model-Version header (None = served model)."""
+    return request.args.get("model_version") or request.headers.get("X-Model-Version") or None
+
+
+def unknown_version(e: LookupError):
+    return jsonify({
+        "status": "error",
+        "message": str(e)
+    }), 404
+
+
 # =====================================================
 # 🚀 FINAL ADAPTIVE NEURAL PREDICT ROUTE
 # =====================================================
@@ -43,9 +84,19 @@ def validate_inputs(data: dict):
 def predict():
     """
     Adaptive Neural Habitability Prediction API
+
+    ?mode=approximate answers from the precomputed surrogate
+    grid (microseconds, error bound reported); falls back to
+    exact scoring when the grid cannot answer.
+
+    ?model_version= / X-Model-Version scores with another
+    published version (exact mode, no micro-batching).
     """
 
     try:
+        version = requested_model_version()
+        snapshot = get_snapshot(version)
+
         data = request.get_json()
 
         if not data:
@@ -54,31 +105,273 @@ def predict():
         # --------------------------------------------------
         # 🧪 Scientific Validation
         # --------------------------------------------------
-        errors = validate_inputs(data)
+        errors = validate_inputs(data, snapshot.model)
         if errors:
             return jsonify({
                 "status": "invalid_input",
                 "errors": errors
             }), 400
 
+        # --------------------------------------------------
+        # 🧮 APPROXIMATE MODE (SURROGATE GRID)
+        # --------------------------------------------------
+        approximate = request.args.get("mode") == "approximate"
+
+        # The grid is built from the served model only
+        if approximate and SURROGATE_GRID_ENABLED and version is None:
+            result = predict_approximate(data, snapshot.model)
+
+            if result is not None:
+                return jsonify({
+                    "status": "success",
+                    "mode": "approximate",
+                    "prediction": result["prediction"],
+                    "habitability_score": result["habitability_score"],
+                    "approximation": result["approximation"],
+                    "model": "ExoHabitAI-AdaptiveNeural",
+                    "model_version": result["approximation"]["model_version"]
+                })
+
         # --------------------------------------------------
         # 🧠 CALL AI SERVICE (REAL SCORING ENGINE)
         # --------------------------------------------------
-        result = predict_planet(data)
+        start = time.perf_counter()
+
+        # One snapshot for both the cache key and the scoring model
+        if version is None and COALESCER_ENABLED:
+            scorer = lambda payload: predict_coalesced(payload, snapshot.model)
+        else:
+            scorer = lambda payload: predict_planet_fast(payload, snapshot.model)
+
+        result = get_or_compute(data, scorer, snapshot.version)
+
+        observe_latency(snapshot.version, "predict", time.perf_counter() - start)
+
+        # Candidate models see the same input after the answer is ready
+        if version is None:
+            submit_shadow(data, result, snapshot.version)
 
         # --------------------------------------------------
         # 🚀 RESPONSE TO DASHBOARD
         # --------------------------------------------------
-        return jsonify({
+        response = {
             "status": "success",
             "prediction": result["prediction"],
             "habitability_score": result["habitability_score"],
             "insights": result.get("insights", {}),
-            "model": "ExoHabitAI-AdaptiveNeural"
+            "model": "ExoHabitAI-AdaptiveNeural",
+            "model_version": snapshot.version
+        }
+
+        if approximate:
+            response["mode"] = "exact"
+
+        return jsonify(response)
+
+    except LookupError as e:
+        return unknown_version(e)
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+
+# =====================================================
+# 📦 VECTORIZED BATCH PREDICT ROUTE
+# =====================================================
+
+@predict_bp.route("/predict/batch", methods=["POST"])
+def predict_batch():
+    """
+    Batch Habitability Prediction API
+
+    Body:
+    - JSON array of planets, or {"planets": [...]}
+
+    Every planet is validated independently; valid rows are
+    scored in ONE vectorized pass, invalid rows carry their
+    own errors. Results keep input order.
+
+    ?model_version= / X-Model-Version pins a published version.
+    """
+
+    try:
+        snapshot = get_snapshot(requested_model_version())
+
+        data = request.get_json()
+
+        if isinstance(data, dict):
+            data = data.get("planets")
+
+        if not isinstance(data, list) or len(data) == 0:
+            return jsonify({"error": "Expected a non-empty JSON array of planets"}), 400
+
+        if len(data) > BATCH_MAX_ROWS:
+            return jsonify({
+                "status": "invalid_input",
+                "errors": [f"batch too large ({len(data)} > {BATCH_MAX_ROWS} planets)"]
+            }), 400
+
+        # --------------------------------------------------
+        # 🧪 Per-row Scientific Validation (error masks)
+        # --------------------------------------------------
+        valid_mask, row_errors = validate_batch(data, snapshot.model)
+        valid_idx = np.flatnonzero(valid_mask)
+
+        # --------------------------------------------------
+        # 🧠 ONE VECTORIZED SCORING PASS
+        # --------------------------------------------------
+        start = time.perf_counter()
+
+        scored = predict_planets_batch([data[i] for i in valid_idx], snapshot.model)
+        scored_by_row = dict(zip(valid_idx.tolist(), scored))
+
+        observe_latency(snapshot.version, "predict_batch", time.perf_counter() - start)
+
+        # --------------------------------------------------
+        # 🚀 RESPONSE (INPUT ORDER)
+        # --------------------------------------------------
+        results = []
+
+        for idx in range(len(data)):
+            if idx in scored_by_row:
+                results.append({"index": idx, "status": "success", **scored_by_row[idx]})
+            else:
+                results.append({
+                    "index": idx,
+                    "status": "invalid_input",
+                    "errors": row_errors.get(idx, []),
+                })
+
+        return jsonify({
+            "status": "success",
+            "metadata": {
+                "total_rows": len(data),
+                "scored_rows": len(scored),
+                "invalid_rows": len(data) - len(scored),
+            },
+            "results": results,
+            "model": "ExoHabitAI-AdaptiveNeural",
+            "model_version": snapshot.version
         })
 
+    except LookupError as e:
+        return unknown_version(e)
+
     except Exception as e:
         return jsonify({
             "status": "error",
             "message": str(e)
-        }), 500
\ No newline at end of file
+        }), 500
+
+
+# =====================================================
+# 🌊 STREAMING CSV / NDJSON SCORING
+# =====================================================
+
+STREAM_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@predict_bp.route("/predict/stream", methods=["POST"])
+def predict_stream():
+    """
+    Streaming Habitability Prediction API
+
+    Body (chunked upload welcome):
+    - CSV (NASA Exoplanet Archive export, # metadata allowed)
+    - NDJSON (one planet object per line)
+
+    Format comes from ?format=csv|ndjson, the Content-Type,
+    or is sniffed from the first data line.
+
+    Rows are parsed and scored STREAM_CHUNK_ROWS at a time and
+    every chunk is written back as NDJSON before the next one
+    is read, so memory stays flat and a slow reader throttles
+    the upload (backpressure). The last line is a summary.
+
+    ?model_version= / X-Model-Version pins a published version
+    for the whole stream.
+    """
+
+    fmt = request.args.get("format") or STREAM_FORMATS.get(request.mimetype)
+
+    if fmt not in (None, "csv", "ndjson"):
+        return jsonify({"error": "format must be csv or ndjson"}), 400
+
+    try:
+        snapshot = get_snapshot(requested_model_version())
+    except LookupError as e:
+        return unknown_version(e)
+
+    text = io.TextIOWrapper(request.stream, encoding="utf-8", errors="ignore")
+
+    def generate():
+        total = scored = 0
+
+        try:
+            for chunk in iter_record_chunks(text, STREAM_CHUNK_ROWS, fmt):
+                body, n_scored = score_records_ndjson(chunk, total, snapshot.model)
+                total += len(chunk)
+                scored += n_scored
+                yield body
+
+        except Exception as e:
+            yield json.dumps({"status": "error", "message": str(e), "index": total}) + "\n"
+            return
+
+        yield json.dumps({
+            "status": "complete",
+            "metadata": {
+                "total_rows": total,
+                "scored_rows": scored,
+                "invalid_rows": total - scored,
+            },
+            "model": "ExoHabitAI-AdaptiveNeural",
+            "model_version": snapshot.version
+        }) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+# =====================================================
+# ⚡ PREDICTION CACHE STATS
+# =====================================================
+
+@predict_bp.route("/predict/cache", methods=["GET"])
+def predict_cache_stats():
+    """
+    Prediction cache counters (hits per tier, misses, evictions)
+    """
+
+    return jsonify({
+        "status": "success",
+        "cache": get_cache_stats()
+    })
+
+
+# =====================================================
+# 🧵 MICRO-BATCHING STATS
+# =====================================================
+
+@predict_bp.route("/predict/coalescer", methods=["GET"])
+def predict_coalescer_stats():
+    """
+    Batch-size and queue-wait histograms of the request coalescer
+    """
+
+    if not COALESCER_ENABLED:
+        return jsonify({
+            "status": "disabled",
+            "message": "Set EXOHABITAI_COALESCER=1 to enable micro-batching"
+        })
+
+    return jsonify({
+        "status": "success",
+        "coalescer": get_coalescer().stats()
+    })
@@ -3,32 +3,97 @@ from flask import Blueprint, jsonify, request
 import pandas as pd
 import numpy as np
 import os
+import json
+import base64
 
 from backend.config import RANKED_DATA_PATH
+from backend.http_cache import catalog_version, conditional
+from backend.json_provider import ColumnarSlice
+from backend.services.catalog import get_ranked_catalog
+from backend.services.catalog_query import FilterError, filter_text, page, parse_filters, select
 
 rank_bp = Blueprint("rank", __name__)
 
+# Columns returned by /rank (the dashboard table)
+FRONTEND_COLUMNS = [
+    "pl_name",
+    "habitability_score",
+    "prediction"
+]
+
+def catalog_metadata(df: pd.DataFrame) -> dict:
+    """Whole-catalog figures: computed once per catalog snapshot."""
+
+    metadata = {}
+
+    if "habitability_score" in df.columns:
+        clean_scores = df["habitability_score"].replace([np.inf, -np.inf], np.nan)
+        metadata["avg_score"] = float(clean_scores.mean())
+
+    if "prediction" in df.columns:
+        metadata["habitable_count"] = int((df["prediction"] == 1).sum())
+
+    return metadata
+
+
 # =====================================================
-# 🚀 JSON SAFE SANITIZER (REAL FIX)
+# 🔖 OPAQUE PAGE CURSORS
+# base64url JSON: dataset version, sort, order, filter,
+# and the last returned (position, row id, sort value)
 # =====================================================
 
-def sanitize_dataframe_for_json(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Convert invalid numeric values into JSON-safe format.
+def encode_cursor(version: str, sort_col, descending: bool, position: int, row: int, value,
+                  filters: str = "") -> str:
+    payload = {
+        "f": filters,
+        "v": version,
+        "s": sort_col,
+        "d": int(descending),
+        "p": int(position),
+        "r": int(row),
+        "k": value.item() if isinstance(value, np.generic) else value,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
 
-    Fixes:
-    - NaN
-    - Infinity
-    - -Infinity
-    """
 
-    # Replace infinities → NaN
-    df = df.replace([np.inf, -np.inf], np.nan)
+def decode_cursor(text: str) -> dict:
+    """Raises ValueError for anything that is not a cursor we issued."""
+
+    try:
+        raw = base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+        cursor = json.loads(raw.decode("utf-8"))
+    except Exception:
+        raise ValueError("invalid cursor")
+
+    if not isinstance(cursor, dict) or set(cursor) - {"f"} != {"v", "s", "d", "p", "r", "k"}:
+        raise ValueError("invalid cursor")
+
+    if not all(isinstance(cursor[key], int) for key in ("d", "p", "r")) or \
+            not isinstance(cursor.get("f", ""), str):
+        raise ValueError("invalid cursor")
+
+    return cursor
+
+
+def _same_value(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and a != a and b != b:
+        return True                     # NaN
+    return a == b
+
 
-    # Convert NaN → None (valid JSON)
-    df = df.where(pd.notnull(df), None)
+def _sortable(snapshot, column) -> bool:
+    """Numeric catalog column (returned or not), or any returned column."""
+    return (
+        isinstance(column, str)
+        and column in snapshot.columns
+        and (snapshot.columns[column].dtype.kind in "biuf" or column in FRONTEND_COLUMNS)
+    )
 
-    return df
+
+def _plain(value):
+    """NumPy scalar → Python (object columns already hold Python values)."""
+    return value.item() if isinstance(value, np.generic) else value
 
 
 # =====================================================
@@ -36,15 +101,22 @@ def sanitize_dataframe_for_json(df: pd.DataFrame) -> pd.DataFrame:
 # =====================================================
 
 @rank_bp.route("/rank", methods=["GET"])
+@conditional(catalog_version)
 def rank():
 
     """
     🌍 Returns ranked exoplanets dataset.
 
     Supports:
-    - limit
-    - sort
+    - limit   (page size, max 200)
+    - sort    (any numeric catalog column, or a returned column
+               such as pl_name; 400 otherwise)
     - order
+    - filter  (e.g. habitability_score>=0.7,pl_eqt=200..320; any
+               numeric catalog column; repeat to AND more clauses)
+    - cursor  (metadata.next_cursor of the previous page; carries
+               sort + order + filter; 409 once the dataset has changed)
+    - format  (records | columnar: data as {column: [values]})
     """
 
     try:
@@ -60,18 +132,11 @@ def rank():
 
         # --------------------------------------------------
         # 🚀 PERFORMANCE BOOST (NO BREAKING CHANGE)
-        # Load only columns needed by dashboard
+        # Cached dataset, only columns needed by dashboard
         # --------------------------------------------------
-        FRONTEND_COLUMNS = [
-            "pl_name",
-            "habitability_score",
-            "prediction"
-        ]
-
-        df = pd.read_csv(
-            RANKED_DATA_PATH,
-            usecols=lambda c: c in FRONTEND_COLUMNS
-        )
+        snapshot = get_ranked_catalog().get()
+        ranked = snapshot.frame
+        columns = [c for c in ranked.columns if c in FRONTEND_COLUMNS]
 
         # --------------------------------------------------
         # 🧭 Query Parameters
@@ -81,40 +146,135 @@ def rank():
         order = request.args.get("order", default="desc", type=str)
 
         limit = max(1, min(limit, 200))
+        descending = order.lower() != "asc"
+
+        response_format = request.args.get("format", default="records", type=str)
+        if response_format not in ("records", "columnar"):
+            return jsonify({"status": "error", "message": "format must be records or columnar"}), 400
 
         # --------------------------------------------------
-        # 📊 Sorting Logic
+        # 🔖 Resume from a cursor
         # --------------------------------------------------
-        if sort_col in df.columns:
-            df = df.sort_values(
-                by=sort_col,
-                ascending=(order.lower() == "asc")
-            )
+        start = 0
+        filters = request.args.getlist("filter")
+        cursor_text = request.args.get("cursor")
+
+        if cursor_text:
+            try:
+                cursor = decode_cursor(cursor_text)
+            except ValueError as e:
+                return jsonify({"status": "error", "message": str(e)}), 400
+
+            if cursor["v"] != snapshot.version:
+                return jsonify({
+                    "status": "error",
+                    "message": "Dataset changed since this cursor was issued; restart from the first page.",
+                    "dataset_version": snapshot.version,
+                }), 409
+
+            sort_col, descending, start = cursor["s"], bool(cursor["d"]), cursor["p"] + 1
+            filters = [cursor.get("f", "")]
+
+        # Any numeric catalog column (only FRONTEND_COLUMNS are returned);
+        # text FRONTEND_COLUMNS (pl_name) sort alphabetically
+        if sort_col is None or _sortable(snapshot, sort_col):
+            sorted_by = sort_col
+        elif cursor_text:
+            return jsonify({"status": "error", "message": "invalid cursor"}), 400
+        elif "sort" in request.args:
+            return jsonify({
+                "status": "error",
+                "message": f"Cannot sort by '{sort_col}': not a numeric or returned catalog column"
+            }), 400
+        else:
+            sorted_by = None    # dataset without the default sort column: file order
 
         # --------------------------------------------------
-        # ✂️ Slice result
+        # 🔎 Filters (compiled to NumPy selections)
         # --------------------------------------------------
-        result_df = df.head(limit)
+        try:
+            predicates = parse_filters(filters, snapshot.columns)
+        except FilterError as e:
+            return jsonify({"status": "error", "message": f"Invalid filter: {e}"}), 400
+
+        if cursor_text:
+            # Same dataset version: the cursor's row must still carry its sort value
+            row = cursor["r"]
+            if not 0 <= row < snapshot.n_rows or (sorted_by and not _same_value(
+                _plain(snapshot.column(sorted_by)[row]), cursor["k"]
+            )):
+                return jsonify({"status": "error", "message": "invalid cursor"}), 400
 
         # --------------------------------------------------
-        # 🔥 REAL JSON SAFE FIX
+        # 📊 Sorting Logic (O(limit))
+        # Presorted permutation slice, or argpartition top-k;
+        # ties keep file order, NaN last
         # --------------------------------------------------
-        result_df = sanitize_dataframe_for_json(result_df)
+        if predicates:
+            selection = select(snapshot, predicates)
+            matched_rows = selection.count
+
+            try:
+                rows, positions, has_more = page(
+                    snapshot, selection, sorted_by, descending,
+                    (cursor["p"], cursor["r"]) if cursor_text else None, limit,
+                )
+            except ValueError as e:
+                return jsonify({"status": "error", "message": str(e)}), 400
+
+            last_position = int(positions[-1]) if len(positions) else None
+
+        else:
+            if sorted_by is not None and start == 0:
+                rows = snapshot.top_k(sorted_by, limit, descending=descending)
+            elif sorted_by is not None:
+                rows = snapshot.permutation(sorted_by, descending)[start:start + limit]
+            else:
+                rows = np.arange(start, min(start + limit, snapshot.n_rows))
+
+            if cursor_text:
+                order_rows = snapshot.permutation(sorted_by, descending) if sorted_by else None
+                last = cursor["p"]
+                if not 0 <= last < snapshot.n_rows or (
+                    order_rows[last] if order_rows is not None else last
+                ) != cursor["r"]:
+                    return jsonify({"status": "error", "message": "invalid cursor"}), 400
+
+            matched_rows = snapshot.n_rows
+            last_position = start + len(rows) - 1
+            has_more = start + len(rows) < snapshot.n_rows
+
+        # --------------------------------------------------
+        # ✂️ Slice result: encoded straight from the columns
+        # (only the returned rows are gathered; NaN / inf → null)
+        # --------------------------------------------------
+        data = ColumnarSlice(
+            {c: snapshot.column(c) for c in columns}, rows,
+            orient="columns" if response_format == "columnar" else "records",
+        )
 
         # --------------------------------------------------
         # 📈 Metadata (FOR DASHBOARD)
         # --------------------------------------------------
-        metadata = {
-            "total_rows": int(len(df)),
-            "returned_rows": int(len(result_df)),
-        }
+        next_cursor = None
 
-        if "habitability_score" in df.columns:
-            clean_scores = df["habitability_score"].replace([np.inf, -np.inf], np.nan)
-            metadata["avg_score"] = float(clean_scores.mean())
+        if has_more and len(rows):
+            last_row = int(rows[-1])
+            next_cursor = encode_cursor(
+                snapshot.version, sorted_by, descending, last_position, last_row,
+                snapshot.column(sorted_by)[last_row] if sorted_by else None,
+                filter_text(predicates),
+            )
 
-        if "prediction" in df.columns:
-            metadata["habitable_count"] = int((df["prediction"] == 1).sum())
+        metadata = {
+            "total_rows": int(snapshot.n_rows),
+            "returned_rows": len(data),
+            **snapshot.memo("rank_metadata", lambda: catalog_metadata(ranked)),
+            "matched_rows": int(matched_rows),
+            "filter": filter_text(predicates) or None,
+            "dataset_version": snapshot.version,
+            "next_cursor": next_cursor,
+        }
 
         # --------------------------------------------------
         # 🚀 FINAL RESPONSE
@@ -122,7 +282,7 @@ def rank():
         return jsonify({
             "status": "success",
             "metadata": metadata,
-            "data": result_df.to_dict(orient="records")
+            "data": data
         })
 
     except Exception as e:
@@ -1,25 +1,11 @@
 from flask import Blueprint, jsonify
-import pandas as pd
 import os
 
-stats_bp = Blueprint("stats", __name__)
-
-# =====================================================
-# 🚀 ABSOLUTE SAFE PATH (PRODUCTION READY)
-# =====================================================
-
-BASE_DIR = os.path.dirname(
-    os.path.dirname(
-        os.path.dirname(os.path.abspath(__file__))
-    )
-)
+from backend.config import RANKED_DATA_PATH
+from backend.http_cache import catalog_version, conditional
+from backend.services.catalog import get_ranked_catalog
 
-RANKED_PATH = os.path.join(
-    BASE_DIR,
-    "data",
-    "processed",
-    "ranked_exoplanets.csv"
-)
+stats_bp = Blueprint("stats", __name__)
 
 
 # =====================================================
@@ -27,6 +13,7 @@ RANKED_PATH = os.path.join(
 # =====================================================
 
 @stats_bp.route("/stats", methods=["GET"])
+@conditional(catalog_version)
 def stats():
     """
     🌌 ExoHabitAI Scientific Analytics Endpoint
@@ -44,7 +31,7 @@ def stats():
         # --------------------------------------------------
         # 📂 Dataset Safety Check
         # --------------------------------------------------
-        if not os.path.exists(RANKED_PATH):
+        if not os.path.exists(RANKED_DATA_PATH):
             return jsonify({
                 "status": "warning",
                 "message": "Ranked dataset not found",
@@ -53,66 +40,14 @@ def stats():
                 "avg_score": 0
             })
 
-        df = pd.read_csv(RANKED_PATH)
-
-        # --------------------------------------------------
-        # 📊 BASIC METRICS
-        # --------------------------------------------------
-        total_planets = int(len(df))
-
-        habitable_count = 0
-        avg_score = 0
-        min_score = 0
-        max_score = 0
-
-        if "prediction" in df.columns:
-            habitable_count = int((df["prediction"] == 1).sum())
-
-        if "habitability_score" in df.columns:
-            avg_score = float(df["habitability_score"].mean())
-            min_score = float(df["habitability_score"].min())
-            max_score = float(df["habitability_score"].max())
-
-        # --------------------------------------------------
-        # 📈 DISTRIBUTION DATA (FOR CHARTS)
-        # --------------------------------------------------
-        distribution = {}
-
-        if "habitability_score" in df.columns:
-            # Create histogram bins for frontend graphs
-            bins = [0, 0.25, 0.5, 0.75, 1.0]
-            labels = ["Very Low", "Low", "Medium", "High"]
-
-            df["score_band"] = pd.cut(
-                df["habitability_score"],
-                bins=bins,
-                labels=labels,
-                include_lowest=True
-            )
-
-            distribution = (
-                df["score_band"]
-                .value_counts()
-                .sort_index()
-                .to_dict()
-            )
+        snapshot = get_ranked_catalog().get()
 
         # --------------------------------------------------
-        # 🌍 OPTIONAL EXTRA SCIENTIFIC INSIGHTS
+        # 📊 METRICS, DISTRIBUTION, FEATURE MEANS
+        # Aggregated when the catalog snapshot was built
+        # (services/catalog_stats.py): no pass over the rows here
         # --------------------------------------------------
-        feature_means = {}
-
-        important_features = [
-            "pl_rade",
-            "pl_eqt",
-            "st_teff",
-            "st_mass",
-            "st_rad"
-        ]
-
-        for col in important_features:
-            if col in df.columns:
-                feature_means[col] = float(df[col].mean())
+        stats = snapshot.memo("stats_payload", snapshot.stats.payload)
 
         # --------------------------------------------------
         # 🚀 FINAL RESPONSE (DASHBOARD READY)
@@ -120,13 +55,8 @@ def stats():
         return jsonify({
             "status": "success",
             "dataset_health": "ok",
-            "total_planets": total_planets,
-            "habitable_count": habitable_count,
-            "avg_score": avg_score,
-            "min_score": min_score,
-            "max_score": max_score,
-            "distribution": distribution,
-            "feature_means": feature_means
+            **stats,
+            "dataset_version": snapshot.version
         })
 
     except Exception as e:
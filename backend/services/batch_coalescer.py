@@ -0,0 +1,167 @@
+# ======================================================
+# 🚀 ExoHabitAI — Adaptive Micro-Batching
+# Coalesces concurrent /predict calls into one forest pass
+# ======================================================
+
+import time
+import queue
+import threading
+from concurrent.futures import Future
+
+from backend.config import (
+    COALESCER_WINDOW_MS,
+    COALESCER_MAX_BATCH,
+    COALESCER_TIMEOUT_SECONDS,
+)
+from backend.metrics import Histogram
+from backend.services.prediction_service import predict_planets_batch, predict_planet_fast
+
+
+# Bucket bounds for tuning the window
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+QUEUE_WAIT_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+
+
+# ======================================================
+# 🧵 COALESCER
+# ======================================================
+
+class PredictionCoalescer:
+    """
+    Request coalescer in front of the batch scoring engine.
+
+    - callers block on their own Future
+    - one background thread drains the queue
+    - a batch closes when the window (ms) since its first
+      request elapses or max_batch requests are queued
+    - the whole batch is scored with ONE predict_proba call
+      per model (callers pass the snapshot model they resolved)
+    """
+
+    def __init__(self, window_ms: float, max_batch: int, score_batch=predict_planets_batch):
+        self.window = window_ms / 1000.0
+        self.max_batch = max(1, int(max_batch))
+        self.score_batch = score_batch
+
+        self.batch_sizes = Histogram(
+            "coalescer_batch_size", BATCH_SIZE_BUCKETS,
+            "Requests scored per forest evaluation",
+        )
+        self.queue_wait_ms = Histogram(
+            "coalescer_queue_wait_ms", QUEUE_WAIT_BUCKETS_MS,
+            "Time a request waited before its batch was scored (ms)",
+        )
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="prediction-coalescer", daemon=True
+        )
+        self._thread.start()
+
+    # --------------------------------------------------
+    # Caller side
+    # --------------------------------------------------
+    def predict(self, data: dict, model=None):
+        """Blocking: returns this caller's own prediction."""
+
+        future = Future()
+        self._queue.put((time.perf_counter(), data, model, future))
+        return future.result(timeout=COALESCER_TIMEOUT_SECONDS)
+
+    # --------------------------------------------------
+    # Worker side
+    # --------------------------------------------------
+    def _collect(self):
+        """
+        Block for the first request, then fill the window.
+        Requests that piled up while the previous batch was
+        scoring are always taken (no extra wait for them).
+        """
+
+        batch = [self._queue.get()]
+        deadline = batch[0][0] + self.window
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+
+            self.batch_sizes.observe(len(batch))
+            for enqueued, _, _, _ in batch:
+                self.queue_wait_ms.observe((started - enqueued) * 1000)
+
+            # A model swap inside the window must not mix versions
+            groups = {}
+            for entry in batch:
+                groups.setdefault(id(entry[2]), []).append(entry)
+
+            for group in groups.values():
+                self._score_group(group)
+
+    def _score_group(self, group):
+        model = group[0][2]
+        records = [data for _, data, _, _ in group]
+
+        try:
+            results = self.score_batch(records, model)
+        except Exception:
+            # One bad payload must not fail its neighbours
+            results = None
+
+        for i, (_, data, _, future) in enumerate(group):
+            if results is not None:
+                future.set_result(results[i])
+                continue
+            try:
+                future.set_result(predict_planet_fast(data, model))
+            except Exception as e:
+                future.set_exception(e)
+
+    def stats(self) -> dict:
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "queued": self._queue.qsize(),
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_wait_ms": self.queue_wait_ms.snapshot(),
+        }
+
+
+# ======================================================
+# ⭐ PROCESS-WIDE INSTANCE
+# ======================================================
+
+_coalescer = None
+_coalescer_lock = threading.Lock()
+
+
+def get_coalescer() -> PredictionCoalescer:
+    """Lazily started singleton (one drain thread per worker)."""
+
+    global _coalescer
+
+    if _coalescer is not None:
+        return _coalescer
+
+    with _coalescer_lock:
+        if _coalescer is None:
+            _coalescer = PredictionCoalescer(COALESCER_WINDOW_MS, COALESCER_MAX_BATCH)
+
+    return _coalescer
+
+
+def predict_coalesced(data: dict, model=None):
+    """Drop-in replacement for predict_planet_fast."""
+    return get_coalescer().predict(data, model)
@@ -0,0 +1,482 @@
+# ======================================================
+# 🚀 ExoHabitAI — Ranked Catalog (shared, columnar)
+# One process-wide copy of ranked_exoplanets.csv for
+# /rank, /stats, ranking_service and warm-up
+#
+# - parsed once into typed, contiguous NumPy columns
+#   (+ a DataFrame over the same memory for pandas callers)
+# - stable sort permutations for RANK_PRESORTED_COLUMNS built
+#   with each load: /rank top-k is a slice, O(limit)
+# - reloaded only when the file's (mtime, size) changes;
+#   rows appended at the end are parsed on their own and
+#   the /stats aggregates extended, not recomputed
+# - single-flight: one thread parses, however many
+#   requests notice the change
+# - double-buffered: while a reload builds, requests keep
+#   reading the previous snapshot; the swap is one
+#   reference assignment
+# ======================================================
+
+import os
+import time
+import threading
+
+import numpy as np
+import pandas as pd
+
+from backend.config import CATALOG_APPEND_RELOAD, RANKED_DATA_PATH, RANK_PRESORTED_COLUMNS
+from backend.metrics import CallbackMetric, register
+from backend.services.catalog_stats import StatsAggregate
+
+
+# Bytes remembered from the end of the file: a later version that
+# still has them at the same offset only appended rows
+TAIL_BYTES = 4096
+
+
+# ======================================================
+# 🔢 SORT PERMUTATIONS / TOP-K
+# Order everywhere: by value, ties in file order, NaN last
+# (= pandas sort_values(kind="stable", na_position="last"))
+# ======================================================
+
+def _index_dtype(n: int):
+    return np.int32 if n < 2 ** 31 else np.int64
+
+
+def sort_permutations(values: np.ndarray) -> tuple:
+    """(ascending, descending) stable row permutations of a numeric column."""
+
+    dtype = _index_dtype(len(values))
+    asc = np.argsort(values, kind="stable").astype(dtype, copy=False)
+
+    if values.dtype.kind == "f":
+        # -NaN is NaN: still sorted last
+        desc = np.argsort(-values, kind="stable")
+    else:
+        # Stable descending without negation (no integer overflow)
+        desc = (len(values) - 1 - np.argsort(values[::-1], kind="stable"))[::-1]
+
+    return asc, np.ascontiguousarray(desc, dtype=dtype)
+
+
+def top_k_rows(values: np.ndarray, k: int, descending: bool) -> np.ndarray:
+    """
+    First k rows of the stable order without sorting the column:
+    argpartition finds the k-th key, boundary ties are taken in
+    file order, then only those k rows are sorted.
+    """
+
+    n = len(values)
+    k = max(0, min(k, n))
+
+    if values.dtype.kind not in "biuf":
+        order = pd.Series(values).sort_values(
+            ascending=not descending, kind="stable", na_position="last"
+        ).index
+        return np.asarray(order[:k], dtype=_index_dtype(n))
+
+    rows = None
+    key = values.astype(np.int8) if values.dtype.kind == "b" else values
+
+    if values.dtype.kind == "f":
+        missing = np.isnan(values)
+        if missing.any():
+            rows = np.flatnonzero(~missing)
+            key = values[rows]
+
+    if descending:
+        key = -key
+
+    m = len(key)
+
+    if k >= m:
+        picked = np.argsort(key, kind="stable")
+    elif k == 0:
+        picked = np.empty(0, dtype=np.intp)
+    else:
+        kth = key[np.argpartition(key, k - 1)[:k]].max()
+        below = np.flatnonzero(key < kth)
+        ties = np.flatnonzero(key == kth)[:k - len(below)]
+
+        candidates = np.concatenate([below, ties])
+        picked = candidates[np.argsort(key[candidates], kind="stable")]
+
+    if rows is not None:
+        picked = rows[picked]
+        if k > m:
+            # NaN rows last, in file order
+            picked = np.concatenate([picked, np.flatnonzero(missing)[:k - m]])
+
+    return picked.astype(_index_dtype(n), copy=False)
+
+
+# ======================================================
+# 📦 IMMUTABLE SNAPSHOT
+# ======================================================
+
+class CatalogSnapshot:
+    """
+    One parsed version of the catalog file.
+    Never mutated after construction: callers must not
+    write to .frame or .columns.
+    """
+
+    def __init__(self, frame: pd.DataFrame, signature: tuple, load_ms: float,
+                 tail: bytes = b"", base: "CatalogSnapshot" = None):
+        self.frame = frame
+        self.signature = signature          # (mtime_ns, size)
+        self.tail = tail                    # last TAIL_BYTES of the file
+        self.load_ms = load_ms
+        self.loaded_at = time.time()
+        self.n_rows = len(frame)
+
+        # Rows added on top of `base` (its rows are our first ones)
+        self.appended_rows = self.n_rows - base.n_rows if base is not None else None
+
+        # Changes whenever the file does (cursor / cache validation)
+        self.version = f"{signature[0]:x}-{signature[1]:x}"
+
+        # Column views over the frame's blocks (no copy)
+        self.columns = {c: frame[c].to_numpy() for c in frame.columns}
+
+        # Built here, i.e. off the request path (background reload)
+        self.presorted = {
+            c: sort_permutations(self.columns[c])
+            for c in RANK_PRESORTED_COLUMNS
+            if c in self.columns and self.columns[c].dtype.kind in "biuf"
+        }
+
+        # Ascending values of the same columns: ?filter= ranges are
+        # two binary searches (services/catalog_query.py)
+        self.sorted_values = {c: self.columns[c][asc] for c, (asc, _) in self.presorted.items()}
+
+        # /stats aggregates (services/catalog_stats.py): after an
+        # append only the new rows are aggregated
+        if base is not None:
+            self.stats = base.stats.merge(StatsAggregate.of(self.columns, start=base.n_rows))
+        else:
+            self.stats = StatsAggregate.of(self.columns)
+
+        self._memo = {}
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def top_k(self, column: str, k: int, descending: bool = True) -> np.ndarray:
+        """Row positions of the first k rows ordered by column."""
+
+        perms = self.presorted.get(column)
+        if perms is not None:
+            return perms[1 if descending else 0][:max(0, k)]
+
+        return top_k_rows(self.columns[column], k, descending)
+
+    def permutation(self, column: str, descending: bool = True) -> np.ndarray:
+        """
+        Full stable row order by column: presorted, or built once
+        per snapshot on first use (cursor pagination walks it).
+        """
+
+        perms = self.presorted.get(column)
+        if perms is not None:
+            return perms[1 if descending else 0]
+
+        return self.memo(
+            ("permutation", column, descending),
+            lambda: top_k_rows(self.columns[column], self.n_rows, descending),
+        )
+
+    def memo(self, key, compute):
+        """Per-snapshot cache for values derived from immutable data."""
+
+        value = self._memo.get(key)
+        if value is None:
+            value = self._memo.setdefault(key, compute())
+        return value
+
+    def info(self) -> dict:
+        return {
+            "version": self.version,
+            "rows": self.n_rows,
+            "columns": len(self.columns),
+            "mtime_ns": self.signature[0],
+            "size_bytes": self.signature[1],
+            "load_ms": round(self.load_ms, 2),
+            "loaded_at": self.loaded_at,
+            "appended_rows": self.appended_rows,
+            "presorted": list(self.presorted),
+        }
+
+
+def read_catalog(path: str) -> pd.DataFrame:
+    """
+    Parse the ranked CSV into typed columns: numeric columns
+    become contiguous float64 / int64, everything else stays
+    as parsed.
+    """
+
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Ranked dataset not found at: {path}")
+
+    df = pd.read_csv(path)
+
+    if df.empty:
+        raise ValueError("Ranked dataset is empty")
+
+    return _columnar(df)
+
+
+def _columnar(df: pd.DataFrame) -> pd.DataFrame:
+    columns = {}
+    for col in df.columns:
+        values = df[col].to_numpy()
+
+        if values.dtype.kind in "iu":
+            values = values.astype(np.int64, copy=False)
+        elif values.dtype.kind == "f":
+            values = values.astype(np.float64, copy=False)
+
+        columns[col] = np.ascontiguousarray(values)
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def read_tail(path: str, size: int) -> bytes:
+    """The last TAIL_BYTES of the first `size` bytes of the file."""
+
+    with open(path, "rb") as f:
+        f.seek(max(0, size - TAIL_BYTES))
+        return f.read(min(size, TAIL_BYTES))
+
+
+def read_appended_rows(path: str, previous: CatalogSnapshot):
+    """
+    Rows written after `previous` was loaded, if the file only grew:
+    same bytes at the old end, new rows after it. None otherwise
+    (rewritten file → full reload).
+    """
+
+    old_size = previous.signature[1]
+    tail = previous.tail
+
+    if not tail.endswith(b"\n"):
+        return None
+
+    with open(path, "rb") as f:
+        f.seek(old_size - len(tail))
+        if f.read(len(tail)) != tail:
+            return None
+
+        try:
+            added = pd.read_csv(f, header=None)
+        except pd.errors.EmptyDataError:
+            return None
+
+    if added.empty or added.shape[1] != len(previous.frame.columns):
+        return None
+
+    added.columns = previous.frame.columns
+    return _columnar(added)
+
+
+def append_rows(frame: pd.DataFrame, added: pd.DataFrame):
+    """
+    frame + added with the dtypes a full parse would infer
+    (int + float → float64). None if a column changes kind.
+    """
+
+    columns = {}
+    for col in frame.columns:
+        old, new = frame[col].to_numpy(), added[col].to_numpy()
+
+        numeric = old.dtype.kind in "iuf" and new.dtype.kind in "iuf"
+        if old.dtype != new.dtype and not numeric:
+            return None
+
+        columns[col] = np.concatenate([old, new])
+
+    return pd.DataFrame(columns, copy=False)
+
+
+# ======================================================
+# 🔁 DOUBLE-BUFFERED, SINGLE-FLIGHT CATALOG
+# ======================================================
+
+class Catalog:
+    """
+    get() is lock-free on the hot path: one os.stat() and a
+    signature compare. A changed file starts ONE background
+    reload; everybody keeps the current snapshot until the
+    new one is built. Only the very first load blocks.
+    """
+
+    def __init__(self, path: str, loader=read_catalog):
+        self.path = path
+        self.loader = loader
+
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._inflight = None               # threading.Event of the running build
+        self._error = None
+        self._failed_signature = None       # don't re-parse a file that failed
+
+        self.reloads = 0
+        self.appends = 0
+        self.failures = 0
+        self.last_error = None
+
+    # --------------------------------------------------
+    # Read side
+    # --------------------------------------------------
+    def get(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+
+        try:
+            signature = self._signature()
+        except FileNotFoundError:
+            if snapshot is not None:
+                return snapshot              # mid-rewrite: keep serving
+            raise
+
+        if snapshot is not None:
+            if signature != snapshot.signature and signature != self._failed_signature:
+                self._start_build(background=True)
+            return snapshot
+
+        # Cold start: wait for the (single) first build
+        self._start_build(background=False)
+
+        if self._snapshot is None:
+            raise self._error or RuntimeError("catalog load failed")
+
+        return self._snapshot
+
+    def frame(self) -> pd.DataFrame:
+        return self.get().frame
+
+    # --------------------------------------------------
+    # Build side
+    # --------------------------------------------------
+    def _signature(self) -> tuple:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _start_build(self, background: bool):
+        with self._lock:
+            done = self._inflight
+            leader = done is None
+
+            if leader:
+                done = self._inflight = threading.Event()
+
+        if leader:
+            if background:
+                threading.Thread(
+                    target=self._build, args=(done,), name="catalog-reload", daemon=True
+                ).start()
+            else:
+                self._build(done)
+
+        if not background:
+            done.wait()
+
+    def _build(self, done: threading.Event):
+        before = None
+
+        try:
+            before = self._signature()
+            previous = self._snapshot
+
+            start = time.perf_counter()
+            frame = base = None
+
+            if self._can_append(previous, before):
+                added = read_appended_rows(self.path, previous)
+                if added is not None:
+                    frame = append_rows(previous.frame, added)
+                    base = previous if frame is not None else None
+
+            if frame is None:
+                frame = self.loader(self.path)
+
+            tail = read_tail(self.path, before[1])
+            load_ms = (time.perf_counter() - start) * 1000
+
+            # Rewritten while parsing: the next get() retries
+            if self._signature() != before:
+                raise RuntimeError("catalog file changed during reload")
+
+            if base is not None:
+                self.reloads += 1
+                self.appends += 1
+                print(f"🔁 Ranked catalog appended: +{len(frame) - base.n_rows} rows "
+                      f"({len(frame)} total) in {load_ms:.0f} ms")
+            elif previous is not None:
+                self.reloads += 1
+                print(f"🔁 Ranked catalog reloaded: {len(frame)} rows in {load_ms:.0f} ms")
+
+            self._snapshot = CatalogSnapshot(frame, before, load_ms, tail=tail, base=base)
+            self._error = None
+
+        except Exception as e:
+            self.failures += 1
+            self.last_error = str(e)
+            self._error = e
+            self._failed_signature = before
+            print(f"⚠️ Ranked catalog reload failed (serving previous snapshot): {e}")
+
+        finally:
+            with self._lock:
+                self._inflight = None
+            done.set()
+
+    def _can_append(self, previous, signature: tuple) -> bool:
+        return (
+            CATALOG_APPEND_RELOAD
+            and self.loader is read_catalog
+            and previous is not None
+            and signature[1] > previous.signature[1]
+        )
+
+    def info(self) -> dict:
+        snapshot = self._snapshot
+
+        return {
+            "path": self.path,
+            "loaded": snapshot.info() if snapshot is not None else None,
+            "reloading": self._inflight is not None,
+            "reloads": self.reloads,
+            "appends": self.appends,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+# ======================================================
+# ⭐ PROCESS-WIDE INSTANCE
+# ======================================================
+
+_ranked_catalog = Catalog(RANKED_DATA_PATH)
+
+
+def get_ranked_catalog() -> Catalog:
+    """The one ranked catalog shared by every route in this process."""
+    return _ranked_catalog
+
+
+def _catalog_rows():
+    snapshot = _ranked_catalog._snapshot
+    return [({}, snapshot.n_rows if snapshot is not None else 0)]
+
+
+register(CallbackMetric(
+    "exohabitai_ranked_dataset_rows", "gauge", _catalog_rows,
+    "Rows of the loaded ranked catalog (0 until first load)",
+))
+register(CallbackMetric(
+    "exohabitai_ranked_catalog_reloads_total", "counter",
+    lambda: [({"result": "success"}, _ranked_catalog.reloads),
+             ({"result": "failure"}, _ranked_catalog.failures)],
+    "Ranked catalog reloads after the file changed",
+))
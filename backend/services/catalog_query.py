@@ -0,0 +1,322 @@
+# ======================================================
+# 🚀 ExoHabitAI — Catalog Filter Engine (/rank?filter=)
+# Small filter expressions compiled to NumPy selections
+# over the columnar ranked catalog
+#
+#   habitability_score>=0.7, pl_eqt=200..320, st_teff<6000,
+#   prediction=1, st_mass!=1
+#
+# - clauses are AND-ed (comma separated; repeat ?filter=)
+# - every clause becomes a range on one numeric column;
+#   NaN never matches
+# - indexed columns (presorted, see RANK_PRESORTED_COLUMNS)
+#   answer ranges by binary search over sorted values: exact
+#   counts, and the matching rows without a full scan
+# - clauses run most selective first; once few rows remain
+#   the rest are evaluated on those rows only
+# ======================================================
+
+import re
+
+import numpy as np
+
+from backend.services.catalog import top_k_rows
+
+
+# Below this fraction of the catalog, work on row ids
+# instead of full-length boolean masks
+CANDIDATE_FRACTION = 1 / 16
+
+# Rows sampled to estimate the selectivity of unindexed clauses
+SAMPLE_ROWS = 4096
+
+# Larger row-id selections sorted by a presorted column walk its
+# permutation instead (O(limit / selectivity), no per-page sort)
+WALK_MIN_ROWS = 4096
+
+MAX_CLAUSES = 16
+
+_CLAUSE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*(>=|<=|!=|==|=|>|<)\s*(\S+)\s*$")
+
+
+class FilterError(ValueError):
+    """Malformed filter expression (→ 400)."""
+
+
+# ======================================================
+# 🧾 PARSING
+# ======================================================
+
+class Predicate:
+    """column ∈ [lo, hi] (open / closed ends), or column != value."""
+
+    def __init__(self, column, lo=-np.inf, hi=np.inf, lo_open=False, hi_open=False, exclude=None):
+        self.column = column
+        self.lo, self.hi = lo, hi
+        self.lo_open, self.hi_open = lo_open, hi_open
+        self.exclude = exclude
+
+    def mask(self, values: np.ndarray) -> np.ndarray:
+        if self.exclude is not None:
+            return (values != self.exclude) & (values == values)   # NaN never matches
+
+        lower = values > self.lo if self.lo_open else values >= self.lo
+        upper = values < self.hi if self.hi_open else values <= self.hi
+        lower &= upper
+        return lower
+
+    def sorted_range(self, sorted_values: np.ndarray) -> tuple:
+        """[i, j) of this range in ascending sorted values (NaN last)."""
+
+        lo, hi = self.lo, self.hi
+        lo_side = "right" if self.lo_open else "left"
+        hi_side = "left" if self.hi_open else "right"
+
+        if sorted_values.dtype.kind in "iu":
+            # Integer bounds: a float needle would cast the whole column
+            info = np.iinfo(sorted_values.dtype)
+            lo = np.floor(lo) + 1 if self.lo_open else np.ceil(lo)
+            hi = np.ceil(hi) - 1 if self.hi_open else np.floor(hi)
+            lo = sorted_values.dtype.type(np.clip(lo, info.min, info.max))
+            hi = sorted_values.dtype.type(np.clip(hi, info.min, info.max))
+            lo_side, hi_side = "left", "right"
+
+            if self.lo > info.max or self.hi < info.min:
+                return 0, 0
+
+        i = np.searchsorted(sorted_values, lo, side=lo_side)
+        j = np.searchsorted(sorted_values, hi, side=hi_side)
+        return int(i), int(max(i, j))
+
+    def text(self) -> str:
+        if self.exclude is not None:
+            return f"{self.column}!={_number(self.exclude)}"
+        if self.lo == self.hi:
+            return f"{self.column}={_number(self.lo)}"
+        if self.lo == -np.inf:
+            return f"{self.column}{'<' if self.hi_open else '<='}{_number(self.hi)}"
+        if self.hi == np.inf:
+            return f"{self.column}{'>' if self.lo_open else '>='}{_number(self.lo)}"
+        return f"{self.column}={_number(self.lo)}..{_number(self.hi)}"
+
+
+def _number(value) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _parse_value(text: str, clause: str) -> float:
+    try:
+        value = float(text)
+    except ValueError:
+        raise FilterError(f"not a number in '{clause}'")
+
+    if value != value:
+        raise FilterError(f"NaN is not a filter value in '{clause}'")
+
+    return value
+
+
+def parse_filters(texts, columns: dict) -> list:
+    """
+    ["habitability_score>=0.7,pl_eqt=200..320", ...] → predicates.
+    columns: name → ndarray (only numeric ones can be filtered).
+    """
+
+    predicates = []
+
+    for text in texts:
+        for clause in filter(None, (c.strip() for c in text.split(","))):
+            match = _CLAUSE.match(clause)
+            if not match:
+                raise FilterError(f"cannot parse '{clause}' (expected e.g. pl_eqt>=200 or pl_eqt=200..320)")
+
+            column, op, raw = match.groups()
+
+            if column not in columns:
+                raise FilterError(f"unknown column '{column}'")
+            if columns[column].dtype.kind not in "biuf":
+                raise FilterError(f"column '{column}' is not numeric")
+
+            if op in ("=", "==") and ".." in raw:
+                lo, _, hi = raw.partition("..")
+                predicate = Predicate(column, _parse_value(lo, clause), _parse_value(hi, clause))
+            else:
+                value = _parse_value(raw, clause)
+                predicate = {
+                    ">=": lambda: Predicate(column, lo=value),
+                    ">": lambda: Predicate(column, lo=value, lo_open=True),
+                    "<=": lambda: Predicate(column, hi=value),
+                    "<": lambda: Predicate(column, hi=value, hi_open=True),
+                    "=": lambda: Predicate(column, value, value),
+                    "==": lambda: Predicate(column, value, value),
+                    "!=": lambda: Predicate(column, exclude=value),
+                }[op]()
+
+            predicates.append(predicate)
+
+    if len(predicates) > MAX_CLAUSES:
+        raise FilterError(f"at most {MAX_CLAUSES} filter clauses")
+
+    return predicates
+
+
+def filter_text(predicates: list) -> str:
+    """Canonical form (echoed in responses and cursors)."""
+    return ",".join(p.text() for p in predicates)
+
+
+# ======================================================
+# 🎯 SELECTION (SELECTIVITY-ORDERED)
+# ======================================================
+
+class Selection:
+    """Rows matching every predicate: sorted row ids, or a full mask."""
+
+    def __init__(self, rows=None, mask=None):
+        self.rows = rows
+        self.mask = mask
+        self.count = len(rows) if rows is not None else int(np.count_nonzero(mask))
+
+
+def _plan(snapshot, predicates: list) -> list:
+    """[(estimated rows, predicate, (i, j) or None)] most selective first."""
+
+    n = snapshot.n_rows
+    sample = snapshot.memo(
+        "filter_sample",
+        lambda: np.unique(np.linspace(0, n - 1, min(n, SAMPLE_ROWS)).astype(np.int64)),
+    )
+
+    plan = []
+    for predicate in predicates:
+        sorted_values = snapshot.sorted_values.get(predicate.column)
+
+        if sorted_values is not None and predicate.exclude is None:
+            i, j = predicate.sorted_range(sorted_values)
+            plan.append((j - i, predicate, (i, j)))
+        else:
+            values = snapshot.columns[predicate.column][sample]
+            estimate = predicate.mask(values).mean() * n if len(sample) else 0
+            plan.append((estimate, predicate, None))
+
+    plan.sort(key=lambda step: step[0])
+    return plan
+
+
+def select(snapshot, predicates: list) -> Selection:
+    """
+    Evaluate predicates most selective first. Large selections stay
+    boolean masks; once at most CANDIDATE_FRACTION of the catalog
+    remains, later predicates only touch the surviving rows.
+    """
+
+    n = snapshot.n_rows
+    threshold = max(1, int(n * CANDIDATE_FRACTION))
+
+    rows = None
+    mask = None
+
+    for estimate, predicate, sorted_range in _plan(snapshot, predicates):
+        values = snapshot.columns[predicate.column]
+
+        if rows is not None:
+            rows = rows[predicate.mask(values[rows])]
+
+        elif sorted_range is not None and sorted_range[1] - sorted_range[0] <= threshold:
+            # Binary-searched range: matching rows without a scan
+            i, j = sorted_range
+            rows = np.sort(snapshot.presorted[predicate.column][0][i:j])
+
+            if mask is not None:
+                rows = rows[mask[rows]]
+                mask = None
+
+        elif mask is None:
+            mask = predicate.mask(values)
+
+        else:
+            mask &= predicate.mask(values)
+
+        if mask is not None and rows is None and np.count_nonzero(mask) <= threshold:
+            rows = np.flatnonzero(mask)
+            mask = None
+
+        if rows is not None and len(rows) == 0:
+            break
+
+    if rows is None and mask is None:
+        mask = np.ones(n, dtype=bool)
+
+    return Selection(rows=rows, mask=mask)
+
+
+# ======================================================
+# ✂️ FILTERED PAGE (TOP-K / CURSOR)
+# ======================================================
+
+def page(snapshot, selection: Selection, sort_col, descending: bool, after, limit: int):
+    """
+    Up to `limit` matching rows in (sort_col, descending) order,
+    starting after cursor position `after` = (position, row) or None.
+
+    Returns (rows, positions, has_more). Positions are what the
+    next cursor stores: index into the ordered selected rows
+    (row-id selections) or into the full sort order (masks).
+    Raises ValueError when `after` does not match this selection.
+    """
+
+    start = after[0] + 1 if after else 0
+
+    rows = selection.rows
+    mask = selection.mask
+
+    if rows is not None and sort_col in snapshot.presorted and len(rows) > WALK_MIN_ROWS:
+        mask = np.zeros(snapshot.n_rows, dtype=bool)
+        mask[rows] = True
+        rows = None
+
+    # --------------------------------------------------
+    # Few rows: order just those
+    # --------------------------------------------------
+    if rows is not None:
+
+        if sort_col is not None:
+            # Row ids ascending → ties keep file order
+            k = min(len(rows), start + limit + 1)
+            rows = rows[top_k_rows(snapshot.columns[sort_col][rows], k, descending)]
+
+        if after and (after[0] >= len(rows) or rows[after[0]] != after[1]):
+            raise ValueError("invalid cursor")
+
+        picked = rows[start:start + limit]
+        positions = np.arange(start, start + len(picked))
+        return picked, positions, start + len(picked) < selection.count
+
+    # --------------------------------------------------
+    # Many rows: walk the full order, keep matches
+    # --------------------------------------------------
+    order = snapshot.permutation(sort_col, descending) if sort_col is not None else None
+
+    if after:
+        row = order[after[0]] if order is not None and after[0] < len(order) else after[0]
+        if after[0] >= snapshot.n_rows or row != after[1] or not mask[row]:
+            raise ValueError("invalid cursor")
+
+    found = []
+    chunk = max(64, 4 * limit)
+    position = start
+
+    while position < snapshot.n_rows and sum(len(f) for f in found) <= limit:
+        stop = min(snapshot.n_rows, position + chunk)
+        window = order[position:stop] if order is not None else np.arange(position, stop)
+        found.append(np.flatnonzero(mask[window]) + position)
+
+        position = stop
+        chunk *= 2
+
+    positions = np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+    has_more = len(positions) > limit
+    positions = positions[:limit]
+
+    rows = order[positions] if order is not None else positions
+    return rows, positions, has_more
@@ -0,0 +1,156 @@
+# ======================================================
+# 🚀 ExoHabitAI — Catalog Statistics (/stats)
+# Whole-catalog aggregates kept in mergeable form
+#
+# - count / sum / min / max per column, score-band counts
+#   and the habitable count: stats(a + b) = merge(a, b)
+# - built once per catalog snapshot (off the request path);
+#   a snapshot that only appended rows extends the previous
+#   aggregate in O(new rows)
+# - same numbers as the pandas version of /stats: mean /
+#   min / max skip NaN, bands = pd.cut(bins, include_lowest)
+# ======================================================
+
+import numpy as np
+
+
+SCORE_COLUMN = "habitability_score"
+PREDICTION_COLUMN = "prediction"
+
+# pd.cut(score, bins=SCORE_BINS, labels=SCORE_BANDS, include_lowest=True)
+SCORE_BINS = (0.0, 0.25, 0.5, 0.75, 1.0)
+SCORE_BANDS = ("Very Low", "Low", "Medium", "High")
+
+FEATURE_COLUMNS = ("pl_rade", "pl_eqt", "st_teff", "st_mass", "st_rad")
+
+
+# ======================================================
+# ➕ MERGEABLE PIECES
+# ======================================================
+
+class ColumnMoments:
+    """count / sum / min / max of the non-NaN values of one column."""
+
+    def __init__(self, count=0, total=0.0, low=np.inf, high=-np.inf):
+        self.count = count
+        self.total = total
+        self.low = low
+        self.high = high
+
+    @classmethod
+    def of(cls, values: np.ndarray) -> "ColumnMoments":
+        values = np.asarray(values, dtype=np.float64)
+        present = ~np.isnan(values)
+        count = int(np.count_nonzero(present))
+
+        if count == 0:
+            return cls()
+
+        if count == len(values):
+            return cls(count, float(values.sum()), float(values.min()), float(values.max()))
+
+        # fmin / fmax skip NaN without a filtered copy
+        total = float(np.sum(values, where=present))
+        return cls(count, total, float(np.fmin.reduce(values)), float(np.fmax.reduce(values)))
+
+    def merge(self, other: "ColumnMoments") -> "ColumnMoments":
+        return ColumnMoments(
+            self.count + other.count,
+            self.total + other.total,
+            min(self.low, other.low),
+            max(self.high, other.high),
+        )
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else float("nan")
+
+    @property
+    def min(self) -> float:
+        return self.low if self.count else float("nan")
+
+    @property
+    def max(self) -> float:
+        return self.high if self.count else float("nan")
+
+
+def score_band_counts(scores: np.ndarray) -> np.ndarray:
+    """Rows per SCORE_BANDS; NaN and out-of-range scores are in none."""
+
+    scores = np.asarray(scores, dtype=np.float64)
+    edges = np.asarray(SCORE_BINS)
+
+    # Right-closed bins, first one also closed on the left (include_lowest)
+    inside = (scores >= edges[0]) & (scores <= edges[-1])
+    bands = np.searchsorted(edges[1:-1], scores[inside], side="left")
+
+    return np.bincount(bands, minlength=len(SCORE_BANDS)).astype(np.int64)
+
+
+# ======================================================
+# 📊 CATALOG AGGREGATE
+# ======================================================
+
+class StatsAggregate:
+    """Everything /stats reports, as mergeable partial aggregates."""
+
+    def __init__(self, rows=0, habitable=None, score=None, bands=None, features=None):
+        self.rows = rows
+        self.habitable = habitable              # None: no prediction column
+        self.score = score                      # None: no score column
+        self.bands = bands
+        self.features = features or {}
+
+    @classmethod
+    def of(cls, columns: dict, start: int = 0) -> "StatsAggregate":
+        """Aggregate rows [start:] of name → ndarray columns."""
+
+        rows = 0
+        if columns:
+            rows = max(0, len(next(iter(columns.values()))) - start)
+
+        habitable = None
+        if PREDICTION_COLUMN in columns:
+            habitable = int(np.count_nonzero(columns[PREDICTION_COLUMN][start:] == 1))
+
+        score = bands = None
+        if SCORE_COLUMN in columns:
+            scores = columns[SCORE_COLUMN][start:]
+            score = ColumnMoments.of(scores)
+            bands = score_band_counts(scores)
+
+        features = {
+            col: ColumnMoments.of(columns[col][start:])
+            for col in FEATURE_COLUMNS
+            if col in columns and columns[col].dtype.kind in "biuf"
+        }
+
+        return cls(rows, habitable, score, bands, features)
+
+    def merge(self, other: "StatsAggregate") -> "StatsAggregate":
+        """Aggregate of both row sets (same columns)."""
+
+        return StatsAggregate(
+            self.rows + other.rows,
+            None if self.habitable is None else self.habitable + other.habitable,
+            None if self.score is None else self.score.merge(other.score),
+            None if self.bands is None else self.bands + other.bands,
+            {col: m.merge(other.features[col]) for col, m in self.features.items()},
+        )
+
+    def payload(self) -> dict:
+        """The /stats response body (without status)."""
+
+        distribution = {}
+        if self.bands is not None:
+            distribution = {band: int(n) for band, n in zip(SCORE_BANDS, self.bands)}
+
+        return {
+            "total_planets": int(self.rows),
+            "habitable_count": self.habitable or 0,
+            "avg_score": self.score.mean if self.score else 0,
+            "min_score": self.score.min if self.score else 0,
+            "max_score": self.score.max if self.score else 0,
+            "distribution": distribution,
+            "feature_means": {col: m.mean for col, m in self.features.items()},
+        }
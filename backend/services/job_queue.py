@@ -0,0 +1,577 @@
+# ======================================================
+# 🚀 ExoHabitAI — Local Scoring Job Queue
+# SQLite queue + process pool + per-chunk checkpoints
+#
+# Standalone worker (instead of the in-API runner):
+#     EXOHABITAI_JOB_RUNNER=0 python -m backend.app
+#     python -m backend.services.job_queue
+# ======================================================
+
+import os
+import json
+import time
+import uuid
+import shutil
+import socket
+import sqlite3
+import threading
+import multiprocessing
+from datetime import datetime, timezone
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+
+from backend.config import (
+    JOBS_DIR,
+    JOBS_DB_PATH,
+    JOB_WORKERS,
+    JOB_CHUNK_ROWS,
+    JOB_STALE_SECONDS,
+    JOB_MAX_ATTEMPTS,
+    JOB_POLL_SECONDS,
+    JOB_INPUT_ROOTS,
+)
+from backend.model_registry import get_snapshot
+from backend.services.prediction_service import score_records_ndjson
+from src.data_loader import count_data_rows, iter_record_chunks
+
+
+# Chunks in flight per pool worker (bounds parsed rows held in memory)
+_INFLIGHT_PER_WORKER = 2
+
+_local = threading.local()       # per-thread SQLite connection
+
+_pool = None
+_pool_lock = threading.Lock()
+
+_runner = None
+_runner_lock = threading.Lock()
+
+_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+
+# ======================================================
+# 💾 SQLITE QUEUE
+# ======================================================
+
+def _connection():
+    """One WAL-mode connection per thread (API threads + runner)."""
+
+    conn = getattr(_local, "conn", None)
+
+    if conn is None:
+        os.makedirs(JOBS_DIR, exist_ok=True)
+
+        conn = sqlite3.connect(JOBS_DB_PATH, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id              TEXT PRIMARY KEY,
+                status          TEXT NOT NULL,
+                source_path     TEXT NOT NULL,
+                format          TEXT,
+                chunk_rows      INTEGER NOT NULL,
+                total_rows      INTEGER,
+                attempts        INTEGER NOT NULL DEFAULT 0,
+                owner           TEXT,
+                error           TEXT,
+                created_at      REAL NOT NULL,
+                started_at      REAL,
+                run_started_at  REAL,
+                heartbeat_at    REAL,
+                finished_at     REAL,
+                model_version   TEXT
+            )
+            """
+        )
+
+        # Queues created before jobs pinned a model version
+        job_columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if "model_version" not in job_columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN model_version TEXT")
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chunks (
+                job_id          TEXT NOT NULL,
+                chunk_index     INTEGER NOT NULL,
+                rows            INTEGER NOT NULL,
+                scored          INTEGER NOT NULL,
+                seconds         REAL NOT NULL,
+                completed_at    REAL NOT NULL,
+                PRIMARY KEY (job_id, chunk_index)
+            )
+            """
+        )
+        conn.commit()
+        _local.conn = conn
+
+    return conn
+
+
+def _update_job(job_id: str, **fields):
+    conn = _connection()
+    assignments = ", ".join(f"{name} = ?" for name in fields)
+
+    conn.execute(
+        f"UPDATE jobs SET {assignments} WHERE id = ?",
+        (*fields.values(), job_id),
+    )
+    conn.commit()
+
+
+def _job_dir(job_id: str) -> str:
+    return os.path.join(JOBS_DIR, job_id)
+
+
+def _chunk_path(job_id: str, index: int) -> str:
+    return os.path.join(_job_dir(job_id), "chunks", f"{index:06d}.ndjson")
+
+
+def result_path(job_id: str) -> str:
+    return os.path.join(_job_dir(job_id), "results.ndjson")
+
+
+# ======================================================
+# 📥 SUBMISSION
+# ======================================================
+
+def _allowed_input(path: str) -> bool:
+    real = os.path.realpath(path)
+
+    return any(
+        os.path.commonpath([real, os.path.realpath(root)]) == os.path.realpath(root)
+        for root in JOB_INPUT_ROOTS
+    )
+
+
+def submit_job(path: str = None, records: list = None, upload=None, fmt: str = None,
+               model_version: str = None) -> dict:
+    """
+    Queue a scoring job. Exactly one input:
+    - path    : server-side CSV / NDJSON file (under JOB_INPUT_ROOTS)
+    - records : list of planet dicts (written as NDJSON)
+    - upload  : binary stream copied to disk in blocks
+
+    The whole job is scored with one model version: the given
+    one, else the version served at submission.
+
+    Raises ValueError for invalid input, LookupError for
+    unknown model versions.
+    """
+
+    if sum(x is not None for x in (path, records, upload)) != 1:
+        raise ValueError("provide exactly one of path, planets or an upload body")
+
+    if fmt not in (None, "csv", "ndjson"):
+        raise ValueError("format must be csv or ndjson")
+
+    model_version = get_snapshot(model_version).version
+
+    job_id = uuid.uuid4().hex[:16]
+    job_dir = _job_dir(job_id)
+
+    if path is not None:
+        if not _allowed_input(path) or not os.path.isfile(path):
+            raise ValueError(f"input file not found or not allowed: {path}")
+        source = os.path.realpath(path)
+
+    else:
+        os.makedirs(job_dir, exist_ok=True)
+
+        if records is not None:
+            fmt = "ndjson"
+            source = os.path.join(job_dir, "input.ndjson")
+            with open(source, "w", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+        else:
+            source = os.path.join(job_dir, f"input.{fmt or 'txt'}")
+            with open(source, "wb") as f:
+                shutil.copyfileobj(upload, f, 1 << 20)
+
+    conn = _connection()
+    conn.execute(
+        "INSERT INTO jobs (id, status, source_path, format, chunk_rows, created_at, model_version) "
+        "VALUES (?, 'queued', ?, ?, ?, ?, ?)",
+        (job_id, source, fmt, JOB_CHUNK_ROWS, time.time(), model_version),
+    )
+    conn.commit()
+
+    return get_job(job_id)
+
+
+# ======================================================
+# 📊 STATUS / PROGRESS
+# ======================================================
+
+def _iso(ts):
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def get_job(job_id: str):
+    """Job status + progress (rows, throughput, ETA) or None."""
+
+    conn = _connection()
+    job = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    if job is None:
+        return None
+
+    done = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(rows), 0), COALESCE(SUM(scored), 0) "
+        "FROM chunks WHERE job_id = ?",
+        (job_id,),
+    ).fetchone()
+
+    chunks_done, rows_done, scored = done
+    total = job["total_rows"]
+
+    # Throughput of the current (or last) run only: resumed chunks
+    # from an earlier attempt would inflate it
+    throughput = None
+    eta = None
+
+    if job["run_started_at"] is not None:
+        run_rows = conn.execute(
+            "SELECT COALESCE(SUM(rows), 0) FROM chunks "
+            "WHERE job_id = ? AND completed_at >= ?",
+            (job_id, job["run_started_at"]),
+        ).fetchone()[0]
+
+        end = job["finished_at"] or time.time()
+        elapsed = end - job["run_started_at"]
+
+        if run_rows and elapsed > 0:
+            throughput = run_rows / elapsed
+
+            if job["status"] == "running" and total:
+                eta = max(total - rows_done, 0) / throughput
+
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "format": job["format"],
+        "model_version": job["model_version"],
+        "attempts": job["attempts"],
+        "error": job["error"],
+        "created_at": _iso(job["created_at"]),
+        "started_at": _iso(job["started_at"]),
+        "finished_at": _iso(job["finished_at"]),
+        "progress": {
+            "rows_done": rows_done,
+            "rows_total": total,
+            "scored_rows": scored,
+            "invalid_rows": rows_done - scored,
+            "chunks_done": chunks_done,
+            "percent": round(100.0 * rows_done / total, 2) if total else None,
+            "throughput_rows_per_s": round(throughput, 1) if throughput else None,
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+        },
+    }
+
+
+def list_jobs(limit: int = 50) -> list:
+    rows = _connection().execute(
+        "SELECT id FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+    ).fetchall()
+
+    return [get_job(row["id"]) for row in rows]
+
+
+# ======================================================
+# 🧵 PROCESS POOL WORKERS
+# ======================================================
+
+def _score_chunk_to_file(path: str, records: list, offset: int, model_version: str):
+    """
+    Runs in a pool process. The chunk file appears atomically,
+    so a crash never leaves a half-written checkpoint.
+
+    Scores with the job's pinned version, not whatever this
+    worker loaded at pool start (workers run no model watcher).
+    """
+
+    start = time.perf_counter()
+    model = get_snapshot(model_version).model
+    text, scored = score_records_ndjson(records, offset, model, model_version=model_version)
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+    return len(records), scored, time.perf_counter() - start
+
+
+def _get_pool():
+    """
+    Spawned workers: forking a threaded Flask process is unsafe.
+    Every worker loads each job's model version once via the
+    registry (kept in its pinned-version LRU).
+    """
+
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=JOB_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+# ======================================================
+# 🏃 JOB EXECUTION (RESUMABLE)
+# ======================================================
+
+def _record_chunk(job_id: str, index: int, result):
+    rows, scored, seconds = result
+    conn = _connection()
+
+    conn.execute(
+        "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?, ?)",
+        (job_id, index, rows, scored, seconds, time.time()),
+    )
+    conn.execute("UPDATE jobs SET heartbeat_at = ? WHERE id = ?", (time.time(), job_id))
+    conn.commit()
+
+
+def _drain(job_id: str, pending: dict, return_when):
+    """Wait for in-flight chunks, checkpoint the finished ones."""
+
+    while pending:
+        finished, _ = wait(pending, return_when=return_when)
+
+        for future in finished:
+            index = pending.pop(future)
+            _record_chunk(job_id, index, future.result())
+
+        if return_when == FIRST_COMPLETED:
+            return
+
+
+def _merge_results(job_id: str, n_chunks: int):
+    """Concatenate chunk files in order into results.ndjson."""
+
+    final = result_path(job_id)
+    tmp = f"{final}.tmp"
+
+    with open(tmp, "wb") as out:
+        for index in range(n_chunks):
+            with open(_chunk_path(job_id, index), "rb") as f:
+                shutil.copyfileobj(f, out, 1 << 20)
+
+    os.replace(tmp, final)
+
+
+def run_job(job_id: str):
+    """
+    Score a claimed job. Chunks already checkpointed by an
+    earlier (crashed) attempt are parsed but not re-scored.
+    """
+
+    conn = _connection()
+    job = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    os.makedirs(os.path.dirname(_chunk_path(job_id, 0)), exist_ok=True)
+
+    if job["total_rows"] is None:
+        _update_job(job_id, total_rows=count_data_rows(job["source_path"], job["format"]))
+
+    model_version = job["model_version"]
+    if model_version is None:
+        # Queued before versions were pinned: pin the served one now
+        model_version = get_snapshot().version
+        _update_job(job_id, model_version=model_version)
+
+    done = {
+        row["chunk_index"]
+        for row in conn.execute("SELECT chunk_index FROM chunks WHERE job_id = ?", (job_id,))
+        if os.path.exists(_chunk_path(job_id, row["chunk_index"]))
+    }
+
+    pool = _get_pool()
+    max_inflight = JOB_WORKERS * _INFLIGHT_PER_WORKER
+    chunk_rows = job["chunk_rows"]
+    pending = {}
+    n_chunks = 0
+
+    try:
+        with open(job["source_path"], "r", encoding="utf-8", errors="ignore") as f:
+            for index, records in enumerate(iter_record_chunks(f, chunk_rows, job["format"])):
+                n_chunks = index + 1
+
+                if index in done:
+                    continue
+
+                if len(pending) >= max_inflight:
+                    _drain(job_id, pending, FIRST_COMPLETED)
+
+                future = pool.submit(
+                    _score_chunk_to_file, _chunk_path(job_id, index), records,
+                    index * chunk_rows, model_version,
+                )
+                pending[future] = index
+
+        _drain(job_id, pending, ALL_COMPLETED)
+
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    _merge_results(job_id, n_chunks)
+
+    _update_job(job_id, status="completed", finished_at=time.time(), error=None)
+    shutil.rmtree(os.path.dirname(_chunk_path(job_id, 0)), ignore_errors=True)
+
+
+def _claim_next_job():
+    """
+    Atomically take the oldest queued job, or a running job
+    whose runner stopped heart-beating (crashed process).
+    """
+
+    conn = _connection()
+    now = time.time()
+    claimable = "(status = 'queued' OR (status = 'running' AND heartbeat_at < ?))"
+
+    row = conn.execute(
+        f"SELECT id FROM jobs WHERE {claimable} ORDER BY created_at LIMIT 1",
+        (now - JOB_STALE_SECONDS,),
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    cursor = conn.execute(
+        f"""
+        UPDATE jobs
+        SET status = 'running', owner = ?, attempts = attempts + 1,
+            heartbeat_at = ?, run_started_at = ?, finished_at = NULL,
+            started_at = COALESCE(started_at, ?)
+        WHERE id = ? AND {claimable}
+        """,
+        (_OWNER, now, now, now, row["id"], now - JOB_STALE_SECONDS),
+    )
+    conn.commit()
+
+    if cursor.rowcount != 1:
+        return None  # another runner won the race
+
+    attempts = conn.execute(
+        "SELECT attempts FROM jobs WHERE id = ?", (row["id"],)
+    ).fetchone()[0]
+
+    if attempts > JOB_MAX_ATTEMPTS:
+        _update_job(row["id"], status="failed", finished_at=now,
+                    error=f"gave up after {JOB_MAX_ATTEMPTS} attempts")
+        return None
+
+    return row["id"]
+
+
+def _heartbeat(job_id: str, stop: threading.Event):
+    """
+    Keep the claim fresh for the whole run (row count, parsing,
+    scoring) so other runners never see it as stale.
+    """
+
+    while not stop.wait(JOB_STALE_SECONDS / 4):
+        try:
+            _update_job(job_id, heartbeat_at=time.time())
+        except sqlite3.Error as e:
+            print(f"⚠️ Job {job_id}: heartbeat failed: {e}")
+
+
+def _run_claimed(job_id: str):
+    stop = threading.Event()
+    beat = threading.Thread(target=_heartbeat, args=(job_id, stop), name="job-heartbeat", daemon=True)
+    beat.start()
+
+    try:
+        _run_attempt(job_id)
+    finally:
+        stop.set()
+        beat.join()
+
+
+def _run_attempt(job_id: str):
+    try:
+        run_job(job_id)
+
+    except BrokenProcessPool as e:
+        # A pool worker died: restart the pool, resume from checkpoints
+        print(f"⚠️ Job {job_id}: worker crashed ({e}), requeueing")
+        _reset_pool()
+        _update_job(job_id, status="queued", error=f"worker crashed: {e}")
+
+    except Exception as e:
+        attempts = _connection().execute(
+            "SELECT attempts FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()[0]
+
+        status = "failed" if attempts >= JOB_MAX_ATTEMPTS else "queued"
+        print(f"❌ Job {job_id} attempt {attempts} failed: {e}")
+        _update_job(job_id, status=status, error=str(e),
+                    finished_at=time.time() if status == "failed" else None)
+
+
+def run_forever():
+    """Runner loop: claim → score → repeat."""
+
+    while True:
+        try:
+            job_id = _claim_next_job()
+        except sqlite3.Error as e:
+            print(f"⚠️ Job queue unavailable: {e}")
+            job_id = None
+
+        if job_id is None:
+            time.sleep(JOB_POLL_SECONDS)
+            continue
+
+        print(f"🏃 Running scoring job {job_id}")
+        _run_claimed(job_id)
+
+
+def start_job_runner():
+    """Start the background runner thread (once per process)."""
+
+    global _runner
+
+    # Spawned pool workers re-import the main module: never
+    # let them start runners (and pools) of their own
+    if multiprocessing.parent_process() is not None:
+        return None
+
+    with _runner_lock:
+        if _runner is None:
+            _runner = threading.Thread(target=run_forever, name="job-runner", daemon=True)
+            _runner.start()
+
+    return _runner
+
+
+if __name__ == "__main__":
+    print(f"🚀 ExoHabitAI job worker {_OWNER} ({JOB_WORKERS} processes)")
+    run_forever()
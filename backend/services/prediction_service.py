@@ -1,11 +1,25 @@
 # backend/services/prediction_service.py
 
+import json
+import numpy as np
 import pandas as pd
 import math
+import threading
+from time import perf_counter
 
-from backend.model_registry import get_model
+from backend.config import COMPILED_FOREST_MAX_ROWS, METRICS_ENABLED, VALIDATION_RULES
+from backend.metrics import PREDICT_STAGE_SECONDS
+from backend.model_registry import get_model, get_compiled_model
 from src.week2_cleaning import clean_data
 from src.week2_feature_engineering import add_engineered_features
+from src.scoring_kernels import (
+    ORBIT_IDEAL,
+    ORBIT_NEUTRAL,
+    FUSION_WEIGHTS,
+    FUSION_BOOST,
+    orbit_stability_into,
+    fusion_into,
+)
 
 
 # =====================================================
@@ -34,6 +48,177 @@ def align_features_to_model(df: pd.DataFrame, model):
     return df
 
 
+# =====================================================
+# ⏱️ STAGE TIMERS (/metrics)
+# =====================================================
+
+def _stage_timers(path: str, stages) -> dict:
+    """Histogram children resolved once: observing is the only per-call cost."""
+    return {stage: PREDICT_STAGE_SECONDS.labels(path, stage) for stage in stages}
+
+
+_FULL_STAGES = _stage_timers(
+    "full", ("clean_data", "feature_engineering", "alignment", "predict_proba", "fusion")
+)
+_FAST_STAGES = _stage_timers("fast", ("features", "predict_proba", "fusion"))
+_BATCH_STAGES = _stage_timers(
+    "batch", ("clean_data", "feature_engineering", "alignment", "predict_proba", "fusion")
+)
+
+
+def _lap(timers: dict, stage: str, start: float) -> float:
+    """Record start → now for a stage; returns now (next stage's start)."""
+
+    now = perf_counter()
+    if METRICS_ENABLED:
+        timers[stage].observe(now - start)
+    return now
+
+
+# =====================================================
+# 🌲 MODEL PROBABILITY (COMPILED OR SKLEARN)
+# =====================================================
+
+def positive_proba(model, X) -> np.ndarray:
+    """
+    Habitable-class probabilities for model-aligned rows.
+
+    Small batches use the flat-array compiled forest; large
+    ones (or uncompilable models) use sklearn.
+    """
+
+    if len(X) <= COMPILED_FOREST_MAX_ROWS:
+        compiled = get_compiled_model(model)
+        if compiled is not None:
+            return compiled.predict_proba(X)[:, 1]
+
+    return np.asarray(model.predict_proba(X))[:, 1]
+
+
+# =====================================================
+# ⚡ FEATURE-ORDER PLAN (FAST PATH)
+# =====================================================
+
+# Raw inputs read by create_hsi / create_sci
+SCIENCE_INPUTS = frozenset({"pl_rade", "pl_eqt", "st_teff", "st_mass", "st_rad"})
+
+
+class FastPathUnsupported(Exception):
+    """Raised when a payload / model must go through predict_planet."""
+
+
+class FeaturePlan:
+    """
+    Column layout of the model input, computed ONCE per loaded model.
+
+    Holds:
+    - expected feature order
+    - slot index for every expected column
+    - imputer column mask (Pipeline[SimpleImputer, estimator] models)
+    - the final estimator called with a plain float64 row
+
+    Rows never contain NaN (clean_data semantics), so the median
+    imputer only matters through the columns it drops.
+    """
+
+    __slots__ = ("model", "columns", "slots", "keep_mask", "estimator")
+
+    def __init__(self, model):
+
+        expected_cols = list(getattr(model, "feature_names_in_", []))
+        if not expected_cols:
+            raise FastPathUnsupported("model does not expose feature_names_in_")
+
+        steps = list(model.named_steps.values()) if hasattr(model, "named_steps") else [model]
+        *pre_steps, estimator = steps
+
+        if len(pre_steps) > 1:
+            raise FastPathUnsupported("only Pipeline[SimpleImputer, estimator] is planned")
+
+        keep_mask = None
+
+        for step in pre_steps:
+            if type(step).__name__ != "SimpleImputer":
+                raise FastPathUnsupported(f"unsupported pipeline step: {type(step).__name__}")
+
+            keep_mask = ~np.isnan(np.asarray(step.statistics_, dtype=np.float64))
+            if getattr(step, "keep_empty_features", False) or keep_mask.all():
+                keep_mask = None
+
+        if not hasattr(estimator, "predict_proba"):
+            raise FastPathUnsupported("final estimator has no predict_proba")
+
+        self.model = model
+        self.columns = tuple(expected_cols)
+        self.slots = {col: i for i, col in enumerate(expected_cols)}
+        self.keep_mask = keep_mask
+        self.estimator = estimator
+
+
+# id(model) -> FeaturePlan, one per served / pinned model version
+_plans = {}
+_plan_lock = threading.Lock()
+_row_buffers = threading.local()
+
+# Plans kept before the table is rebuilt (registry holds few versions)
+_MAX_PLANS = 16
+
+
+def get_feature_plan(model) -> FeaturePlan:
+    """
+    Returns the FeaturePlan for a model.
+    Built on first use of every model object the registry serves.
+    """
+
+    plan = _plans.get(id(model))
+    if plan is not None and plan.model is model:
+        return plan
+
+    with _plan_lock:
+        plan = _plans.get(id(model))
+
+        if plan is None or plan.model is not model:
+            if len(_plans) >= _MAX_PLANS:
+                _plans.clear()
+            plan = FeaturePlan(model)
+            _plans[id(model)] = plan
+
+    return plan
+
+
+def _row_buffer(n_features: int) -> np.ndarray:
+    """Per-thread preallocated (1, n_features) float64 row."""
+
+    row = getattr(_row_buffers, "row", None)
+
+    if row is None or row.shape[1] != n_features:
+        row = np.zeros((1, n_features), dtype=np.float64)
+        _row_buffers.row = row
+
+    return row
+
+
+def _as_float(value) -> float:
+    """
+    Scalar twin of clean_data: numeric → float, missing / inf → 0.
+    Anything pandas would coerce differently goes to the slow path.
+    """
+
+    if value is None:
+        return 0.0
+
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise FastPathUnsupported(f"non-numeric value: {value!r}")
+
+    value = float(value)
+    return value if math.isfinite(value) else 0.0
+
+
+def _score(x: float, ideal: float, scale: float) -> float:
+    """Scalar safe_score (same operation order as the pandas version)."""
+    return min(max(1 - (abs(x - ideal) / scale), 0.0), 1.0)
+
+
 # =====================================================
 # 🌌 QUANTUM ORBITAL STABILITY INDEX (NEW)
 # =====================================================
@@ -47,10 +232,9 @@ def orbital_stability_score(data: dict):
     orb = float(data.get("pl_orbper", 0) or 0)
 
     if orb == 0:
-        return 0.5  # neutral
+        return ORBIT_NEUTRAL
 
-    ideal = 365
-    scale = 600
+    ideal, scale = ORBIT_IDEAL
 
     score = 1 - abs(orb - ideal) / scale
     return max(0.0, min(1.0, score))
@@ -76,18 +260,20 @@ def quantum_neural_fusion(model_prob, hsi, sci, orbit_score):
     sci = max(0, min(1, sci))
     orbit_score = max(0, min(1, orbit_score))
 
+    w_model, w_hsi, w_sci, w_orbit = FUSION_WEIGHTS
+
     base_score = (
-        0.35 * model_prob +
-        0.30 * hsi +
-        0.20 * sci +
-        0.15 * orbit_score
+        w_model * model_prob +
+        w_hsi * hsi +
+        w_sci * sci +
+        w_orbit * orbit_score
     )
 
     # --------------------------------------------------
     # ⭐ QUANTUM BOOST CURVE (NON-LINEAR ENHANCEMENT)
     # --------------------------------------------------
     # Boost high-quality planets more aggressively
-    quantum_score = math.pow(base_score, 0.85)
+    quantum_score = math.pow(base_score, FUSION_BOOST)
 
     return round(float(quantum_score), 4)
 
@@ -96,19 +282,23 @@ def quantum_neural_fusion(model_prob, hsi, sci, orbit_score):
 # 🚀 FINAL QUANTUM HABITABILITY ENGINE
 # =====================================================
 
-def predict_planet(data: dict):
+def predict_planet(data: dict, model=None):
 
-    model = get_model()
+    model = model if model is not None else get_model()
 
     if not data:
         raise ValueError("Empty input data provided")
 
+    start = perf_counter()
+
     # --------------------------------------------------
     # Build dataframe
     # --------------------------------------------------
     df = pd.DataFrame([data])
 
     df = clean_data(df)
+    start = _lap(_FULL_STAGES, "clean_data", start)
+
     df = add_engineered_features(df)
 
     # --------------------------------------------------
@@ -118,17 +308,20 @@ def predict_planet(data: dict):
     sci = float(df["SCI"].iloc[0]) if "SCI" in df.columns else 0.0
 
     orbit_score = orbital_stability_score(data)
+    start = _lap(_FULL_STAGES, "feature_engineering", start)
 
     # --------------------------------------------------
     # Align to ML model schema
     # --------------------------------------------------
     df_model = align_features_to_model(df.copy(), model)
+    start = _lap(_FULL_STAGES, "alignment", start)
 
     # --------------------------------------------------
     # ML Prediction
     # --------------------------------------------------
     prediction = int(model.predict(df_model)[0])
     model_prob = float(model.predict_proba(df_model)[0][1])
+    start = _lap(_FULL_STAGES, "predict_proba", start)
 
     # --------------------------------------------------
     # 🌌 QUANTUM HABITABILITY SCORE
@@ -142,6 +335,7 @@ def predict_planet(data: dict):
 
     # Dynamic threshold (Quantum Decision Layer)
     prediction = 1 if final_score >= 0.58 else 0
+    _lap(_FULL_STAGES, "fusion", start)
 
     # --------------------------------------------------
     # Dashboard Response
@@ -155,4 +349,321 @@ def predict_planet(data: dict):
             "SCI": round(sci, 4),
             "orbit_stability": round(orbit_score, 4),
         },
-    }
\ No newline at end of file
+    }
+
+# =====================================================
+# ⚡ PANDAS-FREE SINGLE-ROW FAST PATH
+# =====================================================
+
+def _predict_planet_fast(data: dict, model):
+    start = perf_counter()
+    plan = get_feature_plan(model)
+
+    values = {
+        key: _as_float(value)
+        for key, value in data.items()
+        if key in plan.slots or key in SCIENCE_INPUTS
+    }
+
+    # --------------------------------------------------
+    # Science features (scalar twins of create_hsi / create_sci)
+    # --------------------------------------------------
+    hsi = (
+        _score(values.get("pl_rade", 0.0), 1.0, 1.5)
+        + _score(values.get("pl_eqt", 0.0), 288, 200)
+    ) / 2
+
+    sci = (
+        _score(values.get("st_teff", 0.0), 5778, 2500)
+        + _score(values.get("st_mass", 0.0), 1.0, 1.0)
+        + _score(values.get("st_rad", 0.0), 1.0, 1.0)
+    ) / 3
+
+    values["HSI"] = hsi
+    values["SCI"] = sci
+
+    orbit_score = orbital_stability_score(data)
+
+    # --------------------------------------------------
+    # Fill preallocated row in model feature order
+    # --------------------------------------------------
+    row = _row_buffer(len(plan.columns))
+    row.fill(0.0)
+
+    slots = plan.slots
+    for key, value in values.items():
+        idx = slots.get(key)
+        if idx is not None:
+            row[0, idx] = value
+
+    start = _lap(_FAST_STAGES, "features", start)
+
+    # --------------------------------------------------
+    # ONE forest traversal
+    # --------------------------------------------------
+    compiled = get_compiled_model(model)
+
+    if compiled is not None:
+        model_prob = float(compiled.predict_proba(row)[0, 1])
+    else:
+        X = row if plan.keep_mask is None else row[:, plan.keep_mask]
+        model_prob = float(plan.estimator.predict_proba(X)[0][1])
+
+    start = _lap(_FAST_STAGES, "predict_proba", start)
+
+    final_score = quantum_neural_fusion(
+        model_prob,
+        hsi,
+        sci,
+        orbit_score
+    )
+
+    prediction = 1 if final_score >= 0.58 else 0
+    _lap(_FAST_STAGES, "fusion", start)
+
+    return {
+        "prediction": prediction,
+        "habitability_score": final_score,
+        "insights": {
+            "model_probability": round(model_prob, 4),
+            "HSI": round(hsi, 4),
+            "SCI": round(sci, 4),
+            "orbit_stability": round(orbit_score, 4),
+        },
+    }
+
+
+def predict_planet_fast(data: dict, model=None):
+    """
+    Low-latency twin of predict_planet.
+
+    - no DataFrame / df.copy() / pd.to_numeric
+    - feature order planned once per model load
+    - preallocated float64 row
+    - single predict_proba call
+
+    Outputs are bit-identical to predict_planet; payloads the
+    fast path cannot reproduce exactly fall back to it.
+    """
+
+    if not data:
+        raise ValueError("Empty input data provided")
+
+    model = model if model is not None else get_model()
+
+    try:
+        return _predict_planet_fast(data, model)
+    except FastPathUnsupported:
+        return predict_planet(data, model)
+
+
+# =====================================================
+# 📦 VECTORIZED BATCH ENGINE
+# =====================================================
+
+def score_components(df: pd.DataFrame, model=None):
+    """
+    Vectorized scoring of a raw-input DataFrame
+    (served model unless a pinned model is passed).
+
+    Returns float64 arrays (model_prob, hsi, sci, orbit, final),
+    unrounded, one entry per row in frame order.
+    """
+
+    model = model if model is not None else get_model()
+    start = perf_counter()
+
+    df = clean_data(df)
+    start = _lap(_BATCH_STAGES, "clean_data", start)
+
+    df = add_engineered_features(df)
+
+    n_rows = len(df)
+
+    hsi = df["HSI"].to_numpy(dtype=np.float64) if "HSI" in df.columns else np.zeros(n_rows)
+    sci = df["SCI"].to_numpy(dtype=np.float64) if "SCI" in df.columns else np.zeros(n_rows)
+
+    orbper = df["pl_orbper"].to_numpy(dtype=np.float64) if "pl_orbper" in df.columns else 0.0
+    orbit_score = orbit_stability_into(orbper, out=np.empty(n_rows))
+    start = _lap(_BATCH_STAGES, "feature_engineering", start)
+
+    # --------------------------------------------------
+    # Single forest traversal for the whole batch
+    # --------------------------------------------------
+    df_model = align_features_to_model(df, model)
+    start = _lap(_BATCH_STAGES, "alignment", start)
+
+    model_prob = positive_proba(model, df_model).astype(np.float64)
+    start = _lap(_BATCH_STAGES, "predict_proba", start)
+
+    final_score = fusion_into(
+        model_prob,
+        hsi,
+        sci,
+        orbit_score,
+        out=np.empty(n_rows),
+        scratch=np.empty(n_rows),
+    )
+    _lap(_BATCH_STAGES, "fusion", start)
+
+    return model_prob, hsi, sci, orbit_score, final_score
+
+
+def predict_planets_batch(records: list, model=None):
+    """
+    Score many planets in ONE vectorized pass.
+
+    Same maths as predict_planet, but:
+    - one DataFrame for the whole batch
+    - one clean_data / add_engineered_features call
+    - one predict_proba forest traversal
+
+    Records must already be validated.
+    Results are returned in input order.
+    """
+
+    if not records:
+        return []
+
+    # --------------------------------------------------
+    # Build dataframe (one row per planet)
+    # --------------------------------------------------
+    df = pd.DataFrame.from_records(records)
+
+    model_prob, hsi, sci, orbit_score, final_score = score_components(df, model)
+
+    # --------------------------------------------------
+    # Per-row dashboard responses (input order)
+    # --------------------------------------------------
+    results = []
+
+    for prob, h, s, o, score in zip(
+        model_prob.tolist(),
+        hsi.tolist(),
+        sci.tolist(),
+        orbit_score.tolist(),
+        final_score.tolist(),
+    ):
+        score = round(score, 4)
+
+        results.append({
+            "prediction": 1 if score >= 0.58 else 0,
+            "habitability_score": score,
+            "insights": {
+                "model_probability": round(prob, 4),
+                "HSI": round(h, 4),
+                "SCI": round(s, 4),
+                "orbit_stability": round(o, 4),
+            },
+        })
+
+    return results
+
+
+# =====================================================
+# 🧾 BATCH VALIDATION + NDJSON CHUNKS
+# (/predict/batch, /predict/stream, scoring jobs)
+# =====================================================
+
+def model_feature_columns(model=None) -> tuple:
+    """Input columns the model reads (served model unless given)."""
+
+    if model is None:
+        model = get_model()
+
+    return tuple(getattr(model, "feature_names_in_", ()))
+
+
+def validate_batch(records: list, model=None):
+    """
+    Vectorized validation for /predict/batch, /predict/stream
+    and scoring jobs.
+
+    VALIDATION_RULES inputs must be numeric and in range; any
+    other model input column must be numeric or null (nulls
+    go to the imputer). Model: served unless given.
+
+    Returns:
+    - valid_mask : bool array (True = row can be scored)
+    - row_errors : {row_index: [errors]} for rejected rows only
+    """
+
+    n_rows = len(records)
+    valid_mask = np.ones(n_rows, dtype=bool)
+    row_errors = {}
+
+    def reject(mask, message):
+        for idx in np.flatnonzero(mask):
+            row_errors.setdefault(int(idx), []).append(message)
+        valid_mask[mask] = False
+
+    is_object = np.fromiter(
+        (isinstance(r, dict) for r in records), dtype=bool, count=n_rows
+    )
+    reject(~is_object, "planet must be a JSON object")
+
+    is_empty = np.fromiter(
+        (isinstance(r, dict) and len(r) == 0 for r in records), dtype=bool, count=n_rows
+    )
+    reject(is_empty, "Empty input data provided")
+
+    rows = [r if isinstance(r, dict) else {} for r in records]
+    frame = pd.DataFrame.from_records(rows, index=range(n_rows))
+
+    for key, (min_v, max_v) in VALIDATION_RULES.items():
+        if key not in frame.columns:
+            continue
+
+        present = np.fromiter((key in r for r in rows), dtype=bool, count=n_rows)
+        values = pd.to_numeric(frame[key], errors="coerce").to_numpy(dtype=np.float64)
+
+        not_numeric = present & np.isnan(values)
+        reject(not_numeric, f"{key} must be numeric")
+
+        with np.errstate(invalid="ignore"):
+            out_of_range = present & ~not_numeric & ((values < min_v) | (values > max_v))
+        reject(out_of_range, f"{key} outside scientific range [{min_v},{max_v}]")
+
+    # Other model inputs: a string here would crash the float cast
+    for key in model_feature_columns(model):
+        if key in VALIDATION_RULES or key not in frame.columns:
+            continue
+
+        column = frame[key]
+        not_numeric = column.notna() & pd.to_numeric(column, errors="coerce").isna()
+        reject(not_numeric.to_numpy(), f"{key} must be numeric")
+
+    return valid_mask, row_errors
+
+
+def score_records_ndjson(chunk: list, offset: int, model=None, model_version: str = None):
+    """
+    Validate + score one chunk of planets (served model unless
+    a pinned model is passed). Rows with non-numeric model
+    inputs become invalid_input lines; the stream goes on.
+    model_version, if given, is written on every scored line.
+    Returns (ndjson_text, scored_count); row indexes start at offset.
+    """
+
+    valid_mask, row_errors = validate_batch(chunk, model)
+    valid_idx = np.flatnonzero(valid_mask)
+
+    scored = predict_planets_batch([chunk[i] for i in valid_idx], model)
+    scored_by_row = dict(zip(valid_idx.tolist(), scored))
+
+    lines = []
+
+    for idx in range(len(chunk)):
+        if idx in scored_by_row:
+            row = {"index": offset + idx, "status": "success", **scored_by_row[idx]}
+            if model_version is not None:
+                row["model_version"] = model_version
+        else:
+            row = {
+                "index": offset + idx,
+                "status": "invalid_input",
+                "errors": row_errors.get(idx, []),
+            }
+        lines.append(json.dumps(row))
+
+    return "\n".join(lines) + "\n", len(scored)
@@ -1,7 +1,7 @@
-import os
 import pandas as pd
 
 from backend.config import RANKED_DATA_PATH
+from backend.services.catalog import get_ranked_catalog, read_catalog
 
 
 # =====================================================
@@ -10,21 +10,23 @@ from backend.config import RANKED_DATA_PATH
 
 def load_ranked_dataset():
     """
-    Loads ranked exoplanet dataset safely.
+    Loads ranked exoplanet dataset safely (uncached parse).
     Prevents crashes if file missing.
     """
 
-    if not os.path.exists(RANKED_DATA_PATH):
-        raise FileNotFoundError(
-            f"Ranked dataset not found at: {RANKED_DATA_PATH}"
-        )
+    return read_catalog(RANKED_DATA_PATH)
+
 
-    df = pd.read_csv(RANKED_DATA_PATH)
+def get_ranked_dataset() -> pd.DataFrame:
+    """
+    Cached ranked dataset shared by /rank, /stats and warm-up.
 
-    if df.empty:
-        raise ValueError("Ranked dataset is empty")
+    Served from the process-wide catalog (services/catalog.py):
+    re-parsed in the background only when the file's mtime or
+    size changes. Callers must not mutate the returned frame.
+    """
 
-    return df
+    return get_ranked_catalog().frame()
 
 
 # =====================================================
@@ -43,7 +45,7 @@ def get_ranked_planets(limit: int = 20):
     """
 
     try:
-        df = load_ranked_dataset()
+        df = get_ranked_dataset()
 
         # --------------------------------------------------
         # Ensure important columns exist
@@ -0,0 +1,313 @@
+# ======================================================
+# 🚀 ExoHabitAI — Shadow Scoring
+# Candidate models score live /predict traffic off the
+# request path; only aggregates are kept
+#
+# - /predict answers from the served model, then hands the
+#   validated payload + its result to a bounded queue
+# - one background thread drains it in batches and scores
+#   every shadow version (one forest pass per version)
+# - a full queue DROPS the request: shadow work never
+#   slows primary responses down
+# - the version list lives in SHADOW_CONFIG_PATH once set via
+#   POST /model/shadow: every worker applies it
+# ======================================================
+
+import os
+import json
+import time
+import queue
+import threading
+
+from backend.config import (
+    MODEL_WATCH_INTERVAL_SECONDS,
+    SHADOW_CONFIG_PATH,
+    SHADOW_MODEL_VERSIONS,
+    SHADOW_QUEUE_MAX,
+    SHADOW_MAX_BATCH,
+)
+from backend.metrics import Histogram
+from backend.model_registry import get_snapshot
+from backend.services.prediction_service import predict_planets_batch
+
+
+# |shadow - primary| habitability score
+DELTA_BUCKETS = (0.001, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+
+# Shadow model pass per drained batch (ms)
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 1000)
+
+
+# ======================================================
+# 📊 PER-VERSION AGGREGATE (BOUNDED)
+# ======================================================
+
+class ShadowStats:
+    """Running counters + fixed-bucket histograms for one shadow version."""
+
+    def __init__(self, version: str):
+        self.version = version
+        self.compared = 0
+        self.agreements = 0
+        self.errors = 0
+        self.last_error = None
+        self.delta_sum = 0.0
+        self.max_abs_delta = 0.0
+
+        self.abs_delta = Histogram(
+            "shadow_abs_score_delta", DELTA_BUCKETS,
+            f"|habitability score| difference of {version} vs primary",
+        )
+        self.latency_ms = Histogram(
+            "shadow_batch_latency_ms", LATENCY_BUCKETS_MS,
+            f"Scoring pass of {version} per drained batch (ms)",
+        )
+
+    def record(self, primary: list, shadow: list):
+        for p, s in zip(primary, shadow):
+            delta = s["habitability_score"] - p["habitability_score"]
+
+            self.compared += 1
+            self.agreements += s["prediction"] == p["prediction"]
+            self.delta_sum += delta
+            self.max_abs_delta = max(self.max_abs_delta, abs(delta))
+            self.abs_delta.observe(abs(delta))
+
+    def snapshot(self) -> dict:
+        return {
+            "version": self.version,
+            "compared": self.compared,
+            "agreement_rate": round(self.agreements / self.compared, 4) if self.compared else None,
+            "mean_score_delta": round(self.delta_sum / self.compared, 6) if self.compared else None,
+            "max_abs_score_delta": round(self.max_abs_delta, 6),
+            "abs_score_delta": self.abs_delta.snapshot(),
+            "latency_ms": self.latency_ms.snapshot(),
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+# ======================================================
+# 👥 SHADOW SCORER
+# ======================================================
+
+class ShadowScorer:
+    """
+    Bounded queue + drain thread.
+
+    submit() never blocks; the worker scores up to max_batch
+    queued requests per pass with every shadow version.
+    """
+
+    def __init__(self, versions, max_queue: int, max_batch: int):
+        self.max_batch = max(1, int(max_batch))
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._dropped = 0
+
+        self.set_versions(versions)
+
+        self._thread = threading.Thread(target=self._run, name="shadow-scoring", daemon=True)
+        self._thread.start()
+
+    # --------------------------------------------------
+    # Configuration
+    # --------------------------------------------------
+    def set_versions(self, versions):
+        """Replace the shadow versions (resets their statistics)."""
+
+        with self._lock:
+            self.versions = tuple(dict.fromkeys(versions))
+            self._stats = {v: ShadowStats(v) for v in self.versions}
+
+    # --------------------------------------------------
+    # Request side (non-blocking)
+    # --------------------------------------------------
+    def submit(self, data: dict, result: dict, primary_version: str) -> bool:
+        """Queue one scored request; False when dropped (queue full)."""
+
+        if not self.versions:
+            return False
+
+        try:
+            self._queue.put_nowait((data, result, primary_version))
+            self._submitted += 1
+            return True
+        except queue.Full:
+            self._dropped += 1
+            return False
+
+    # --------------------------------------------------
+    # Worker side
+    # --------------------------------------------------
+    def _collect(self):
+        batch = [self._queue.get()]
+
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+
+            with self._lock:
+                stats = dict(self._stats)
+
+            for version, version_stats in stats.items():
+                # Shadowing the served version compares it with itself
+                rows = [item for item in batch if item[2] != version]
+                if rows:
+                    self._score(version_stats, rows)
+
+    def _score(self, stats: ShadowStats, rows: list):
+        try:
+            model = get_snapshot(stats.version).model
+
+            start = time.perf_counter()
+            shadow = predict_planets_batch([data for data, _, _ in rows], model)
+            stats.latency_ms.observe((time.perf_counter() - start) * 1000)
+
+            stats.record([result for _, result, _ in rows], shadow)
+
+        except Exception as e:
+            stats.errors += len(rows)
+            stats.last_error = str(e)
+
+    def stats(self) -> dict:
+        with self._lock:
+            versions = [s.snapshot() for s in self._stats.values()]
+
+        offered = self._submitted + self._dropped
+
+        return {
+            "versions": versions,
+            "queued": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "submitted": self._submitted,
+            "dropped": self._dropped,
+            "drop_rate": round(self._dropped / offered, 4) if offered else 0.0,
+        }
+
+
+# ======================================================
+# ⭐ PROCESS-WIDE INSTANCE
+# ======================================================
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def get_shadow_scorer() -> ShadowScorer:
+    """Lazily started singleton (one drain thread per worker)."""
+
+    global _scorer
+
+    if _scorer is not None:
+        return _scorer
+
+    with _scorer_lock:
+        if _scorer is None:
+            _scorer = ShadowScorer(SHADOW_MODEL_VERSIONS, SHADOW_QUEUE_MAX, SHADOW_MAX_BATCH)
+
+    return _scorer
+
+
+# ======================================================
+# 🔄 SHARED CONFIGURATION (ALL WORKERS)
+# Pre-fork workers each hold their own scorer: POST writes
+# the versions to a file, every worker applies it when its
+# signature changes (like the model watcher)
+# ======================================================
+
+_config_signature = None
+_config_checked_at = float("-inf")
+_config_lock = threading.Lock()
+
+
+def _config_file_signature():
+    try:
+        stat = os.stat(SHADOW_CONFIG_PATH)
+    except OSError:
+        return None
+
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def read_shadow_config():
+    """Versions stored by POST /model/shadow, or None (no / unreadable file)."""
+
+    try:
+        with open(SHADOW_CONFIG_PATH, "r", encoding="utf-8") as f:
+            versions = json.load(f)["versions"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if not isinstance(versions, list) or not all(isinstance(v, str) for v in versions):
+        return None
+
+    return versions
+
+
+def write_shadow_config(versions):
+    """Publish the shadow versions to every worker (atomic replace)."""
+
+    os.makedirs(os.path.dirname(SHADOW_CONFIG_PATH), exist_ok=True)
+    tmp = f"{SHADOW_CONFIG_PATH}.{os.getpid()}.tmp"
+
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"versions": list(versions), "updated_at": time.time()}, f, indent=2)
+
+    os.replace(tmp, SHADOW_CONFIG_PATH)
+    sync_shadow_config(force=True)
+
+
+def sync_shadow_config(force: bool = False):
+    """
+    Apply the shared configuration if the file changed since
+    this worker last read it. Throttled to one os.stat() per
+    MODEL_WATCH_INTERVAL_SECONDS unless forced.
+    """
+
+    global _config_signature, _config_checked_at
+
+    now = time.monotonic()
+    if not force and now - _config_checked_at < MODEL_WATCH_INTERVAL_SECONDS:
+        return
+
+    with _config_lock:
+        _config_checked_at = now
+        signature = _config_file_signature()
+
+        if signature is None or signature == _config_signature:
+            return
+
+        versions = read_shadow_config()
+        if versions is None:
+            return                      # half-written / foreign file: keep the current config
+
+        _config_signature = signature
+        get_shadow_scorer().set_versions(versions)
+
+
+def shadow_enabled() -> bool:
+    """Cheap check for the request path (no thread started)."""
+
+    sync_shadow_config()
+
+    if _scorer is not None:
+        return bool(_scorer.versions)
+    return bool(SHADOW_MODEL_VERSIONS)
+
+
+def submit_shadow(data: dict, result: dict, primary_version: str):
+    """Hand a served /predict request to the shadow models (never blocks)."""
+
+    if shadow_enabled():
+        get_shadow_scorer().submit(data, result, primary_version)
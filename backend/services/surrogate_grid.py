@@ -0,0 +1,429 @@
+# ======================================================
+# 🚀 ExoHabitAI — Surrogate Lookup Grid
+# Precomputed fused scores over the /predict input box,
+# answered by multilinear interpolation (approximate mode)
+#
+# Built on the first approximate request after a model
+# swap, never eagerly (EXOHABITAI_SURROGATE_GRID=0: never)
+#
+# Offline build:
+#     python -m backend.services.surrogate_grid
+# ======================================================
+
+import os
+import json
+import time
+import bisect
+import itertools
+import threading
+
+import numpy as np
+import pandas as pd
+
+from backend.config import (
+    VALIDATION_RULES,
+    SURROGATE_GRID_AXES,
+    SURROGATE_GRID_PATH,
+    SURROGATE_ERROR_SAMPLES,
+    SURROGATE_GRID_ENABLED,
+)
+from backend.model_registry import get_snapshot, register_reload_hook
+from backend.services.prediction_service import model_feature_columns, score_components
+from src.scoring_kernels import (
+    RADIUS_IDEAL,
+    EQT_IDEAL,
+    TEFF_IDEAL,
+    MASS_IDEAL,
+    STAR_RADIUS_IDEAL,
+    ORBIT_IDEAL,
+)
+
+
+# Grid rows scored per forest pass while building
+_BUILD_CHUNK_ROWS = 100_000
+
+# (ideal, scale) of the distance-from-ideal score on each input:
+# its kinks (ideal, ideal ± scale) are always grid nodes, so the
+# HSI / SCI / orbit terms interpolate exactly
+_SCORE_KNOTS = {
+    "pl_rade": RADIUS_IDEAL,
+    "pl_eqt": EQT_IDEAL,
+    "pl_orbper": ORBIT_IDEAL,
+    "st_teff": TEFF_IDEAL,
+    "st_mass": MASS_IDEAL,
+    "st_rad": STAR_RADIUS_IDEAL,
+}
+
+_grid = None
+_grid_lock = threading.Lock()
+
+_building = None             # model version being built, if any
+_build_lock = threading.Lock()
+
+
+# ======================================================
+# 📐 AXES
+# ======================================================
+
+def _spaced(lo: float, hi: float, points: int, spacing: str, name: str) -> np.ndarray:
+    if spacing == "log":
+        return np.geomspace(lo, hi, points)
+    if spacing == "log1p":
+        return np.expm1(np.linspace(np.log1p(lo), np.log1p(hi), points))
+    if spacing == "linear":
+        return np.linspace(lo, hi, points)
+
+    raise ValueError(f"unknown grid spacing for {name}: {spacing}")
+
+
+def axis_nodes(name: str, points: int, spacing: str, refine=None) -> np.ndarray:
+    """
+    Grid nodes of one input over its VALIDATION_RULES range.
+    refine=(lo, hi, points) adds a linear band of extra nodes
+    (multi-resolution: dense where the score changes fast);
+    score kinks are added on top.
+    """
+
+    lo, hi = VALIDATION_RULES[name]
+    nodes = _spaced(lo, hi, points, spacing, name)
+
+    if refine is not None:
+        band_lo, band_hi, band_points = refine
+        nodes = np.concatenate([nodes, np.linspace(band_lo, band_hi, band_points)])
+
+    if name in _SCORE_KNOTS:
+        ideal, scale = _SCORE_KNOTS[name]
+        nodes = np.concatenate([nodes, [ideal - scale, ideal, ideal + scale]])
+
+    return np.unique(np.clip(nodes, lo, hi))
+
+
+def _metadata_path(grid_path: str) -> str:
+    return os.path.splitext(grid_path)[0] + ".json"
+
+
+# ======================================================
+# 🧮 GRID + INTERPOLATION
+# ======================================================
+
+class SurrogateGrid:
+    """
+    Fused habitability score on a rectilinear grid.
+
+    interpolate() blends the 2^d surrounding nodes
+    (multilinear), fully vectorized over query rows.
+    """
+
+    def __init__(self, names, axes, values, meta: dict):
+        self.names = tuple(names)
+        self.axes = [np.asarray(a, dtype=np.float64) for a in axes]
+        self.values = values
+        self.meta = meta
+
+        self._flat = values.reshape(-1)
+
+        strides = np.asarray(values.strides, dtype=np.int64) // values.itemsize
+        corners = np.asarray(list(itertools.product((0, 1), repeat=len(self.axes))), dtype=bool)
+
+        self._strides = strides
+        self._corner_offsets = corners.astype(np.int64) @ strides   # (2^d,)
+        self._corner_bits = corners                                 # (2^d, d)
+
+        # Plain lists for the single-point path (bisect beats NumPy at n=1)
+        self._node_lists = [a.tolist() for a in self.axes]
+        self._stride_list = strides.tolist()
+
+    @property
+    def model_version(self) -> str:
+        return self.meta["model_version"]
+
+    def interpolate_one(self, point) -> float:
+        """Single query point (self.names order), ~10x less overhead."""
+
+        base = 0
+        frac = []
+
+        for nodes, stride, x in zip(self._node_lists, self._stride_list, point):
+            i = min(max(bisect.bisect_right(nodes, x) - 1, 0), len(nodes) - 2)
+            lo, hi = nodes[i], nodes[i + 1]
+
+            frac.append(min(max((x - lo) / (hi - lo), 0.0), 1.0))
+            base += i * stride
+
+        frac = np.asarray(frac)
+        weights = np.where(self._corner_bits, frac, 1.0 - frac).prod(axis=1)
+
+        return float(self._flat[base + self._corner_offsets] @ weights)
+
+    def interpolate(self, points) -> np.ndarray:
+        """points: (n, d) in self.names order. Returns (n,) scores."""
+
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        n_rows, n_dims = points.shape
+
+        base = np.zeros(n_rows, dtype=np.int64)
+        frac = np.empty((n_rows, n_dims), dtype=np.float64)
+
+        for d, nodes in enumerate(self.axes):
+            x = points[:, d]
+            i = np.clip(np.searchsorted(nodes, x, side="right") - 1, 0, len(nodes) - 2)
+
+            lo, hi = nodes[i], nodes[i + 1]
+            frac[:, d] = np.clip((x - lo) / (hi - lo), 0.0, 1.0)
+            base += i * self._strides[d]
+
+        corner_values = self._flat[base[:, None] + self._corner_offsets[None, :]]
+
+        weights = np.where(
+            self._corner_bits[None, :, :], frac[:, None, :], 1.0 - frac[:, None, :]
+        ).prod(axis=2)
+
+        return (corner_values * weights).sum(axis=1)
+
+
+# ======================================================
+# 🏗️ BUILD (OFFLINE / BACKGROUND)
+# ======================================================
+
+def _grid_frame(names, axes, flat_idx: np.ndarray) -> pd.DataFrame:
+    coords = np.unravel_index(flat_idx, [len(a) for a in axes])
+    return pd.DataFrame({name: axis[c] for name, axis, c in zip(names, axes, coords)})
+
+
+def _exact_scores(frame: pd.DataFrame, model=None) -> np.ndarray:
+    return score_components(frame, model)[-1]
+
+
+def measure_error(grid: SurrogateGrid, n_samples: int, seed: int = 0, model=None) -> dict:
+    """
+    Interpolation error vs exact scoring (served model unless
+    given) on random in-range points (uniform in each axis'
+    spacing, like the nodes).
+    """
+
+    rng = np.random.default_rng(seed)
+    columns = {}
+
+    for name, nodes in zip(grid.names, grid.axes):
+        # Uniform position between random neighbouring nodes
+        i = rng.integers(0, len(nodes) - 1, n_samples)
+        t = rng.random(n_samples)
+        columns[name] = nodes[i] + t * (nodes[i + 1] - nodes[i])
+
+    frame = pd.DataFrame(columns)
+    error = np.abs(grid.interpolate(frame.to_numpy()) - _exact_scores(frame, model))
+
+    return {
+        "samples": int(n_samples),
+        "max_abs_error": float(error.max()),
+        "p99_abs_error": float(np.percentile(error, 99)),
+        "mean_abs_error": float(error.mean()),
+    }
+
+
+def build_grid(path: str = SURROGATE_GRID_PATH, axes_config: dict = SURROGATE_GRID_AXES,
+               snapshot=None) -> SurrogateGrid:
+    """
+    Score every grid node with one model snapshot (served
+    unless given) and persist <path> (.npy, memory-mappable)
+    + metadata (.json) tagged with that snapshot's version.
+    """
+
+    start = time.perf_counter()
+
+    # One snapshot for the whole build: a swap mid-build must not
+    # mix models or mislabel the grid
+    snapshot = snapshot if snapshot is not None else get_snapshot()
+    version = snapshot.version
+    names = list(axes_config)
+    axes = [axis_nodes(name, *axes_config[name]) for name in names]
+    shape = tuple(len(a) for a in axes)
+
+    values = np.empty(shape, dtype=np.float32)
+    flat = values.reshape(-1)
+
+    for lo in range(0, flat.size, _BUILD_CHUNK_ROWS):
+        idx = np.arange(lo, min(lo + _BUILD_CHUNK_ROWS, flat.size))
+        flat[idx] = _exact_scores(_grid_frame(names, axes, idx), snapshot.model)
+
+    meta = {
+        "model_version": version,
+        "inputs": names,
+        "axes": {name: {"points": len(a), "spacing": axes_config[name][1], "nodes": a.tolist()}
+                 for name, a in zip(names, axes)},
+        "grid_points": int(flat.size),
+        "build_seconds": None,
+    }
+
+    grid = SurrogateGrid(names, axes, values, meta)
+    meta["error"] = measure_error(grid, SURROGATE_ERROR_SAMPLES, model=snapshot.model)
+    meta["build_seconds"] = round(time.perf_counter() - start, 2)
+
+    # Atomic publish: other workers only ever see complete files
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+
+    with open(tmp, "wb") as f:
+        np.save(f, values)
+    with open(f"{tmp}.json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+    os.replace(tmp, path)
+    os.replace(f"{tmp}.json", _metadata_path(path))
+
+    print(
+        f"🧮 Surrogate grid built: {flat.size:,} points in {meta['build_seconds']}s "
+        f"(max |err| {meta['error']['max_abs_error']:.4f})"
+    )
+
+    return load_grid(path)
+
+
+def load_grid(path: str = SURROGATE_GRID_PATH):
+    """Memory-map a stored grid, or None if missing / unreadable."""
+
+    meta_path = _metadata_path(path)
+
+    if not (os.path.exists(path) and os.path.exists(meta_path)):
+        return None
+
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        values = np.load(path, mmap_mode="r")
+        names = meta["inputs"]
+        axes = [meta["axes"][name]["nodes"] for name in names]
+
+        return SurrogateGrid(names, axes, values, meta)
+
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Ignoring unreadable surrogate grid: {e}")
+        return None
+
+
+# ======================================================
+# ⭐ SERVING ACCESS
+# ======================================================
+
+def _background_build(snapshot):
+    global _grid, _building
+
+    version = snapshot.version
+
+    try:
+        grid = load_grid()
+        if grid is None or grid.model_version != version:
+            grid = build_grid(snapshot=snapshot)
+
+        with _grid_lock:
+            # Served model swapped again meanwhile: get_grid() keeps ignoring it
+            _grid = grid
+    except Exception as e:
+        print(f"⚠️ Surrogate grid build failed: {e}")
+    finally:
+        with _build_lock:
+            if _building == version:
+                _building = None
+
+
+def _schedule_build(snapshot):
+    global _building
+
+    with _build_lock:
+        if _building == snapshot.version:
+            return
+        _building = snapshot.version
+
+    threading.Thread(
+        target=_background_build, args=(snapshot,), name="surrogate-grid-build", daemon=True
+    ).start()
+
+
+def get_grid():
+    """
+    Grid matching the loaded model, or None while it is
+    (re)built in the background — callers score exactly then.
+    """
+
+    global _grid
+
+    snapshot = get_snapshot()
+    version = snapshot.version
+    grid = _grid
+
+    if grid is not None and grid.model_version == version:
+        return grid
+
+    with _grid_lock:
+        if _grid is None or _grid.model_version != version:
+            stored = load_grid()
+            _grid = stored if stored is not None and stored.model_version == version else None
+
+        grid = _grid
+
+    if grid is None:
+        _schedule_build(snapshot)
+
+    return grid
+
+
+def predict_approximate(data: dict, model=None):
+    """
+    Interpolated score for a validated payload, or None when
+    it cannot be answered from the grid (missing / non-numeric
+    inputs, model inputs the grid does not cover, grid not
+    ready). model: the served model the payload was validated
+    against.
+    """
+
+    grid = get_grid()
+    if grid is None:
+        return None
+
+    # The grid derives every other model input from its axes: a
+    # payload that sets one itself (rade_norm, HSI, ...) is scored exactly
+    for name in model_feature_columns(model):
+        if name not in grid.names and data.get(name) is not None:
+            return None
+
+    try:
+        point = [float(data[name]) for name in grid.names]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if not all(np.isfinite(point)):
+        return None
+
+    score = round(grid.interpolate_one(point), 4)
+
+    return {
+        "prediction": 1 if score >= 0.58 else 0,
+        "habitability_score": score,
+        "approximation": {
+            "method": "multilinear_grid",
+            "model_version": grid.model_version,
+            "grid_points": grid.meta["grid_points"],
+            "error_bound": grid.meta["error"]["max_abs_error"],
+            "error": grid.meta["error"],
+        },
+    }
+
+
+def _drop_stale_grid(version: str):
+    """Swap hook: release the old grid; get_grid() rebuilds lazily."""
+
+    global _grid
+
+    with _grid_lock:
+        if _grid is not None and _grid.model_version != version:
+            _grid = None
+
+
+# Only workers that can serve mode=approximate track swaps
+if SURROGATE_GRID_ENABLED:
+    register_reload_hook(_drop_stale_grid)
+
+
+if __name__ == "__main__":
+    build_grid()
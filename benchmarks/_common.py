@@ -0,0 +1,94 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Benchmark Helpers
+Shared timing / percentile / payload utilities
+=====================================================
+"""
+
+import os
+import time
+import subprocess
+
+import numpy as np
+import pandas as pd
+
+from backend.config import RANKED_DATA_PATH
+
+
+# Inputs accepted by /predict (see VALIDATION_RULES)
+PREDICT_INPUTS = ["pl_rade", "pl_eqt", "pl_orbper", "st_teff", "st_mass", "st_rad"]
+
+
+# =====================================================
+# ⏱️ TIMING
+# =====================================================
+
+def time_calls(fn, args_list, repeat: int = 1) -> np.ndarray:
+    """
+    Time fn(*args) for every args tuple.
+    Returns per-call latencies in milliseconds.
+    """
+    samples = []
+
+    for _ in range(repeat):
+        for args in args_list:
+            start = time.perf_counter()
+            fn(*args)
+            samples.append((time.perf_counter() - start) * 1000)
+
+    return np.asarray(samples)
+
+
+def summarize_ms(samples) -> dict:
+    """p50 / p95 / p99 / mean summary of latency samples (ms)."""
+    samples = np.asarray(samples, dtype=np.float64)
+
+    return {
+        "count": int(samples.size),
+        "mean_ms": float(samples.mean()),
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p95_ms": float(np.percentile(samples, 95)),
+        "p99_ms": float(np.percentile(samples, 99)),
+    }
+
+
+# =====================================================
+# 🪐 PAYLOADS
+# =====================================================
+
+def sample_payloads(n: int, seed: int = 42) -> list:
+    """
+    Sample realistic /predict payloads from ranked_exoplanets.csv.
+    Falls back to synthetic Earth-like values if the file is missing.
+    """
+    if os.path.exists(RANKED_DATA_PATH):
+        df = pd.read_csv(RANKED_DATA_PATH, usecols=lambda c: c in PREDICT_INPUTS)
+        df = df.dropna().sample(n=n, replace=len(df) < n, random_state=seed)
+        return df.to_dict(orient="records")
+
+    rng = np.random.default_rng(seed)
+
+    return [
+        {
+            "pl_rade": float(rng.uniform(0.5, 4)),
+            "pl_eqt": float(rng.uniform(150, 900)),
+            "pl_orbper": float(rng.uniform(1, 800)),
+            "st_teff": float(rng.uniform(3000, 7500)),
+            "st_mass": float(rng.uniform(0.2, 2)),
+            "st_rad": float(rng.uniform(0.2, 3)),
+        }
+        for _ in range(n)
+    ]
+
+
+# =====================================================
+# 🏷️ RUN METADATA
+# =====================================================
+
+def git_commit():
+    """Short HEAD hash for result files (None outside a git checkout)."""
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
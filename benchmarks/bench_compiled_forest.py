@@ -0,0 +1,102 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Compiled Forest Benchmark
+sklearn Pipeline.predict_proba vs CompiledForest
+
+Run:
+    python -m benchmarks.bench_compiled_forest --rows 100000
+=====================================================
+"""
+
+import argparse
+import os
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from backend.config import PROCESSED_DATA_DIR
+from backend.model_registry import get_model
+from benchmarks._common import summarize_ms, time_calls
+from src.forest_compiler import compile_forest
+
+
+MODEL_READY_PATH = os.path.join(PROCESSED_DATA_DIR, "model_ready_exoplanets.csv")
+
+# Required agreement with sklearn
+TOLERANCE = 1e-12
+
+
+def feature_matrix(model, n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Rows sampled from the model-ready dataset (with ~5% NaN to exercise the imputer)."""
+
+    columns = list(model.feature_names_in_)
+    df = pd.read_csv(MODEL_READY_PATH, usecols=columns)[columns]
+    df = df.sample(n=n_rows, replace=True, random_state=seed).reset_index(drop=True)
+
+    rng = np.random.default_rng(seed)
+    values = df.to_numpy(dtype=np.float64)
+    values[rng.random(values.shape) < 0.05] = np.nan
+
+    return pd.DataFrame(values, columns=columns)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Compiled forest benchmark")
+    parser.add_argument("--rows", type=int, default=100_000, help="batch size")
+    parser.add_argument("--single", type=int, default=300, help="single-row calls")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    model = get_model()
+
+    start = time.perf_counter()
+    compiled = compile_forest(model)
+    compile_s = time.perf_counter() - start
+
+    print(
+        f"🌲 {compiled.n_trees} trees, {compiled.n_nodes:,} nodes, "
+        f"{compiled.nbytes / 1e6:.2f} MB, compiled in {compile_s * 1000:.1f} ms"
+    )
+
+    X = feature_matrix(model, args.rows)
+
+    # -------------------------------------------------
+    # Batch parity + throughput
+    # -------------------------------------------------
+    start = time.perf_counter()
+    expected = model.predict_proba(X)
+    sklearn_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = compiled.predict_proba(X)
+    compiled_s = time.perf_counter() - start
+
+    max_diff = float(np.abs(expected - actual).max())
+    print(f"🧪 Max |Δp| over {args.rows:,} rows: {max_diff:.3e} (tolerance {TOLERANCE:.0e})")
+
+    print(f"\n{'batch ' + format(args.rows, ','):<22}{'sklearn s':>12}{'compiled s':>12}")
+    print(f"{'':<22}{sklearn_s:>12.3f}{compiled_s:>12.3f}")
+
+    # -------------------------------------------------
+    # Single-row latency
+    # -------------------------------------------------
+    rows = [(X.iloc[[i]],) for i in range(args.single)]
+    arrays = [(r.to_numpy(),) for (r,) in rows]
+
+    sk = summarize_ms(time_calls(model.predict_proba, rows))
+    cf = summarize_ms(time_calls(compiled.predict_proba, arrays))
+
+    print(f"\n{'single row':<22}{'p50 ms':>12}{'p99 ms':>12}")
+    print(f"{'sklearn':<22}{sk['p50_ms']:>12.3f}{sk['p99_ms']:>12.3f}")
+    print(f"{'compiled':<22}{cf['p50_ms']:>12.3f}{cf['p99_ms']:>12.3f}")
+
+    if max_diff > TOLERANCE:
+        raise SystemExit("❌ Compiled forest disagrees with sklearn")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Conditional GET / Compression Benchmark
+Repeat polls of /stats, /rank and /importance
+
+  uncached     route runs every time (EXOHABITAI_HTTP_CACHE=0)
+  cached 200   body served from the per-version cache
+               (negotiated gzip / brotli, compressed once)
+  304          If-None-Match matches: nothing computed
+
+Bytes on the wire: identity vs gzip vs brotli (if the
+optional brotli package is installed).
+
+Parity: decoded cached bodies == uncached bodies.
+
+Run:
+    python -m benchmarks.bench_http_cache
+=====================================================
+"""
+
+import argparse
+import gzip
+import os
+import warnings
+
+
+PATHS = [
+    "/stats",
+    "/importance",
+    "/rank?limit=20",
+    "/rank?limit=200",
+    "/rank?limit=200&filter=pl_eqt%3D200..320&sort=SCI",
+]
+
+
+def _decode(response) -> bytes:
+    encoding = response.headers.get("Content-Encoding")
+
+    if encoding == "gzip":
+        return gzip.decompress(response.data)
+    if encoding == "br":
+        import brotli
+        return brotli.decompress(response.data)
+    return response.data
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Conditional GET / compression benchmark")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    for name in ("EXOHABITAI_WARMUP", "EXOHABITAI_MODEL_WATCH", "EXOHABITAI_JOB_RUNNER"):
+        os.environ.setdefault(name, "0")
+
+    from backend import http_cache
+    from backend.app import app
+    from benchmarks._common import summarize_ms, time_calls
+
+    client = app.test_client()
+    encodings = ", ".join(http_cache._encodings())
+
+    print(f"{'path':<52}{'uncached':>10}{'cached':>9}{'304':>8}   "
+          f"{'identity B':>10}{'gzip B':>8}{'br B':>8}  parity")
+
+    for path in PATHS:
+        calls = [(path,)] * args.repeat
+
+        http_cache.HTTP_CACHE_ENABLED = False
+        plain = client.get(path)
+        uncached = summarize_ms(time_calls(client.get, calls))["p50_ms"]
+
+        http_cache.HTTP_CACHE_ENABLED = True
+        http_cache.clear()
+
+        sizes = {}
+        parity = True
+        for accept in ("identity", "gzip", "br"):
+            response = client.get(path, headers={"Accept-Encoding": accept})
+            if response.headers.get("Content-Encoding", "identity") == accept:
+                sizes[accept] = len(response.data)
+            parity &= _decode(response) == plain.data
+
+        headers = {"Accept-Encoding": encodings}
+        etag = client.get(path, headers=headers).headers["ETag"]
+
+        cached = summarize_ms(time_calls(
+            lambda p: client.get(p, headers=headers), calls
+        ))["p50_ms"]
+        not_modified = summarize_ms(time_calls(
+            lambda p: client.get(p, headers={**headers, "If-None-Match": etag}), calls
+        ))["p50_ms"]
+
+        print(f"{path:<52}{uncached:>8.2f}ms{cached:>7.2f}ms{not_modified:>6.2f}ms   "
+              f"{sizes.get('identity', 0):>10,}{sizes.get('gzip', '-'):>8}{sizes.get('br', '-'):>8}  "
+              f"{'✅' if parity else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
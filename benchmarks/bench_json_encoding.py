@@ -0,0 +1,105 @@
+"""
+=====================================================
+🚀 ExoHabitAI — JSON Encoding Benchmark
+Catalog slices → response body
+
+  to_dict      df.replace + df.where (copies), then
+               to_dict(orient="records") + default jsonify
+               encoder (old /rank path)
+  records      ColumnarSlice, same shape, encoded column
+               by column from NumPy (ExoJSONProvider)
+  columnar     ColumnarSlice(orient="columns"):
+               {"col": [values...]}
+
+Payloads: 200 rows (a /rank page) and 100k rows, every
+catalog column, with NaN / inf sprinkled in.
+
+Parity: records decodes to the to_dict rows with NaN /
+inf as null (the old path wrote bare NaN: invalid JSON).
+
+Run:
+    python -m benchmarks.bench_json_encoding --rows 200,100000
+=====================================================
+"""
+
+import argparse
+import json
+import warnings
+
+import numpy as np
+import pandas as pd
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from backend.config import RANKED_DATA_PATH
+from backend.json_provider import ColumnarSlice, ExoJSONProvider, finite
+from benchmarks._common import summarize_ms, time_calls
+
+
+def catalog_frame(rows: int, seed: int = 5) -> pd.DataFrame:
+    base = pd.read_csv(RANKED_DATA_PATH)
+    df = pd.concat([base] * (rows // len(base) + 1), ignore_index=True).iloc[:rows].copy()
+
+    rng = np.random.default_rng(seed)
+    for col in ("pl_rade", "pl_eqt", "habitability_score"):
+        df.loc[rng.random(rows) < 0.01, col] = np.nan
+    df.loc[rng.random(rows) < 0.001, "SCI"] = np.inf
+
+    return df
+
+
+def old_path(df: pd.DataFrame, provider) -> str:
+    clean = df.replace([np.inf, -np.inf], np.nan)
+    clean = clean.where(pd.notnull(clean), None)
+    return provider.dumps({"data": clean.to_dict(orient="records")}, separators=(",", ":"))
+
+
+def new_path(columns: dict, provider, orient: str) -> str:
+    return provider.dumps({"data": ColumnarSlice(columns, orient=orient)}, separators=(",", ":"))
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="JSON encoding benchmark")
+    parser.add_argument("--rows", default="200,100000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    app = Flask(__name__)
+    default = DefaultJSONProvider(app)
+    fast = ExoJSONProvider(app)
+
+    print(f"{'rows':>8}{'to_dict ms':>12}{'records ms':>12}{'columnar ms':>13}"
+          f"{'speedup':>9}{'records KB':>12}{'columnar KB':>13}  parity")
+
+    for n in (int(r) for r in args.rows.split(",")):
+        df = catalog_frame(n)
+        columns = {c: df[c].to_numpy() for c in df.columns}
+
+        # Many small calls for 200 rows, a few for 100k
+        repeat = max(args.repeat, 20_000 // n)
+
+        old_text = old_path(df, default)
+        records_text = new_path(columns, fast, "records")
+        columnar_text = new_path(columns, fast, "columns")
+
+        expected = finite(json.loads(old_text)["data"])
+        parity = json.loads(records_text)["data"] == expected
+
+        decoded = json.loads(columnar_text)["data"]
+        parity &= all(decoded[c] == [row[c] for row in expected] for c in df.columns)
+
+        calls = [()] * repeat
+        old_ms = summarize_ms(time_calls(lambda: old_path(df, default), calls))["p50_ms"]
+        records_ms = summarize_ms(time_calls(lambda: new_path(columns, fast, "records"), calls))["p50_ms"]
+        columnar_ms = summarize_ms(time_calls(lambda: new_path(columns, fast, "columns"), calls))["p50_ms"]
+
+        print(f"{n:>8,}{old_ms:>12.2f}{records_ms:>12.2f}{columnar_ms:>13.2f}"
+              f"{old_ms / records_ms:>8.1f}x{len(records_text) / 1024:>12.0f}{len(columnar_text) / 1024:>13.0f}"
+              f"  {'✅' if parity else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+=====================================================
+🚀 ExoHabitAI — /metrics Overhead Benchmark
+Scoring latency with instrumentation on vs off
+
+Each mode runs in a fresh interpreter (EXOHABITAI_METRICS
+is read at import), alternating for --rounds rounds; the
+best p50 per mode is kept to damp machine noise:
+
+  fast      predict_planet_fast()       (3 stage timers)
+  batch     predict_planets_batch(256)  (5 stage timers)
+  /predict  Flask test client, cache off (+ request hooks)
+
+Also reports the raw cost of one observe() and of a
+full /metrics render.
+
+Run:
+    python -m benchmarks.bench_metrics_overhead --budget 5
+=====================================================
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import warnings
+
+
+def _measure(n: int) -> dict:
+    """Runs inside the fresh interpreter."""
+
+    from backend.app import app
+    from backend.metrics import HistogramFamily, LATENCY_BUCKETS_SECONDS, render_prometheus
+    from backend.services.prediction_service import predict_planet_fast, predict_planets_batch
+    from benchmarks._common import sample_payloads, summarize_ms, time_calls
+
+    payloads = sample_payloads(n)
+    client = app.test_client()
+
+    # Warm every path before timing
+    for payload in payloads[:20]:
+        predict_planet_fast(payload)
+        client.post("/predict", json=payload)
+    predict_planets_batch(payloads[:256])
+
+    result = {
+        "fast": summarize_ms(time_calls(predict_planet_fast, [(p,) for p in payloads], repeat=3)),
+        "batch": summarize_ms(time_calls(predict_planets_batch, [(payloads[:256],)] * 30)),
+        "/predict": summarize_ms(time_calls(
+            lambda p: client.post("/predict", json=p), [(p,) for p in payloads]
+        )),
+    }
+
+    child = HistogramFamily("bench", LATENCY_BUCKETS_SECONDS, labelnames=("x",)).labels("y")
+    start = time.perf_counter()
+    for _ in range(100_000):
+        child.observe(0.001)
+    result["observe_us"] = (time.perf_counter() - start) * 1e6 / 100_000
+
+    start = time.perf_counter()
+    text = render_prometheus()
+    result["render_ms"] = (time.perf_counter() - start) * 1000
+    result["render_lines"] = text.count("\n")
+
+    return result
+
+
+def _run(enabled: bool, n: int) -> dict:
+    env = dict(
+        os.environ,
+        EXOHABITAI_METRICS="1" if enabled else "0",
+        EXOHABITAI_PREDICTION_CACHE="0",
+        EXOHABITAI_MODEL_WATCH="0",
+        EXOHABITAI_JOB_RUNNER="0",
+        EXOHABITAI_WARMUP="0",
+    )
+
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-m", "benchmarks.bench_metrics_overhead",
+         "--child", "--n", str(n)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="/metrics overhead benchmark")
+    parser.add_argument("--n", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=5.0, help="max p50 overhead (%%)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    if args.child:
+        print(json.dumps(_measure(args.n)))
+        return
+
+    best = {True: {}, False: {}}
+    enabled_run = None
+
+    for _ in range(args.rounds):
+        for enabled in (False, True):
+            r = _run(enabled, args.n)
+            enabled_run = r if enabled else enabled_run
+
+            for path in ("fast", "batch", "/predict"):
+                p50 = r[path]["p50_ms"]
+                best[enabled][path] = min(best[enabled].get(path, p50), p50)
+
+    print(f"{'path':>10}{'off p50 ms':>12}{'on p50 ms':>12}{'overhead':>10}")
+
+    over_budget = []
+    for path in ("fast", "batch", "/predict"):
+        off, on = best[False][path], best[True][path]
+        overhead = (on - off) / off * 100
+        print(f"{path:>10}{off:>12.4f}{on:>12.4f}{overhead:>9.1f}%")
+        if overhead > args.budget:
+            over_budget.append(path)
+
+    print(f"\n⏱️ observe(): {enabled_run['observe_us']:.2f} µs")
+    print(f"📤 /metrics render: {enabled_run['render_ms']:.2f} ms ({enabled_run['render_lines']} lines)")
+
+    if over_budget:
+        print(f"\n❌ Over the {args.budget:.1f}% budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+    print(f"\n✅ Within the {args.budget:.1f}% p50 budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Model Artifact Load Benchmark
+joblib pickle vs compact memory-mapped forest artifact
+
+Each loader runs in a fresh interpreter:
+  cold ms   imports beyond NumPy + first load (worker start)
+  warm ms   median of repeated loads (imports done)
+  +RSS MB   resident memory added by imports + load
+  sklearn   whether sklearn ended up imported
+
+Parity: both models score the same rows (max |Δp|).
+
+Run:
+    python -m benchmarks.bench_model_artifact
+=====================================================
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import warnings
+
+from backend.config import MODEL_PATH
+from backend.prefork import process_memory
+from src.model_artifact import artifact_path
+
+
+def _load_pickle(path):
+    import joblib
+    return joblib.load(path)
+
+
+def _load_artifact(path):
+    from src.model_artifact import load_artifact
+    return load_artifact(path)[0]
+
+
+LOADERS = {
+    "pickle": (_load_pickle, lambda: MODEL_PATH),
+    "artifact": (_load_artifact, lambda: artifact_path(MODEL_PATH)),
+}
+
+
+def _measure(name: str, repeat: int) -> dict:
+    """Runs inside the fresh interpreter."""
+
+    load, path = LOADERS[name]
+    path = path()
+
+    before = process_memory()
+    start = time.perf_counter()
+    load(path)
+    cold_ms = (time.perf_counter() - start) * 1000
+    after = process_memory()
+
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load(path)
+        warm.append((time.perf_counter() - start) * 1000)
+
+    warm.sort()
+
+    return {
+        "loader": name,
+        "file_mb": os.path.getsize(path) / 1e6,
+        "cold_ms": cold_ms,
+        "warm_ms": warm[len(warm) // 2],
+        "rss_added_mb": after.get("rss_mb", 0) - before.get("rss_mb", 0),
+        "sklearn_imported": "sklearn" in sys.modules,
+    }
+
+
+def _run(name: str, repeat: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-m", "benchmarks.bench_model_artifact",
+         "--loader", name, "--repeat", str(repeat)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _parity(n_rows: int = 20_000) -> float:
+    import numpy as np
+
+    model = _load_pickle(MODEL_PATH)
+    forest = _load_artifact(artifact_path(MODEL_PATH))
+
+    X = np.random.default_rng(0).random((n_rows, len(forest.feature_names))) * 400
+
+    return float(np.abs(model.predict_proba(X) - forest.predict_proba(X)).max())
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Model artifact load benchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--loader", choices=list(LOADERS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    if args.loader:
+        print(json.dumps(_measure(args.loader, args.repeat)))
+        return
+
+    if not os.path.exists(artifact_path(MODEL_PATH)):
+        print(f"Artifact missing: run `python -m src.model_artifact {MODEL_PATH}` first")
+        return
+
+    print(f"{'loader':>10}{'file MB':>10}{'cold ms':>10}{'warm ms':>10}{'+RSS MB':>10}  sklearn")
+
+    for name in LOADERS:
+        r = _run(name, args.repeat)
+        print(
+            f"{r['loader']:>10}{r['file_mb']:>10.2f}{r['cold_ms']:>10.1f}"
+            f"{r['warm_ms']:>10.2f}{r['rss_added_mb']:>10.1f}  {r['sklearn_imported']}"
+        )
+
+    print(f"\n🧪 Max |Δp| pickle vs artifact: {_parity():.3e}")
+
+
+if __name__ == "__main__":
+    main()
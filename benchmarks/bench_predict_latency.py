@@ -0,0 +1,66 @@
+"""
+=====================================================
+🚀 ExoHabitAI — /predict Latency Benchmark
+predict_planet (pandas) vs predict_planet_fast (NumPy row)
+
+Run:
+    python -m benchmarks.bench_predict_latency --n 500
+=====================================================
+"""
+
+import argparse
+import warnings
+
+from backend.model_registry import get_model
+from backend.services.prediction_service import predict_planet, predict_planet_fast
+from benchmarks._common import sample_payloads, summarize_ms, time_calls
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Single-row predict latency benchmark")
+    parser.add_argument("--n", type=int, default=300, help="payloads to time")
+    parser.add_argument("--warmup", type=int, default=20, help="untimed warm-up calls")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    get_model()
+    payloads = sample_payloads(args.n)
+
+    # -------------------------------------------------
+    # Bit-identical check
+    # -------------------------------------------------
+    mismatches = [
+        p for p in payloads
+        if predict_planet(p) != predict_planet_fast(p)
+    ]
+
+    print(f"🧪 Parity: {len(payloads) - len(mismatches)}/{len(payloads)} bit-identical")
+
+    # -------------------------------------------------
+    # Latency
+    # -------------------------------------------------
+    calls = [(p,) for p in payloads]
+
+    for fn in (predict_planet, predict_planet_fast):
+        time_calls(fn, calls[: args.warmup])
+
+    slow = summarize_ms(time_calls(predict_planet, calls))
+    fast = summarize_ms(time_calls(predict_planet_fast, calls))
+
+    print(f"\n{'path':<22}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}")
+    for name, stats in (("predict_planet", slow), ("predict_planet_fast", fast)):
+        print(f"{name:<22}{stats['p50_ms']:>10.3f}{stats['p99_ms']:>10.3f}{stats['mean_ms']:>10.3f}")
+
+    print(
+        f"\n⚡ Speed-up: p50 x{slow['p50_ms'] / fast['p50_ms']:.2f}, "
+        f"p99 x{slow['p99_ms'] / fast['p99_ms']:.2f}"
+    )
+
+    if mismatches:
+        raise SystemExit(f"❌ {len(mismatches)} payloads differ between paths")
+
+
+if __name__ == "__main__":
+    main()
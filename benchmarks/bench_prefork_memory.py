@@ -0,0 +1,162 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Pre-Fork Memory Benchmark
+Per-worker RSS / PSS: independent loads vs copy-on-write
+
+Forks N workers the way gunicorn does:
+
+  independent  every worker imports the app and loads the
+               model / compiled forest / ranked catalog
+               (gunicorn without preload_app)
+  preload      the master loads everything + gc.freeze(),
+               workers inherit it (deployment/gunicorn.conf.py)
+
+Each worker then serves the same scoring workload. Memory
+is read from /proc/<pid>/smaps_rollup while every worker
+is still alive; Σ PSS is the real footprint. Linux only.
+
+Run:
+    python -m benchmarks.bench_prefork_memory --workers 4
+=====================================================
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import warnings
+
+from backend.prefork import process_memory
+
+
+def _workload():
+    """Same requests in every worker: single, batch, compiled, catalog."""
+
+    from backend.app import app
+    from benchmarks._common import sample_payloads
+
+    client = app.test_client()
+    payloads = sample_payloads(500)
+
+    for payload in payloads[:50]:
+        client.post("/predict", json=payload)
+
+    client.post("/predict/batch", json=payloads)
+    client.get("/rank?limit=200")
+    client.get("/stats")
+
+
+def _fork_workers(n_workers: int, preload: bool) -> list:
+    """Fork workers, run the workload, measure all of them alive."""
+
+    if preload:
+        from backend.prefork import preload as preload_master
+        preload_master()
+
+    ready_r, ready_w = os.pipe()
+    go_r, go_w = os.pipe()
+    pids = []
+
+    for _ in range(n_workers):
+        pid = os.fork()
+
+        if pid == 0:
+            os.close(ready_r)
+            os.close(go_w)
+            status = 0
+            try:
+                if not preload:
+                    from backend.warmup import run_warmup
+                    run_warmup()
+                _workload()
+            except Exception as e:
+                print(f"worker failed: {e}", file=sys.stderr)
+                status = 1
+            os.write(ready_w, b"1")
+            os.read(go_r, 1)          # returns at EOF: master closed go_w
+            os._exit(status)
+
+        pids.append(pid)
+
+    os.close(ready_w)
+    os.close(go_r)
+
+    for _ in pids:
+        os.read(ready_r, 1)
+
+    workers = [process_memory(pid) for pid in pids]
+    master = process_memory()
+
+    os.close(go_w)
+    for pid in pids:
+        os.waitpid(pid, 0)
+
+    return {"master": master, "workers": workers}
+
+
+def _run_mode(mode: str, n_workers: int) -> dict:
+    """Each mode in a fresh interpreter so the master starts clean."""
+
+    env = dict(
+        os.environ,
+        EXOHABITAI_PREFORK="1",
+        EXOHABITAI_MODEL_WATCH="0",
+        EXOHABITAI_JOB_RUNNER="0",
+        EXOHABITAI_PREDICTION_CACHE="0",
+        EXOHABITAI_SURROGATE_GRID="0",
+    )
+
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-m", "benchmarks.bench_prefork_memory",
+         "--mode", mode, "--workers", str(n_workers)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _print(mode: str, result: dict):
+    print(f"\n{mode}")
+    print(f"{'process':>10}{'RSS MB':>10}{'PSS MB':>10}{'shared MB':>11}{'private MB':>12}")
+
+    rows = [("master", result["master"])] + [
+        (f"worker {i}", w) for i, w in enumerate(result["workers"])
+    ]
+
+    for name, m in rows:
+        shared = m.get("shared_clean_mb", 0) + m.get("shared_dirty_mb", 0)
+        private = m.get("private_clean_mb", 0) + m.get("private_dirty_mb", 0)
+        print(f"{name:>10}{m.get('rss_mb', 0):>10.1f}{m.get('pss_mb', 0):>10.1f}{shared:>11.1f}{private:>12.1f}")
+
+    total_pss = sum(m.get("pss_mb", 0) for _, m in rows)
+    total_rss = sum(m.get("rss_mb", 0) for _, m in rows)
+    print(f"{'Σ':>10}{total_rss:>10.1f}{total_pss:>10.1f}")
+
+    return total_pss
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Pre-fork memory benchmark")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--mode", choices=["independent", "preload"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    if args.mode:
+        result = _fork_workers(args.workers, preload=args.mode == "preload")
+        print(json.dumps(result))
+        return
+
+    totals = {}
+    for mode in ("independent", "preload"):
+        totals[mode] = _print(mode, _run_mode(mode, args.workers))
+
+    saved = totals["independent"] - totals["preload"]
+    print(f"\nΣ PSS saved by preload: {saved:.1f} MB ({saved / totals['independent']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+=====================================================
+🚀 ExoHabitAI — /rank Filter Engine Benchmark
+Filtered top-k: pandas boolean indexing + sort vs the
+compiled, selectivity-ordered NumPy engine
+
+Synthetic catalogs of 1M–5M rows with the ranked columns
+(~0.5% NaN). Each filter is answered as page 1 of
+/rank?filter=...&limit=200 (sorted by habitability_score).
+
+  pandas    df[mask].sort_values(...).head(200)
+  engine    parse_filters → select → page
+            (indexed: RANK_PRESORTED_COLUMNS)
+
+Parity: engine rows == pandas stable-sort rows.
+
+Run:
+    python -m benchmarks.bench_rank_filter --sizes 1000000,5000000
+=====================================================
+"""
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from backend.services.catalog import CatalogSnapshot
+from backend.services.catalog_query import page, parse_filters, select
+from benchmarks._common import summarize_ms
+
+
+FILTERS = [
+    "habitability_score>=0.7",
+    "pl_eqt=200..320",
+    "st_teff<6000",
+    "prediction=1",
+    "pl_eqt=200..320,st_teff<6000",
+    "habitability_score>=0.5,pl_rade=0.5..1.6,st_mass>0.8",
+    "SCI>0.9,pl_orbper=100..400",
+]
+
+SORT = "habitability_score"
+
+
+def synthetic_catalog(n: int, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+
+    score = np.round(rng.beta(0.4, 4, n), 4)
+    df = pd.DataFrame({
+        "pl_rade": rng.lognormal(0.7, 0.8, n),
+        "pl_eqt": rng.uniform(50, 2500, n),
+        "pl_orbper": rng.lognormal(2.5, 1.8, n),
+        "st_teff": rng.normal(5500, 1200, n),
+        "st_mass": rng.lognormal(0, 0.3, n),
+        "st_rad": rng.lognormal(0, 0.5, n),
+        "HSI": rng.random(n),
+        "SCI": rng.random(n),
+        "habitability_score": score,
+        "prediction": (score > 0.45).astype(np.int64),
+    })
+
+    for col in ("pl_rade", "pl_eqt", "st_teff", "habitability_score"):
+        df.loc[rng.random(n) < 0.005, col] = np.nan
+
+    return df
+
+
+def _pandas(df, text):
+    mask = np.ones(len(df), dtype=bool)
+    for clause in text.split(","):
+        col, _, rest = clause.partition(next(op for op in (">=", "<=", "=", ">", "<") if op in clause))
+        op = clause[len(col):len(clause) - len(rest)]
+        if ".." in rest:
+            lo, hi = (float(v) for v in rest.split(".."))
+            mask &= df[col].between(lo, hi).to_numpy()
+        else:
+            v = float(rest)
+            mask &= {">=": df[col] >= v, "<=": df[col] <= v, ">": df[col] > v,
+                     "<": df[col] < v, "=": df[col] == v}[op].to_numpy()
+    return df[mask].sort_values(SORT, ascending=False, kind="stable").head(200)
+
+
+def _engine(snapshot, text):
+    predicates = parse_filters([text], snapshot.columns)
+    selection = select(snapshot, predicates)
+    rows, _, _ = page(snapshot, selection, SORT, True, None, 200)
+    return rows, selection.count
+
+
+def _time(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize_ms(samples)["p50_ms"]
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="/rank filter engine benchmark")
+    parser.add_argument("--sizes", default="1000000,5000000")
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    for n in (int(s) for s in args.sizes.split(",")):
+        df = synthetic_catalog(n)
+
+        start = time.perf_counter()
+        snapshot = CatalogSnapshot(df, (0, n), 0.0)
+        index_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n🪐 {n:,} rows (indexes built in {index_ms:.0f} ms: {', '.join(snapshot.presorted)})")
+        print(f"{'filter':<52}{'matched':>10}{'pandas ms':>11}{'engine ms':>11}  parity")
+
+        for text in FILTERS:
+            rows, matched = _engine(snapshot, text)
+            expected = _pandas(df, text).index.to_numpy()
+            parity = np.array_equal(rows, expected)
+
+            pandas_ms = _time(lambda: _pandas(df, text), args.repeat)
+            engine_ms = _time(lambda: _engine(snapshot, text), args.repeat)
+
+            print(f"{text:<52}{matched:>10,}{pandas_ms:>11.2f}{engine_ms:>11.2f}  {'✅' if parity else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+=====================================================
+🚀 ExoHabitAI — /rank Top-K Benchmark
+Full sort per request vs presorted slice vs argpartition
+
+  sort_values    df.sort_values(col).head(limit)   (old /rank)
+  presorted      slice of the load-time permutation
+  argpartition   top_k_rows() for ad hoc columns
+
+Parity: every strategy returns exactly the rows of
+sort_values(kind="stable", na_position="last").head(limit),
+checked on columns with NaN and heavy ties.
+
+Run:
+    python -m benchmarks.bench_rank_topk
+    python -m benchmarks.bench_rank_topk --sizes 39251,1000000,5000000
+=====================================================
+"""
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from backend.services.catalog import sort_permutations, top_k_rows
+from benchmarks._common import summarize_ms
+
+
+LIMITS = (1, 20, 200)
+
+
+def synthetic_catalog(n: int, seed: int = 3) -> pd.DataFrame:
+    """Scores with many exact ties (like 0.0 / 1.0) plus NaN."""
+    rng = np.random.default_rng(seed)
+
+    score = np.round(rng.beta(0.3, 3, n), 3)
+    score[rng.random(n) < 0.01] = 1.0
+    score[rng.random(n) < 0.005] = np.nan
+
+    return pd.DataFrame({
+        "habitability_score": score,
+        "prediction": (score > 0.5).astype(np.int64),
+        "pl_eqt": rng.integers(50, 2000, n).astype(np.float64),
+    })
+
+
+def _reference(df, col, limit, descending):
+    order = df[col].sort_values(ascending=not descending, kind="stable", na_position="last")
+    return order.index[:limit].to_numpy()
+
+
+def check_parity(df: pd.DataFrame):
+    for col in df.columns:
+        values = df[col].to_numpy()
+        asc, desc = sort_permutations(values)
+
+        for descending in (True, False):
+            perm = desc if descending else asc
+
+            for limit in LIMITS + (len(df), len(df) + 5):
+                expected = _reference(df, col, limit, descending)
+
+                assert np.array_equal(perm[:limit], expected), (col, descending, limit, "presorted")
+                assert np.array_equal(top_k_rows(values, limit, descending), expected), \
+                    (col, descending, limit, "argpartition")
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize_ms(samples)["p50_ms"]
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="/rank top-k benchmark")
+    parser.add_argument("--sizes", default="39251,1000000")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    check_parity(synthetic_catalog(20_000))
+    print("🧪 Parity: presorted and argpartition == stable sort_values (NaN last, ties in file order)")
+
+    col = "habitability_score"
+
+    print(f"\n{'rows':>10}{'limit':>7}{'sort_values':>14}{'presorted':>12}{'argpartition':>14}{'build perms':>13}")
+
+    for n in (int(s) for s in args.sizes.split(",")):
+        df = synthetic_catalog(n)
+        values = df[col].to_numpy()
+
+        start = time.perf_counter()
+        asc, desc = sort_permutations(values)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        for limit in (20, 200):
+            full = _time(lambda: df.sort_values(by=col, ascending=False).head(limit), args.repeat)
+            sliced = _time(lambda: desc[:limit], args.repeat)
+            partition = _time(lambda: top_k_rows(values, limit, True), args.repeat)
+
+            print(f"{n:>10,}{limit:>7}{full:>12.3f}ms{sliced:>10.4f}ms{partition:>12.3f}ms{build_ms:>11.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Scoring Kernel Parity + Throughput
+src.scoring_kernels vs the original pandas / scalar maths
+
+Run:
+    python -m benchmarks.bench_scoring_kernels
+    python -m benchmarks.bench_scoring_kernels --sizes 1000,1000000
+=====================================================
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.scoring_kernels import hsi_into, sci_into, orbit_stability_into, fusion_into
+from src.feature_engineering import create_hsi, create_sci
+from backend.services.prediction_service import orbital_stability_score, quantum_neural_fusion
+
+
+# =====================================================
+# 📜 REFERENCE IMPLEMENTATIONS (pre-kernel code)
+# =====================================================
+
+def _ref_safe_score(series, ideal, scale):
+    score = 1 - (np.abs(series - ideal) / scale)
+    return np.clip(score, 0, 1)
+
+
+def _ref_hsi(df):
+    return (
+        _ref_safe_score(df["pl_rade"], 1.0, 1.5).fillna(0)
+        + _ref_safe_score(df["pl_eqt"], 288, 200).fillna(0)
+    ) / 2
+
+
+def _ref_sci(df):
+    return (
+        _ref_safe_score(df["st_teff"], 5778, 2500).fillna(0)
+        + _ref_safe_score(df["st_mass"], 1.0, 1.0).fillna(0)
+        + _ref_safe_score(df["st_rad"], 1.0, 1.0).fillna(0)
+    ) / 3
+
+
+def synthetic_frame(n: int, seed: int = 7) -> pd.DataFrame:
+    """Planet-like columns with ~1% NaN and some zero periods."""
+    rng = np.random.default_rng(seed)
+
+    df = pd.DataFrame({
+        "pl_rade": rng.uniform(0.1, 20, n),
+        "pl_eqt": rng.uniform(50, 2000, n),
+        "pl_orbper": rng.uniform(0, 5000, n),
+        "st_teff": rng.uniform(2000, 10000, n),
+        "st_mass": rng.uniform(0.1, 5, n),
+        "st_rad": rng.uniform(0.1, 10, n),
+    })
+
+    for col in ["pl_rade", "pl_eqt", "st_teff", "st_mass", "st_rad"]:
+        df.loc[rng.random(n) < 0.01, col] = np.nan
+
+    df.loc[rng.random(n) < 0.01, "pl_orbper"] = 0.0
+    return df
+
+
+# =====================================================
+# 🧪 PARITY
+# =====================================================
+
+def check_parity(n: int = 20_000) -> None:
+    """Kernels must match the original maths exactly."""
+
+    df = synthetic_frame(n)
+    out = np.empty(n)
+    scratch = np.empty(n)
+
+    assert np.array_equal(create_hsi(df).to_numpy(), _ref_hsi(df).to_numpy())
+    assert np.array_equal(create_sci(df).to_numpy(), _ref_sci(df).to_numpy())
+
+    orbper = df["pl_orbper"].to_numpy()
+    orbit = orbit_stability_into(orbper, out=np.empty(n))
+    orbit_ref = np.array([orbital_stability_score({"pl_orbper": v}) for v in orbper])
+    assert np.array_equal(orbit, orbit_ref)
+
+    rng = np.random.default_rng(1)
+    prob = rng.random(n)
+    hsi = hsi_into(df["pl_rade"].to_numpy(), df["pl_eqt"].to_numpy(), out, scratch).copy()
+    sci = sci_into(df["st_teff"].to_numpy(), df["st_mass"].to_numpy(), df["st_rad"].to_numpy(), out, scratch).copy()
+
+    fused = fusion_into(prob, hsi, sci, orbit, out=out, scratch=scratch)
+    fused_ref = [quantum_neural_fusion(*args) for args in zip(prob, hsi, sci, orbit)]
+    assert [round(v, 4) for v in fused.tolist()] == fused_ref
+
+    print(f"🧪 Parity OK on {n:,} rows (HSI, SCI, orbit, fusion)")
+
+
+# =====================================================
+# ⚡ THROUGHPUT
+# =====================================================
+
+def _best_of(fn, repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(n: int, repeat: int) -> None:
+
+    df = synthetic_frame(n)
+    cols = {c: df[c].to_numpy() for c in df.columns}
+
+    out = np.empty(n)
+    scratch = np.empty(n)
+    hsi = np.empty(n)
+    sci = np.empty(n)
+    orbit = np.empty(n)
+    mask = np.empty(n, dtype=bool)
+    prob = np.random.default_rng(2).random(n)
+
+    def kernels():
+        hsi_into(cols["pl_rade"], cols["pl_eqt"], hsi, scratch)
+        sci_into(cols["st_teff"], cols["st_mass"], cols["st_rad"], sci, scratch)
+        orbit_stability_into(cols["pl_orbper"], orbit, mask)
+        fusion_into(prob, hsi, sci, orbit, out, scratch)
+
+    def reference():
+        _ref_hsi(df)
+        _ref_sci(df)
+
+    t_kernel = _best_of(kernels, repeat)
+    t_ref = _best_of(reference, repeat)
+
+    print(
+        f"{n:>12,}"
+        f"{n / t_kernel / 1e6:>16.1f}"
+        f"{t_kernel * 1000:>12.2f}"
+        f"{t_ref * 1000:>16.2f}"
+    )
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Scoring kernel benchmark")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000,10000000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    check_parity()
+
+    print(f"\n{'rows':>12}{'kernel Mrow/s':>16}{'kernel ms':>12}{'pandas HSI+SCI':>16}")
+
+    for n in (int(s) for s in args.sizes.split(",")):
+        bench(n, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
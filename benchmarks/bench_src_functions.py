@@ -0,0 +1,303 @@
+"""
+=====================================================
+🚀 ExoHabitAI — src/ Function Micro-Benchmarks
+Cleaning, feature and target functions from 1k to 5M rows
+
+Per (function, rows):
+  best / median ms   wall time over adaptive repeats
+  rows/s             throughput at the median
+  peak MB            tracemalloc peak above the input frame
+  retained MB        memory still held after the call (output)
+  allocs             live blocks allocated by the call
+
+Timing and tracemalloc runs are separate: tracing slows
+allocation-heavy code and would skew the wall times.
+
+Run:
+    python -m benchmarks.bench_src_functions --output src_bench.json
+    python -m benchmarks.bench_src_functions --sizes 1000,100000 \\
+        --compare src_bench.json --threshold 20
+=====================================================
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._common import git_commit
+from src.feature_engineering import create_log_features, create_ratio_features, feature_engineering
+from src.preprocessing import fix_duplicate_columns
+from src.target_builder import build_habitability_target
+from src.week2_cleaning import clean_data, iqr_clip_outliers
+from src.week2_feature_engineering import add_engineered_features
+
+
+DEFAULT_SIZES = "1000,10000,100000,1000000,5000000"
+
+# Same columns as the Week 2 clipping step
+CLIP_COLUMNS = ["pl_rade", "pl_bmasse", "pl_orbper", "pl_eqt", "st_teff", "st_mass", "st_rad"]
+
+_MB = 1024 * 1024
+
+
+# =====================================================
+# 🪐 SYNTHETIC NASA-LIKE FRAMES
+# =====================================================
+
+def synthetic_frame(n: int, seed: int = 7) -> pd.DataFrame:
+    """
+    Numeric planet / star columns with ~2% NaN, a few ±inf,
+    and two low-cardinality string columns (clean_data tries
+    to convert every column).
+    """
+
+    rng = np.random.default_rng(seed)
+
+    df = pd.DataFrame({
+        "pl_rade": rng.lognormal(0.7, 0.8, n),
+        "pl_bmasse": rng.lognormal(2.5, 1.5, n),
+        "pl_orbper": rng.lognormal(2.5, 1.8, n),
+        "pl_eqt": rng.uniform(50, 2500, n),
+        "st_teff": rng.normal(5500, 1200, n),
+        "st_mass": rng.lognormal(0, 0.3, n),
+        "st_rad": rng.lognormal(0, 0.5, n),
+        "sy_dist": rng.lognormal(5, 1, n),
+        "ra": rng.uniform(0, 360, n),
+        "dec": rng.uniform(-90, 90, n),
+        "discoverymethod": np.array(["Transit", "Radial Velocity", "Imaging", "Microlensing"],
+                                    dtype=object)[rng.integers(0, 4, n)],
+        "disc_facility": np.array(["Kepler", "TESS", "K2", "Ground"],
+                                  dtype=object)[rng.integers(0, 4, n)],
+    })
+
+    for col in CLIP_COLUMNS:
+        df.loc[rng.random(n) < 0.02, col] = np.nan
+
+    df.loc[rng.random(n) < 0.001, "pl_orbper"] = np.inf
+    df.loc[rng.random(n) < 0.001, "st_rad"] = -np.inf
+
+    return df
+
+
+def _with_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Raw NASA exports repeat some column names."""
+    return pd.concat([df, df[["pl_rade", "st_teff", "st_teff"]]], axis=1)
+
+
+# name -> (fn(frame), input builder)
+FUNCTIONS = {
+    "clean_data": (clean_data, None),
+    "iqr_clip_outliers": (lambda df: iqr_clip_outliers(df, CLIP_COLUMNS), None),
+    "add_engineered_features": (add_engineered_features, None),
+    "feature_engineering": (feature_engineering, None),
+    "create_log_features": (create_log_features, None),
+    "create_ratio_features": (create_ratio_features, None),
+    "fix_duplicate_columns": (fix_duplicate_columns, _with_duplicate_columns),
+    "build_habitability_target": (build_habitability_target, None),
+}
+
+
+# =====================================================
+# ⏱️ MEASUREMENT
+# =====================================================
+
+def _quiet(fn, df):
+    """build_habitability_target prints its class counts."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(df)
+
+
+def time_function(fn, df, max_repeat: int, budget_s: float) -> list:
+    """Wall ms per call; repeats until max_repeat or the time budget."""
+
+    samples = []
+    spent = 0.0
+
+    while len(samples) < max_repeat and (spent < budget_s or not samples):
+        start = time.perf_counter()
+        _quiet(fn, df)
+        elapsed = time.perf_counter() - start
+
+        samples.append(elapsed * 1000)
+        spent += elapsed
+
+    return samples
+
+
+def trace_memory(fn, df) -> dict:
+    """tracemalloc peak / retained MB and live blocks of one call."""
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        blocks_before = len(tracemalloc.take_snapshot().traces)
+
+        result = _quiet(fn, df)
+
+        after, peak = tracemalloc.get_traced_memory()
+        blocks_after = len(tracemalloc.take_snapshot().traces)
+    finally:
+        tracemalloc.stop()
+
+    del result
+
+    return {
+        "peak_mb": round((peak - before) / _MB, 3),
+        "retained_mb": round((after - before) / _MB, 3),
+        "allocs": blocks_after - blocks_before,
+    }
+
+
+def run_suite(sizes, names, max_repeat: int, budget_s: float, trace: bool) -> list:
+    results = []
+
+    for n in sizes:
+        base = synthetic_frame(n)
+        print(f"\n🪐 {n:,} rows ({base.memory_usage(deep=True).sum() / _MB:.1f} MB input)")
+
+        for name in names:
+            fn, build = FUNCTIONS[name]
+            df = build(base) if build else base
+
+            # First call outside the measurement (imports, caches)
+            _quiet(fn, df.head(100))
+
+            samples = time_function(fn, df, max_repeat, budget_s)
+            median = statistics.median(samples)
+
+            row = {
+                "function": name,
+                "rows": n,
+                "repeats": len(samples),
+                "best_ms": round(min(samples), 3),
+                "median_ms": round(median, 3),
+                "rows_per_s": round(n / (median / 1000)),
+            }
+
+            if trace:
+                row.update(trace_memory(fn, df))
+
+            results.append(row)
+
+            print(
+                f"{name:>26}{row['best_ms']:>12.2f}{row['median_ms']:>12.2f}"
+                f"{row['rows_per_s'] / 1e6:>10.2f}M"
+                f"{row.get('peak_mb', 0):>10.1f}{row.get('retained_mb', 0):>10.1f}{row.get('allocs', 0):>9}"
+            )
+
+    return results
+
+
+# =====================================================
+# 📐 BASELINE COMPARISON
+# =====================================================
+
+def compare(results: list, baseline: dict, threshold: float) -> list:
+    """
+    % change of median_ms and peak_mb per matching (function, rows).
+    Returns the slowdowns beyond threshold percent.
+    """
+
+    base_rows = {(r["function"], r["rows"]): r for r in baseline["results"]}
+    flagged = []
+
+    print(f"\n📐 vs baseline ({baseline['meta'].get('git_commit')}, {baseline['meta'].get('timestamp')})")
+    print(f"{'function':>26}{'rows':>10}{'median Δ':>11}{'peak Δ':>10}")
+
+    for row in results:
+        base = base_rows.get((row["function"], row["rows"]))
+        if base is None:
+            continue
+
+        time_change = (row["median_ms"] - base["median_ms"]) / base["median_ms"] * 100
+
+        peak_change = None
+        if row.get("peak_mb") is not None and base.get("peak_mb"):
+            peak_change = (row["peak_mb"] - base["peak_mb"]) / base["peak_mb"] * 100
+
+        slower = time_change > threshold
+        bigger = peak_change is not None and peak_change > threshold
+
+        peak_text = f"{peak_change:>+9.1f}%" if peak_change is not None else f"{'-':>10}"
+        flag = "  ❌" if slower or bigger else ""
+        print(f"{row['function']:>26}{row['rows']:>10,}{time_change:>+10.1f}%{peak_text}{flag}")
+
+        if slower:
+            flagged.append(f"{row['function']}@{row['rows']} time {time_change:+.1f}%")
+        if bigger:
+            flagged.append(f"{row['function']}@{row['rows']} peak {peak_change:+.1f}%")
+
+    return flagged
+
+
+# =====================================================
+# ▶️ CLI
+# =====================================================
+
+def main():
+
+    parser = argparse.ArgumentParser(description="src/ function micro-benchmarks")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    parser.add_argument("--functions", default=",".join(FUNCTIONS), help="comma-separated subset")
+    parser.add_argument("--repeat", type=int, default=7, help="max timed calls per case")
+    parser.add_argument("--budget", type=float, default=3.0, help="timing seconds per case")
+    parser.add_argument("--no-trace", action="store_true", help="skip tracemalloc runs")
+    parser.add_argument("--output", help="write JSON results here")
+    parser.add_argument("--compare", help="baseline JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=20.0,
+                        help="%% slowdown / peak growth that fails --compare")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    names = [f.strip() for f in args.functions.split(",")]
+
+    unknown = [n for n in names if n not in FUNCTIONS]
+    if unknown:
+        parser.error(f"unknown functions: {', '.join(unknown)}")
+
+    print(f"{'function':>26}{'best ms':>12}{'median ms':>12}{'rows/s':>11}{'peak MB':>10}{'kept MB':>10}{'allocs':>9}")
+
+    results = run_suite(sizes, names, args.repeat, args.budget, trace=not args.no_trace)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        flagged = compare(results, baseline, args.threshold)
+
+        if flagged:
+            print(f"\n❌ Beyond {args.threshold:.0f}%: {'; '.join(flagged)}")
+            sys.exit(1)
+
+        print("\n✅ No slowdowns vs baseline")
+
+
+if __name__ == "__main__":
+    main()
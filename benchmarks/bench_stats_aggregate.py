@@ -0,0 +1,169 @@
+"""
+=====================================================
+🚀 ExoHabitAI — /stats Aggregate Benchmark
+Per-request pandas statistics vs mergeable aggregates
+
+  pandas       mean / min / max, pd.cut bands, feature
+               means on every call (old /stats)
+  aggregate    StatsAggregate.of(columns): once per
+               catalog version
+  append       previous.merge(of(new rows)): O(new rows)
+
+Reload: full CSV re-parse vs parsing only the appended
+rows (Catalog append path), on the ranked catalog tiled
+to --reload-rows rows.
+
+Parity: every payload == the pandas numbers.
+
+Run:
+    python -m benchmarks.bench_stats_aggregate --sizes 1000000,5000000
+=====================================================
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from backend.config import RANKED_DATA_PATH
+from backend.services.catalog import Catalog, read_catalog
+from backend.services.catalog_stats import FEATURE_COLUMNS, SCORE_BANDS, SCORE_BINS, StatsAggregate
+from benchmarks._common import summarize_ms
+from benchmarks.bench_rank_filter import synthetic_catalog
+
+
+APPENDS = (100, 10_000)
+
+
+def pandas_stats(df: pd.DataFrame) -> dict:
+    """The pre-aggregate /stats computation."""
+
+    band = pd.cut(df["habitability_score"], bins=list(SCORE_BINS), labels=list(SCORE_BANDS),
+                  include_lowest=True)
+
+    return {
+        "total_planets": int(len(df)),
+        "habitable_count": int((df["prediction"] == 1).sum()),
+        "avg_score": float(df["habitability_score"].mean()),
+        "min_score": float(df["habitability_score"].min()),
+        "max_score": float(df["habitability_score"].max()),
+        "distribution": {k: int(v) for k, v in band.value_counts().sort_index().items()},
+        "feature_means": {c: float(df[c].mean()) for c in FEATURE_COLUMNS if c in df.columns},
+    }
+
+
+def same(expected: dict, actual: dict) -> bool:
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            if not same(value, actual[key]):
+                return False
+        elif not np.isclose(value, actual[key], rtol=1e-9, atol=0, equal_nan=True):
+            return False
+    return True
+
+
+def _columns(df):
+    return {c: df[c].to_numpy() for c in df.columns}
+
+
+def _time(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize_ms(samples)["p50_ms"]
+
+
+def bench_aggregates(n: int, repeat: int):
+    df = synthetic_catalog(n)
+    columns = _columns(df)
+
+    full = StatsAggregate.of(columns)
+    assert same(pandas_stats(df), full.payload()), "aggregate parity"
+
+    pandas_ms = _time(lambda: pandas_stats(df), repeat)
+    build_ms = _time(lambda: StatsAggregate.of(columns), repeat)
+    payload_ms = _time(full.payload, repeat)
+
+    print(f"\n🪐 {n:,} rows")
+    print(f"   pandas per request     {pandas_ms:10.2f} ms")
+    print(f"   aggregate (per load)   {build_ms:10.2f} ms")
+    print(f"   payload from aggregate {payload_ms:10.4f} ms")
+
+    for k in APPENDS:
+        grown = pd.concat([df, synthetic_catalog(k, seed=k)], ignore_index=True)
+        grown_columns = _columns(grown)
+
+        merged = full.merge(StatsAggregate.of(grown_columns, start=n))
+        assert same(pandas_stats(grown), merged.payload()), "append parity"
+
+        rebuild_ms = _time(lambda: StatsAggregate.of(grown_columns), repeat)
+        merge_ms = _time(lambda: full.merge(StatsAggregate.of(grown_columns, start=n)), repeat)
+
+        print(f"   +{k:<7,} rows: rebuild {rebuild_ms:8.2f} ms   merge {merge_ms:8.3f} ms")
+
+
+def _wait(catalog):
+    catalog.get()
+    while catalog._inflight is not None:
+        time.sleep(0.005)
+    return catalog.get()
+
+
+def bench_reload(rows: int, append: int):
+    base = pd.read_csv(RANKED_DATA_PATH)
+    tiled = pd.concat([base] * max(1, rows // len(base)), ignore_index=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ranked.csv")
+        tiled.to_csv(path, index=False)
+
+        results = {}
+        for mode in ("full", "append"):
+            tiled.to_csv(path, index=False)
+            catalog = Catalog(path)
+            _wait(catalog)
+
+            if mode == "full":
+                # Another loader disables the append path: full re-parse
+                catalog.loader = lambda p: read_catalog(p)
+
+            with open(path, "a") as f:
+                base.iloc[:append].to_csv(f, index=False, header=False)
+
+            snapshot = _wait(catalog)
+            results[mode] = snapshot
+
+            print(f"   {mode:<7} reload: parse {snapshot.load_ms:8.1f} ms   "
+                  f"(appended_rows={snapshot.appended_rows})")
+
+        assert results["full"].frame.equals(results["append"].frame), "append parse parity"
+        assert same(results["full"].stats.payload(), results["append"].stats.payload())
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="/stats aggregate benchmark")
+    parser.add_argument("--sizes", default="39251,1000000")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--reload-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    for n in (int(s) for s in args.sizes.split(",")):
+        bench_aggregates(n, args.repeat)
+
+    print(f"\n📂 Catalog reload, {args.reload_rows:,}-row CSV + {APPENDS[0]} appended rows")
+    bench_reload(args.reload_rows, APPENDS[0])
+
+    print("\n🧪 Parity: aggregates, merges and append parsing == pandas")
+
+
+if __name__ == "__main__":
+    main()
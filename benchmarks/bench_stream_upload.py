@@ -0,0 +1,127 @@
+"""
+=====================================================
+🚀 ExoHabitAI — /predict/stream Benchmark
+Throughput + peak memory for growing uploads
+
+The upload is generated lazily and the response is
+consumed incrementally, so any growth in peak memory
+comes from the server side. rows/s is measured with
+tracemalloc running and is a lower bound.
+
+Run:
+    python -m benchmarks.bench_stream_upload --rows 20000 100000
+=====================================================
+"""
+
+import argparse
+import io
+import json
+import time
+import tracemalloc
+import warnings
+
+from werkzeug.test import EnvironBuilder
+
+from backend.app import app
+from benchmarks._common import PREDICT_INPUTS, sample_payloads
+
+
+class LazyCSV(io.RawIOBase):
+    """Readable byte stream producing a NASA-style CSV on demand."""
+
+    def __init__(self, n_rows: int, seed: int = 0):
+        payloads = sample_payloads(512, seed=seed)
+
+        header = "# NASA Exoplanet Archive export (synthetic)\n#\n" + ",".join(PREDICT_INPUTS) + "\n"
+        self._lines = self._generate(header, payloads, n_rows)
+        self._buffer = b""
+
+    @staticmethod
+    def _generate(header, payloads, n_rows):
+        yield header.encode()
+        for i in range(n_rows):
+            p = payloads[i % len(payloads)]
+            yield (",".join("" if p.get(k) is None else str(p[k]) for k in PREDICT_INPUTS) + "\n").encode()
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while len(self._buffer) < len(b):
+            try:
+                self._buffer += next(self._lines)
+            except StopIteration:
+                break
+
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+def stream_environ(n_rows: int) -> dict:
+    """WSGI environ of a chunked (no Content-Length) CSV upload."""
+
+    environ = EnvironBuilder(
+        path="/predict/stream", method="POST", content_type="text/csv"
+    ).get_environ()
+
+    environ.pop("CONTENT_LENGTH", None)
+    environ["wsgi.input"] = io.BufferedReader(LazyCSV(n_rows))
+    environ["wsgi.input_terminated"] = True
+
+    return environ
+
+
+def run(n_rows: int) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    body = app.wsgi_app(stream_environ(n_rows), lambda status, headers: None)
+
+    last = b""
+    for part in body:
+        last = part
+
+    if hasattr(body, "close"):
+        body.close()
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    summary = json.loads(last.decode().strip().splitlines()[-1])
+
+    return {
+        "rows": n_rows,
+        "seconds": elapsed,
+        "rows_per_s": n_rows / elapsed,
+        "peak_mb": peak / 1e6,
+        "summary": summary,
+    }
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="/predict/stream benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[20_000, 100_000])
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    run(1_000)  # warm-up (model load, compiled forest)
+
+    print(f"{'rows':>10}{'seconds':>10}{'rows/s':>12}{'peak MB':>10}  status")
+
+    for n_rows in args.rows:
+        r = run(n_rows)
+        meta = r["summary"].get("metadata", {})
+        print(
+            f"{r['rows']:>10,}{r['seconds']:>10.2f}{r['rows_per_s']:>12,.0f}"
+            f"{r['peak_mb']:>10.1f}  {r['summary']['status']} "
+            f"({meta.get('scored_rows', 0):,} scored)"
+        )
+
+
+if __name__ == "__main__":
+    main()
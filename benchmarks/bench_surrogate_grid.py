@@ -0,0 +1,86 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Surrogate Grid Benchmark
+Approximate (grid) vs exact /predict scoring:
+latency + error on real catalog planets
+
+Run:
+    python -m benchmarks.bench_surrogate_grid --n 2000
+=====================================================
+"""
+
+import argparse
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from backend.config import VALIDATION_RULES
+from backend.services.prediction_service import predict_planet_fast, score_components
+from backend.services.surrogate_grid import build_grid, load_grid, predict_approximate
+from benchmarks._common import sample_payloads, summarize_ms, time_calls
+
+
+def complete_payloads(n: int) -> list:
+    """Catalog payloads with all six inputs inside VALIDATION_RULES."""
+
+    payloads = []
+
+    for p in sample_payloads(n * 4):
+        if all(
+            p.get(k) is not None and lo <= p[k] <= hi
+            for k, (lo, hi) in VALIDATION_RULES.items()
+        ):
+            payloads.append(p)
+
+    return payloads[:n]
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Surrogate grid benchmark")
+    parser.add_argument("--n", type=int, default=2000, help="catalog payloads")
+    parser.add_argument("--rebuild", action="store_true", help="force a fresh grid build")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    grid = None if args.rebuild else load_grid()
+    if grid is None:
+        grid = build_grid()
+
+    meta = grid.meta
+    print(
+        f"🧮 {meta['grid_points']:,} points, model {meta['model_version']}, "
+        f"build {meta['build_seconds']}s, measured max |err| {meta['error']['max_abs_error']:.4f}"
+    )
+
+    payloads = complete_payloads(args.n)
+
+    # -------------------------------------------------
+    # Accuracy on real planets
+    # -------------------------------------------------
+    frame = pd.DataFrame(payloads)[list(grid.names)]
+    error = np.abs(grid.interpolate(frame.to_numpy()) - score_components(frame)[-1])
+
+    print(
+        f"🧪 Catalog error over {len(payloads):,} planets: "
+        f"max {error.max():.4f}, p99 {np.percentile(error, 99):.4f}, mean {error.mean():.5f}"
+    )
+
+    # -------------------------------------------------
+    # Latency
+    # -------------------------------------------------
+    calls = [(p,) for p in payloads]
+    predict_approximate(payloads[0])  # warm-up (mmap + lookup tables)
+
+    exact = summarize_ms(time_calls(predict_planet_fast, calls))
+    approx = summarize_ms(time_calls(predict_approximate, calls))
+
+    print(f"\n{'path':<24}{'p50 µs':>10}{'p99 µs':>10}")
+    print(f"{'predict_planet_fast':<24}{exact['p50_ms'] * 1000:>10.1f}{exact['p99_ms'] * 1000:>10.1f}")
+    print(f"{'predict_approximate':<24}{approx['p50_ms'] * 1000:>10.1f}{approx['p99_ms'] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+"""
+=====================================================
+🚀 ExoHabitAI — HTTP Load Test
+Throughput / tail latency of the API under a real WSGI
+server, with JSON results diffable against a baseline
+
+Starts the app locally (gunicorn with deployment/
+gunicorn.conf.py, or Werkzeug's threaded server when
+gunicorn is unavailable), waits for /ready, then drives
+--concurrency closed-loop clients (one keep-alive
+connection each) for --duration seconds after a
+--warmup period that is not recorded.
+
+Request mix:   --mix predict=6,rank=2,stats=1,importance=1
+Payloads:      --payloads sampled | jittered | hot
+  sampled    rows of ranked_exoplanets.csv
+  jittered   sampled rows with ±10% noise (defeats caching)
+  hot        20 repeated rows (cache-friendly traffic)
+Rows outside VALIDATION_RULES are skipped (jitter is clipped
+into range): errors then mean the server failed, not the input.
+
+Reports RPS, p50 / p95 / p99 and error rate per endpoint.
+
+Run:
+    python -m benchmarks.load_test --concurrency 8 --duration 30 \\
+        --output results.json
+    python -m benchmarks.load_test --baseline results.json --max-regression 10
+    python -m benchmarks.load_test --url http://127.0.0.1:5000   # running server
+=====================================================
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+
+import numpy as np
+
+from backend.config import VALIDATION_RULES
+from benchmarks._common import git_commit, sample_payloads
+
+
+DEFAULT_MIX = "predict=6,rank=2,stats=1,importance=1"
+
+PAYLOAD_MODES = ("sampled", "jittered", "hot")
+
+# Headline numbers compared against a baseline
+_LOWER_IS_BETTER = ("p50_ms", "p95_ms", "p99_ms", "error_rate")
+_HIGHER_IS_BETTER = ("rps",)
+
+
+# =====================================================
+# 🧾 REQUEST MIX
+# =====================================================
+
+def parse_mix(text: str) -> dict:
+    """'predict=6,rank=2' → {'predict': 6.0, 'rank': 2.0}"""
+
+    mix = {}
+
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+
+        if name not in ENDPOINTS:
+            raise ValueError(f"unknown endpoint in mix: {name} (choose from {', '.join(ENDPOINTS)})")
+
+        mix[name] = float(weight or 1)
+
+    return mix
+
+
+def _valid(payload: dict) -> bool:
+    return all(lo <= payload[k] <= hi for k, (lo, hi) in VALIDATION_RULES.items() if k in payload)
+
+
+def _jitter(payload: dict, rng) -> dict:
+    out = {}
+
+    for k, v in payload.items():
+        lo, hi = VALIDATION_RULES.get(k, (-np.inf, np.inf))
+        out[k] = min(max(v * rng.uniform(0.9, 1.1), lo), hi)
+
+    return out
+
+
+def _payload_source(mode: str, seed: int):
+    """Returns next_payload(rng) for the chosen distribution."""
+
+    size = 20 if mode == "hot" else 5000
+    pool = [p for p in sample_payloads(size * 2, seed=seed) if _valid(p)][:size]
+
+    if mode == "jittered":
+        return lambda rng: _jitter(rng.choice(pool), rng)
+
+    return lambda rng: rng.choice(pool)
+
+
+def _predict(rng, next_payload):
+    return "POST", "/predict", json.dumps(next_payload(rng))
+
+
+def _rank(rng, _):
+    query = urllib.parse.urlencode({
+        "limit": rng.choice((10, 20, 50, 100)),
+        "order": rng.choice(("desc", "asc")),
+    })
+    return "GET", f"/rank?{query}", None
+
+
+def _stats(rng, _):
+    return "GET", "/stats", None
+
+
+def _importance(rng, _):
+    return "GET", "/importance", None
+
+
+ENDPOINTS = {
+    "predict": _predict,
+    "rank": _rank,
+    "stats": _stats,
+    "importance": _importance,
+}
+
+
+# =====================================================
+# 🖥️ SERVER UNDER TEST
+# =====================================================
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _has_gunicorn() -> bool:
+    try:
+        import gunicorn  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def start_server(server: str, port: int, workers: int) -> subprocess.Popen:
+    env = dict(os.environ, EXOHABITAI_BIND=f"127.0.0.1:{port}", EXOHABITAI_WORKERS=str(workers))
+
+    if server == "gunicorn":
+        cmd = [sys.executable, "-m", "gunicorn", "-c", "deployment/gunicorn.conf.py", "backend.app:app"]
+    else:
+        cmd = [sys.executable, "-W", "ignore", "-m", "benchmarks.load_test", "--serve", str(port)]
+
+    return subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _serve(port: int):
+    """Werkzeug threaded WSGI server (fallback when gunicorn is missing)."""
+
+    from werkzeug.serving import run_simple
+    from backend.app import app
+
+    run_simple("127.0.0.1", port, app, threaded=True, use_reloader=False)
+
+
+def wait_ready(host: str, port: int, timeout: float):
+    """Poll /ready until 200 (model, warm-up and catalog loaded)."""
+
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=2)
+            conn.request("GET", "/ready")
+            status = conn.getresponse().status
+            conn.close()
+            if status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.25)
+
+    raise TimeoutError(f"server on {host}:{port} not ready after {timeout:.0f}s")
+
+
+# =====================================================
+# 🔥 LOAD GENERATION
+# =====================================================
+
+def _client(host, port, mix, next_payload, seed, warmup_until, stop_at, samples):
+    """One closed-loop client: send, wait for the full response, repeat."""
+
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = list(mix.values())
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+    while True:
+        now = time.perf_counter()
+        if now >= stop_at:
+            break
+
+        name = rng.choices(names, weights)[0]
+        method, path, body = ENDPOINTS[name](rng, next_payload)
+
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            status = 0                      # connection-level failure
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+
+        end = time.perf_counter()
+
+        if start >= warmup_until:
+            samples.append((name, status, (end - start) * 1000))
+
+    conn.close()
+
+
+def run_load(host, port, mix, payloads, concurrency, duration, warmup, seed=42) -> list:
+    """[(endpoint, status, latency_ms), ...] of the measured window."""
+
+    next_payload = _payload_source(payloads, seed)
+    warmup_until = time.perf_counter() + warmup
+    stop_at = warmup_until + duration
+
+    per_client = [[] for _ in range(concurrency)]
+    threads = [
+        threading.Thread(
+            target=_client,
+            args=(host, port, mix, next_payload, seed + i, warmup_until, stop_at, per_client[i]),
+            daemon=True,
+        )
+        for i in range(concurrency)
+    ]
+
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    return [s for samples in per_client for s in samples]
+
+
+# =====================================================
+# 📊 REPORT
+# =====================================================
+
+def summarize(samples: list, duration: float) -> dict:
+    def block(rows):
+        latency = np.asarray([ms for _, _, ms in rows], dtype=np.float64)
+        errors = sum(1 for _, status, _ in rows if not 200 <= status < 400)
+
+        if latency.size == 0:
+            return {"requests": 0, "errors": 0, "error_rate": 0.0, "rps": 0.0}
+
+        return {
+            "requests": int(latency.size),
+            "errors": errors,
+            "error_rate": round(errors / latency.size, 5),
+            "rps": round(latency.size / duration, 2),
+            "mean_ms": round(float(latency.mean()), 3),
+            "p50_ms": round(float(np.percentile(latency, 50)), 3),
+            "p95_ms": round(float(np.percentile(latency, 95)), 3),
+            "p99_ms": round(float(np.percentile(latency, 99)), 3),
+            "max_ms": round(float(latency.max()), 3),
+        }
+
+    by_endpoint = {}
+    for row in samples:
+        by_endpoint.setdefault(row[0], []).append(row)
+
+    return {
+        "overall": block(samples),
+        "endpoints": {name: block(rows) for name, rows in sorted(by_endpoint.items())},
+    }
+
+
+def _print_table(summary: dict):
+    print(f"\n{'endpoint':>12}{'requests':>10}{'RPS':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>9}")
+
+    rows = list(summary["endpoints"].items()) + [("overall", summary["overall"])]
+    for name, r in rows:
+        print(
+            f"{name:>12}{r['requests']:>10}{r['rps']:>10.1f}{r.get('p50_ms', 0):>10.2f}"
+            f"{r.get('p95_ms', 0):>10.2f}{r.get('p99_ms', 0):>10.2f}{r['error_rate']:>9.2%}"
+        )
+
+
+def compare(result: dict, baseline: dict, max_regression: float) -> list:
+    """
+    Print per-endpoint % change vs baseline.
+    Returns the regressions beyond max_regression percent.
+    """
+
+    regressions = []
+    print(f"\n📐 vs baseline ({baseline['meta'].get('git_commit')}, {baseline['meta'].get('timestamp')})")
+    print(f"{'endpoint':>12}{'metric':>12}{'baseline':>12}{'current':>12}{'change':>10}")
+
+    current_rows = {**result["endpoints"], "overall": result["overall"]}
+    baseline_rows = {**baseline["endpoints"], "overall": baseline["overall"]}
+
+    for name, current in current_rows.items():
+        base = baseline_rows.get(name)
+        if not base:
+            continue
+
+        for metric in _LOWER_IS_BETTER + _HIGHER_IS_BETTER:
+            old, new = base.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+
+            if metric == "error_rate":
+                # Absolute percentage points: any new errors matter
+                change = (new - old) * 100
+                worse = change > 0
+            else:
+                change = (new - old) / old * 100 if old else 0.0
+                worse = change > max_regression if metric in _LOWER_IS_BETTER else change < -max_regression
+
+            flag = "  ❌" if worse else ""
+            print(f"{name:>12}{metric:>12}{old:>12.3f}{new:>12.3f}{change:>+9.1f}%{flag}")
+
+            if worse:
+                regressions.append(f"{name} {metric} {change:+.1f}%")
+
+    return regressions
+
+
+# =====================================================
+# ▶️ CLI
+# =====================================================
+
+def main():
+
+    parser = argparse.ArgumentParser(description="ExoHabitAI HTTP load test")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=20, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3, help="unrecorded seconds first")
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--payloads", choices=PAYLOAD_MODES, default="sampled")
+    parser.add_argument("--server", choices=["gunicorn", "werkzeug"],
+                        default="gunicorn" if _has_gunicorn() else "werkzeug")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn workers")
+    parser.add_argument("--url", help="target an already running server instead")
+    parser.add_argument("--ready-timeout", type=float, default=180)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write JSON results here")
+    parser.add_argument("--baseline", help="JSON results to diff against")
+    parser.add_argument("--max-regression", type=float, default=10.0,
+                        help="%% worse latency / RPS vs baseline that fails the run")
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve)
+        return
+
+    mix = parse_mix(args.mix)
+    process = None
+
+    if args.url:
+        target = urllib.parse.urlparse(args.url)
+        host, port, server = target.hostname, target.port or 80, "external"
+    else:
+        host, port, server = "127.0.0.1", _free_port(), args.server
+        print(f"🚀 Starting {server} on {host}:{port} ...")
+        process = start_server(server, port, args.workers)
+
+    try:
+        wait_ready(host, port, args.ready_timeout)
+        print(f"🔥 {args.concurrency} clients × {args.duration:.0f}s (+{args.warmup:.0f}s warm-up), mix {args.mix}")
+
+        samples = run_load(
+            host, port, mix, args.payloads,
+            args.concurrency, args.duration, args.warmup, args.seed,
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+
+    result = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "server": server,
+            "workers": args.workers if server == "gunicorn" else None,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "mix": mix,
+            "payloads": args.payloads,
+            "seed": args.seed,
+        },
+        **summarize(samples, args.duration),
+    }
+
+    _print_table(result)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = compare(result, baseline, args.max_regression)
+
+        if regressions:
+            print(f"\n❌ Regressions beyond {args.max_regression:.0f}%: {'; '.join(regressions)}")
+            sys.exit(1)
+
+        print("\n✅ No regressions vs baseline")
+
+
+if __name__ == "__main__":
+    main()
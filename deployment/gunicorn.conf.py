@@ -0,0 +1,42 @@
+# ======================================================
+# 🚀 ExoHabitAI — Gunicorn Config (pre-fork, copy-on-write)
+#
+#     gunicorn -c deployment/gunicorn.conf.py backend.app:app
+#
+# The master imports the app, loads the model, compiled
+# forest and ranked catalog once, freezes the GC heap and
+# then forks: workers share those pages instead of each
+# unpickling its own copy. Check per-worker RSS / PSS with
+# GET /memory (PSS summed over workers = real footprint).
+#
+# Scoring jobs run next to the workers:
+#     python -m backend.services.job_queue
+# ======================================================
+
+import os
+import multiprocessing
+
+# Read by backend.config at import time (before the app loads)
+os.environ.setdefault("EXOHABITAI_PREFORK", "1")
+
+bind = os.getenv("EXOHABITAI_BIND", "127.0.0.1:5000")
+workers = int(os.getenv("EXOHABITAI_WORKERS", str(min(4, multiprocessing.cpu_count()))))
+worker_class = "sync"
+timeout = 120
+
+# Import the app (and load everything) in the master before forking
+preload_app = True
+
+
+def when_ready(server):
+    """Master, after the app import, before the first fork."""
+    from backend.prefork import preload
+
+    preload()
+
+
+def post_fork(server, worker):
+    """Worker, right after fork: start its background threads."""
+    from backend.prefork import after_fork
+
+    after_fork()
@@ -6,7 +6,11 @@ Robust NASA Exoplanet Archive CSV reader
 """
 
 import os
+import csv
+import json
 import logging
+import itertools
+import functools
 import pandas as pd
 
 from src.config import RAW_DATA_PATH
@@ -33,7 +37,6 @@ def _detect_delimiter(sample_text: str) -> str:
     NASA files are usually comma-separated,
     but some exports use | or ;.
     """
-    import csv
     try:
         dialect = csv.Sniffer().sniff(sample_text, delimiters=[",", "|", ";", "\t"])
         return dialect.delimiter
@@ -48,15 +51,20 @@ def _clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     - lowercase
     - remove hidden characters
     """
-    df.columns = (
-        df.columns
+    df.columns = _clean_names(df.columns)
+    return df
+
+
+def _clean_names(names) -> list:
+    """Column-name cleaning shared by the file and stream readers."""
+    return list(
+        pd.Index(list(names))
         .astype(str)
         .str.strip()
         .str.replace(" ", "_")
         .str.replace(r"[^\w_]", "", regex=True)
         .str.lower()
     )
-    return df
 
 
 # -----------------------------------------------------
@@ -109,4 +117,135 @@ def load_raw_data(path: str = RAW_DATA_PATH) -> pd.DataFrame:
     logger.info(f"📊 Shape: {df.shape}")
     logger.info(f"🧪 First columns: {list(df.columns[:10])}")
 
-    return df
\ No newline at end of file
+    return df
+
+
+# -----------------------------------------------------
+# STREAMING READER (bounded memory)
+# -----------------------------------------------------
+
+# Cells read_csv treats as missing (case-insensitive subset of its defaults)
+_NA_VALUES = {"", "na", "n/a", "#n/a", "nan", "-nan", "null", "none", "<na>"}
+
+
+def _parse_value(raw: str):
+    """CSV cell -> float when numeric, raw text otherwise."""
+    try:
+        return float(raw)
+    except ValueError:
+        return raw.strip()
+
+
+@functools.lru_cache(maxsize=64)
+def _clean_key_tuple(keys: tuple) -> tuple:
+    return tuple(_clean_names(keys))
+
+
+def _data_lines(lines):
+    """Drop NASA metadata (# lines) and blank lines."""
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            yield line
+
+
+def _csv_records(lines, delimiter: str):
+    reader = csv.reader(lines, delimiter=delimiter)
+    header = next(reader, None)
+
+    if header is None:
+        return
+
+    columns = _clean_names(header)
+
+    for row in reader:
+        if len(row) != len(columns):
+            continue  # on_bad_lines="skip"
+
+        # Missing cells are left out (same as NaN in read_csv)
+        yield {
+            col: _parse_value(raw)
+            for col, raw in zip(columns, row)
+            if raw.strip().lower() not in _NA_VALUES
+        }
+
+
+def _ndjson_records(lines):
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield "invalid JSON line"
+            continue
+
+        if isinstance(record, dict):
+            record = dict(zip(_clean_key_tuple(tuple(record)), record.values()))
+
+        yield record
+
+
+def _detect_format(data_lines) -> str:
+    """NDJSON when the first data line is a JSON object, CSV otherwise."""
+    first = data_lines[0].lstrip() if data_lines else ""
+    return "ndjson" if first.startswith("{") else "csv"
+
+
+def count_data_rows(path: str, fmt: str = None) -> int:
+    """
+    Cheap row estimate for progress reporting: data lines
+    (no # metadata, no blanks) minus the CSV header.
+    """
+
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        lines = _data_lines(f)
+        first = next(lines, None)
+
+        if first is None:
+            return 0
+
+        n_rows = 1 + sum(1 for _ in lines)
+
+    if (fmt or _detect_format([first])) == "csv":
+        n_rows -= 1
+
+    return n_rows
+
+
+def iter_record_chunks(text_stream, chunk_rows: int = 1000, fmt: str = None):
+    """
+    Incrementally parse a CSV or NDJSON text stream into
+    lists of at most chunk_rows planet dicts.
+
+    Same rules as load_raw_data:
+    ✔ skips metadata (# lines)
+    ✔ sniffs the delimiter on the first 5000 characters
+    ✔ cleans column names
+
+    fmt: "csv", "ndjson" or None (auto-detect from the first
+    data line). NDJSON lines that are not valid JSON are
+    yielded as a string so callers can reject that row.
+    Only one chunk is held in memory at a time.
+    """
+
+    # Sniff on the first 5000 characters, completed to a full line
+    sample = text_stream.read(5000)
+    head = sample + text_stream.readline()
+    lines = _data_lines(itertools.chain(head.splitlines(keepends=True), text_stream))
+
+    sample_lines = list(_data_lines(sample.splitlines(keepends=True)))
+
+    if fmt is None:
+        fmt = _detect_format(sample_lines)
+
+    if fmt == "ndjson":
+        records = _ndjson_records(lines)
+    else:
+        delimiter = _detect_delimiter("".join(sample_lines))
+        logger.info(f"🔎 Detected delimiter: '{delimiter}'")
+        records = _csv_records(lines, delimiter)
+
+    while True:
+        chunk = list(itertools.islice(records, chunk_rows))
+        if not chunk:
+            return
+        yield chunk
@@ -8,6 +8,8 @@ Scientific & Production-ready feature creation
 import numpy as np
 import pandas as pd
 
+from src.scoring_kernels import safe_score_into, hsi_into, sci_into
+
 
 # -----------------------------------------------------
 # SAFE SCORE FUNCTION
@@ -20,12 +22,27 @@ def safe_score(series, ideal: float, scale: float):
     score = 1 - (abs(x - ideal) / scale)
 
     Works safely even if column missing.
+    Always returns pandas Series (API-safe).
     """
     if isinstance(series, (int, float)):
         series = pd.Series([series])
+    elif not isinstance(series, pd.Series):
+        series = pd.Series(series)
+
+    values = series.to_numpy(dtype=np.float64)
+    out = safe_score_into(values, ideal, scale, out=np.empty_like(values))
+
+    return pd.Series(out, index=series.index)
 
-    score = 1 - (np.abs(series - ideal) / scale)
-    return np.clip(score, 0, 1)
+
+def _column_values(df: pd.DataFrame, col: str):
+    """
+    Column as float64 ndarray (no copy if already float64).
+    Missing column -> scalar 0 (broadcast by the kernels).
+    """
+    if col not in df.columns:
+        return 0.0
+    return df[col].to_numpy(dtype=np.float64)
 
 
 # -----------------------------------------------------
@@ -40,13 +57,17 @@ def create_hsi(df: pd.DataFrame) -> pd.Series:
         - equilibrium temperature
     """
 
-    radius = df["pl_rade"] if "pl_rade" in df.columns else pd.Series(0, index=df.index)
-    temp = df["pl_eqt"] if "pl_eqt" in df.columns else pd.Series(0, index=df.index)
+    out = np.empty(len(df), dtype=np.float64)
+    scratch = np.empty_like(out)
 
-    radius_score = safe_score(radius, ideal=1.0, scale=1.5)
-    temp_score = safe_score(temp, ideal=288, scale=200)
+    hsi_into(
+        _column_values(df, "pl_rade"),
+        _column_values(df, "pl_eqt"),
+        out=out,
+        scratch=scratch,
+    )
 
-    return (radius_score.fillna(0) + temp_score.fillna(0)) / 2
+    return pd.Series(out, index=df.index)
 
 
 # -----------------------------------------------------
@@ -59,15 +80,18 @@ def create_sci(df: pd.DataFrame) -> pd.Series:
     Measures similarity to Sun-like stars.
     """
 
-    teff = df["st_teff"] if "st_teff" in df.columns else pd.Series(0, index=df.index)
-    mass = df["st_mass"] if "st_mass" in df.columns else pd.Series(0, index=df.index)
-    rad = df["st_rad"] if "st_rad" in df.columns else pd.Series(0, index=df.index)
+    out = np.empty(len(df), dtype=np.float64)
+    scratch = np.empty_like(out)
 
-    teff_score = safe_score(teff, ideal=5778, scale=2500)
-    mass_score = safe_score(mass, ideal=1.0, scale=1.0)
-    rad_score = safe_score(rad, ideal=1.0, scale=1.0)
+    sci_into(
+        _column_values(df, "st_teff"),
+        _column_values(df, "st_mass"),
+        _column_values(df, "st_rad"),
+        out=out,
+        scratch=scratch,
+    )
 
-    return (teff_score.fillna(0) + mass_score.fillna(0) + rad_score.fillna(0)) / 3
+    return pd.Series(out, index=df.index)
 
 
 # -----------------------------------------------------
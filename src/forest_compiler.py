@@ -0,0 +1,297 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Flat-Array Forest Compiler
+Exports a fitted Pipeline[SimpleImputer, RandomForest]
+into contiguous NumPy arrays + a vectorized evaluator
+=====================================================
+
+Layout (all trees concatenated, node ids are global):
+
+    feature      int32    split feature per node (0 at leaves)
+    threshold    float64  split threshold (+inf at leaves)
+    left/right   int32    child ids (leaves point to themselves)
+    leaf_value   float64  normalized class probabilities per node
+    roots        int32    root node id of every tree
+
+Evaluation walks ALL trees for a batch level by level:
+one gather + compare + child lookup per depth level for
+every still-active (tree, row) pair, no Python loop over
+trees or rows.
+
+sklearn is NOT imported here: the compiler only reads
+fitted attributes, the evaluator only needs NumPy.
+"""
+
+import numpy as np
+
+
+# Rows evaluated together (bounds the (trees x rows) work arrays)
+DEFAULT_CHUNK_ROWS = 1024
+
+# Final estimators with the RandomForest tree/proba semantics
+SUPPORTED_FORESTS = {
+    "RandomForestClassifier",
+    "ExtraTreesClassifier",
+    "DecisionTreeClassifier",
+}
+
+
+# -----------------------------------------------------
+# COMPILED MODEL
+# -----------------------------------------------------
+
+class CompiledForest:
+    """
+    Flat-array twin of a fitted imputer + forest pipeline.
+
+    predict_proba(X) matches sklearn within 1e-12
+    (same float32 input cast, same per-tree normalization,
+    same tree-order accumulation).
+    """
+
+    def __init__(
+        self,
+        feature_names,
+        classes,
+        fill_values,
+        keep_columns,
+        feature,
+        threshold,
+        left,
+        right,
+        leaf_value,
+        roots,
+        max_depth,
+        feature_importances=None,
+        children=None,
+        is_leaf=None,
+    ):
+        self.feature_names = list(feature_names)
+        self.classes = np.asarray(classes)
+        self.fill_values = fill_values
+        self.keep_columns = keep_columns
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.leaf_value = leaf_value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.feature_importances = feature_importances
+
+        # Derived traversal tables: children[2*node + go_right]
+        # (passed in when loaded from a stored artifact)
+        if children is None:
+            children = np.column_stack([left, right]).astype(np.int32).ravel()
+        if is_leaf is None:
+            is_leaf = left == np.arange(left.shape[0], dtype=left.dtype)
+
+        self._children = children
+        self._is_leaf = is_leaf
+
+    @property
+    def n_trees(self) -> int:
+        return int(self.roots.shape[0])
+
+    @property
+    def n_nodes(self) -> int:
+        return int(self.feature.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [
+            self.feature, self.threshold, self.left, self.right,
+            self.leaf_value, self.roots,
+        ]
+        return int(sum(a.nbytes for a in arrays))
+
+    # -------------------------------------------------
+    # PREPROCESSING (SimpleImputer twin)
+    # -------------------------------------------------
+
+    def _prepare(self, X) -> np.ndarray:
+        """
+        Imputer step + float32 cast used by sklearn trees.
+        X columns must follow feature_names order.
+        """
+
+        if hasattr(X, "columns"):
+            X = X[self.feature_names].to_numpy(dtype=np.float64)
+        else:
+            X = np.asarray(X, dtype=np.float64)
+
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        if self.fill_values is not None:
+            missing = np.isnan(X)
+            if missing.any():
+                X = np.where(missing, self.fill_values, X)
+
+        if self.keep_columns is not None:
+            X = X[:, self.keep_columns]
+
+        return np.ascontiguousarray(X, dtype=np.float32)
+
+    # -------------------------------------------------
+    # VECTORIZED LEVEL-BY-LEVEL TRAVERSAL
+    # -------------------------------------------------
+
+    def apply(self, X32: np.ndarray) -> np.ndarray:
+        """
+        Leaf node id of every (tree, row) pair.
+        X32: prepared float32 matrix. Returns (n_trees, n_rows).
+
+        Every level advances all still-active (tree, row)
+        pairs with one gather / compare / child lookup; pairs
+        that reach a leaf drop out of the active set.
+        """
+
+        n_rows, n_features = X32.shape
+        n_trees = self.n_trees
+        flat_x = X32.ravel()
+
+        leaves = np.empty(n_trees * n_rows, dtype=np.int32)
+
+        node = np.repeat(self.roots, n_rows)
+        row_offset = np.tile(np.arange(n_rows, dtype=np.int32) * np.int32(n_features), n_trees)
+        active = np.arange(n_trees * n_rows, dtype=np.int32)
+
+        while node.size:
+            go_right = flat_x[row_offset + self.feature[node]] > self.threshold[node]
+            node = self._children[2 * node + go_right]
+
+            done = self._is_leaf[node]
+            if done.any():
+                leaves[active[done]] = node[done]
+                pending = ~done
+                node = node[pending]
+                row_offset = row_offset[pending]
+                active = active[pending]
+
+        return leaves.reshape(n_trees, n_rows)
+
+    def predict_proba(self, X, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> np.ndarray:
+        """Class probabilities, shape (n_rows, n_classes)."""
+
+        X32 = self._prepare(X)
+        n_rows = X32.shape[0]
+
+        proba = np.empty((n_rows, self.leaf_value.shape[1]), dtype=np.float64)
+
+        for start in range(0, n_rows, chunk_rows):
+            stop = min(start + chunk_rows, n_rows)
+            leaves = self.apply(X32[start:stop])
+
+            # (trees, rows, classes) summed in tree order, like sklearn
+            np.add.reduce(self.leaf_value[leaves], axis=0, out=proba[start:stop])
+
+        proba /= self.n_trees
+        return proba
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes[np.argmax(self.predict_proba(X), axis=1)]
+
+
+# -----------------------------------------------------
+# COMPILER
+# -----------------------------------------------------
+
+def _split_pipeline(model):
+    """Return (imputer_or_None, final_estimator) or raise ValueError."""
+
+    if not hasattr(model, "named_steps"):
+        return None, model
+
+    *pre_steps, estimator = list(model.named_steps.values())
+
+    if len(pre_steps) > 1 or any(type(s).__name__ != "SimpleImputer" for s in pre_steps):
+        raise ValueError("only Pipeline[SimpleImputer, forest] can be compiled")
+
+    imputer = pre_steps[0] if pre_steps else None
+
+    missing = getattr(imputer, "missing_values", np.nan)
+    if imputer is not None and not (isinstance(missing, float) and np.isnan(missing)):
+        raise ValueError("imputer must use missing_values=np.nan")
+
+    return imputer, estimator
+
+
+def compile_forest(model) -> CompiledForest:
+    """
+    Export a fitted (imputer +) forest into flat arrays.
+    Raises ValueError for unsupported model types.
+    """
+
+    imputer, estimator = _split_pipeline(model)
+
+    if type(estimator).__name__ not in SUPPORTED_FORESTS:
+        raise ValueError(f"cannot compile estimator: {type(estimator).__name__}")
+
+    if getattr(estimator, "n_outputs_", 1) != 1:
+        raise ValueError("multi-output forests are not supported")
+
+    trees = getattr(estimator, "estimators_", [estimator])
+    feature_names = getattr(model, "feature_names_in_", None)
+    n_features = getattr(model, "n_features_in_", None)
+
+    if feature_names is None:
+        feature_names = [f"feature_{i}" for i in range(n_features)]
+
+    # -------------------------------------------------
+    # Imputer statistics
+    # -------------------------------------------------
+    fill_values = None
+    keep_columns = None
+
+    if imputer is not None:
+        fill_values = np.asarray(imputer.statistics_, dtype=np.float64)
+        valid = ~np.isnan(fill_values)
+
+        if not getattr(imputer, "keep_empty_features", False) and not valid.all():
+            keep_columns = np.flatnonzero(valid)
+
+    # -------------------------------------------------
+    # Concatenate every tree into global node arrays
+    # -------------------------------------------------
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+
+    for tree in trees:
+        t = tree.tree_
+        n = t.node_count
+        is_leaf = t.children_left == -1
+        ids = np.arange(offset, offset + n, dtype=np.int32)
+
+        features.append(np.where(is_leaf, 0, t.feature).astype(np.int32))
+        thresholds.append(np.where(is_leaf, np.inf, t.threshold).astype(np.float64))
+        lefts.append(np.where(is_leaf, ids, t.children_left + offset).astype(np.int32))
+        rights.append(np.where(is_leaf, ids, t.children_right + offset).astype(np.int32))
+
+        # DecisionTreeClassifier.predict_proba normalization
+        value = t.value[:, 0, :].astype(np.float64)
+        normalizer = value.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        values.append(value / normalizer)
+
+        roots.append(offset)
+        max_depth = max(max_depth, int(t.max_depth))
+        offset += n
+
+    importances = getattr(estimator, "feature_importances_", None)
+
+    return CompiledForest(
+        feature_names=feature_names,
+        classes=estimator.classes_,
+        fill_values=fill_values,
+        keep_columns=keep_columns,
+        feature=np.concatenate(features),
+        threshold=np.concatenate(thresholds),
+        left=np.concatenate(lefts),
+        right=np.concatenate(rights),
+        leaf_value=np.ascontiguousarray(np.concatenate(values)),
+        roots=np.asarray(roots, dtype=np.int32),
+        max_depth=max_depth,
+        feature_importances=None if importances is None else np.asarray(importances, dtype=np.float64),
+    )
@@ -0,0 +1,225 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Compact Forest Artifact
+One memory-mappable file per trained forest: flat tree
+arrays, imputer statistics, feature order, fusion
+weights and decision threshold
+=====================================================
+
+<model>.forest.npy is a regular 1-D uint8 .npy file:
+
+    b"EXOFRST1"               magic
+    uint64 little-endian      header length
+    header (JSON, utf-8)      metadata + array table
+    array blobs               each 64-byte aligned
+
+load_artifact() maps it with np.load(mmap_mode="r") and
+returns zero-copy array views: loading costs a JSON parse,
+and pages are shared by every process mapping the file.
+
+Neither sklearn nor pickle is needed to load or evaluate.
+
+Convert existing pickles:
+    python -m src.model_artifact models/week4_best_model.pkl
+"""
+
+import os
+import sys
+import json
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.forest_compiler import CompiledForest, compile_forest
+from src.scoring_kernels import FUSION_WEIGHTS, FUSION_BOOST
+
+
+FORMAT = "exohabitai-forest"
+FORMAT_VERSION = 1
+
+MAGIC = b"EXOFRST1"
+ALIGNMENT = 64
+
+# Fused score at / above which a planet is predicted habitable
+DECISION_THRESHOLD = 0.58
+
+# CompiledForest attributes stored as arrays (None = optional)
+_ARRAYS = (
+    "classes",
+    "feature",
+    "threshold",
+    "left",
+    "right",
+    "leaf_value",
+    "roots",
+    "fill_values",
+    "keep_columns",
+    "feature_importances",
+    "_children",
+    "_is_leaf",
+)
+
+
+# -----------------------------------------------------
+# PATHS
+# -----------------------------------------------------
+
+def artifact_path(model_path: str) -> str:
+    """models/x.pkl → models/x.forest.npy"""
+    return os.path.splitext(model_path)[0] + ".forest.npy"
+
+
+def _padded(size: int) -> int:
+    return -size % ALIGNMENT
+
+
+# -----------------------------------------------------
+# SAVE
+# -----------------------------------------------------
+
+def save_artifact(model, path: str, source_sha256: str = None) -> dict:
+    """
+    Write a fitted forest pipeline (or CompiledForest) as one
+    compact artifact. Returns the header.
+    Raises ValueError for models the compiler cannot flatten.
+    """
+
+    forest = model if isinstance(model, CompiledForest) else compile_forest(model)
+
+    arrays = {}
+    for name in _ARRAYS:
+        value = getattr(forest, name)
+        if value is not None:
+            value = np.ascontiguousarray(value)
+            if value.dtype.hasobject:
+                raise ValueError(f"cannot store object array: {name}")
+            arrays[name] = value
+
+    header = {
+        "format": FORMAT,
+        "format_version": FORMAT_VERSION,
+        "source_sha256": source_sha256,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "feature_names": [str(f) for f in forest.feature_names],
+        "max_depth": forest.max_depth,
+        "n_trees": forest.n_trees,
+        "n_nodes": forest.n_nodes,
+        "fusion": {
+            "weights": list(FUSION_WEIGHTS),
+            "boost": FUSION_BOOST,
+            "decision_threshold": DECISION_THRESHOLD,
+        },
+        "arrays": {},
+    }
+
+    # Offsets are relative to the first blob, which starts right
+    # after the (padded) header
+    offset = 0
+    for name, value in arrays.items():
+        header["arrays"][name] = {
+            "offset": offset,
+            "dtype": value.dtype.str,
+            "shape": list(value.shape),
+        }
+        offset += value.nbytes + _padded(value.nbytes)
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    prefix = len(MAGIC) + 8 + len(header_bytes)
+    header_bytes += b" " * _padded(prefix)
+
+    parts = [MAGIC, np.uint64(len(header_bytes)).tobytes(), header_bytes]
+    for value in arrays.values():
+        parts.append(value.tobytes())
+        parts.append(b"\0" * _padded(value.nbytes))
+
+    payload = np.frombuffer(b"".join(parts), dtype=np.uint8)
+
+    # Atomic publish: readers never map a half-written file
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+
+    with open(tmp, "wb") as f:
+        np.save(f, payload)
+
+    os.replace(tmp, path)
+
+    return header
+
+
+# -----------------------------------------------------
+# LOAD
+# -----------------------------------------------------
+
+def read_header(blob: np.ndarray) -> tuple:
+    """(header dict, offset of the first array blob)"""
+
+    if bytes(blob[:len(MAGIC)]) != MAGIC:
+        raise ValueError("not an ExoHabitAI forest artifact")
+
+    size = int(blob[len(MAGIC):len(MAGIC) + 8].view("<u8")[0])
+    start = len(MAGIC) + 8
+    header = json.loads(bytes(blob[start:start + size]).decode("utf-8"))
+
+    if header.get("format") != FORMAT or header.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"unsupported artifact format: {header.get('format')} v{header.get('format_version')}")
+
+    return header, start + size
+
+
+def load_artifact(path: str, mmap: bool = True):
+    """
+    (CompiledForest, header) from an artifact file.
+    With mmap=True arrays are read-only views of the mapped file.
+    """
+
+    blob = np.load(path, mmap_mode="r" if mmap else None)
+    header, base = read_header(blob)
+
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        start = base + spec["offset"]
+
+        view = blob[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+
+        # Plain ndarray view (no np.memmap subclass overhead per operation)
+        arrays[name] = np.asarray(view)
+
+    forest = CompiledForest(
+        feature_names=header["feature_names"],
+        classes=arrays["classes"],
+        fill_values=arrays.get("fill_values"),
+        keep_columns=arrays.get("keep_columns"),
+        feature=arrays["feature"],
+        threshold=arrays["threshold"],
+        left=arrays["left"],
+        right=arrays["right"],
+        leaf_value=arrays["leaf_value"],
+        roots=arrays["roots"],
+        max_depth=header["max_depth"],
+        feature_importances=arrays.get("feature_importances"),
+        children=arrays.get("_children"),
+        is_leaf=arrays.get("_is_leaf"),
+    )
+
+    return forest, header
+
+
+# -----------------------------------------------------
+# CLI: convert pickled models
+# -----------------------------------------------------
+
+if __name__ == "__main__":
+    import joblib
+
+    from src.model_manifest import file_sha256
+
+    for model_path in sys.argv[1:] or ["models/week4_best_model.pkl"]:
+        out = artifact_path(model_path)
+        header = save_artifact(joblib.load(model_path), out, file_sha256(model_path))
+
+        print(
+            f"✅ {model_path} → {out} "
+            f"({header['n_trees']} trees, {os.path.getsize(out) / 1e6:.2f} MB)"
+        )
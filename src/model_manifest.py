@@ -0,0 +1,190 @@
+"""
+=====================================================
+🚀 ExoHabitAI — Versioned Model Manifest
+Publishes trained models as content-addressed artifacts
+=====================================================
+
+models/
+  manifest.json
+  week4_best_model.<version>.pkl
+  week4_best_model.<version>.forest.npy   (forests: src/model_artifact)
+  ...
+
+manifest.json:
+  {
+    "current": "<version>",
+    "versions": [
+      {"version", "artifact", "forest_artifact", "sha256",
+       "features", "metrics", "estimator", "created_at"},
+      ...                                  (oldest first)
+    ]
+  }
+
+version = first 12 hex chars of the artifact's sha256,
+so the same bytes always get the same version.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime, timezone
+
+import joblib
+
+from src.model_artifact import artifact_path, save_artifact
+
+
+MANIFEST_NAME = "manifest.json"
+
+# Versions kept in the manifest (older artifacts are deleted;
+# the current version is always kept)
+KEEP_VERSIONS = 10
+
+
+# -----------------------------------------------------
+# HELPERS
+# -----------------------------------------------------
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def manifest_path(models_dir: str) -> str:
+    return os.path.join(models_dir, MANIFEST_NAME)
+
+
+def read_manifest(models_dir: str):
+    """Parsed manifest, or None when the directory has none."""
+
+    path = manifest_path(models_dir)
+
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_manifest(models_dir: str, manifest: dict):
+    """Atomic replace: readers never see a half-written manifest."""
+
+    path = manifest_path(models_dir)
+    tmp = f"{path}.{os.getpid()}.tmp"
+
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    os.replace(tmp, path)
+
+
+def find_version(manifest: dict, version: str):
+    for entry in manifest.get("versions", []):
+        if entry["version"] == version:
+            return entry
+    return None
+
+
+def _final_estimator(model):
+    if hasattr(model, "named_steps"):
+        return list(model.named_steps.values())[-1]
+    return model
+
+
+# -----------------------------------------------------
+# PUBLISH
+# -----------------------------------------------------
+
+def publish_model(
+    model,
+    models_dir: str,
+    name: str = "week4_best_model",
+    metrics: dict = None,
+    make_current: bool = True,
+) -> dict:
+    """
+    Save a trained model as a versioned artifact and (unless
+    make_current=False) make it the manifest's current version.
+    Returns the manifest entry.
+
+    The serving registry watches the manifest and hot-swaps
+    to the new version; other versions can be pinned per
+    request (?model_version=).
+    """
+
+    os.makedirs(models_dir, exist_ok=True)
+
+    tmp = os.path.join(models_dir, f".{name}.{os.getpid()}.tmp")
+    joblib.dump(model, tmp)
+
+    sha256 = file_sha256(tmp)
+    version = sha256[:12]
+    artifact = f"{name}.{version}.pkl"
+
+    os.replace(tmp, os.path.join(models_dir, artifact))
+
+    # Compact flat-array twin (loads without sklearn / pickle)
+    forest_artifact = artifact_path(artifact)
+    try:
+        save_artifact(model, os.path.join(models_dir, forest_artifact), sha256)
+    except ValueError:
+        forest_artifact = None
+
+    features = getattr(model, "feature_names_in_", None)
+
+    entry = {
+        "version": version,
+        "artifact": artifact,
+        "forest_artifact": forest_artifact,
+        "sha256": sha256,
+        "features": [str(f) for f in features] if features is not None else None,
+        "metrics": metrics or {},
+        "estimator": type(_final_estimator(model)).__name__,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    manifest = read_manifest(models_dir) or {"current": None, "versions": []}
+
+    versions = [v for v in manifest["versions"] if v["version"] != version]
+    versions.append(entry)
+
+    if make_current:
+        manifest["current"] = version
+
+    # Drop the oldest artifacts beyond KEEP_VERSIONS
+    kept = versions[-KEEP_VERSIONS:]
+
+    for old in versions[:-KEEP_VERSIONS]:
+        if old["version"] == manifest["current"]:
+            kept.insert(0, old)
+            continue
+        for name in (old["artifact"], old.get("forest_artifact")):
+            try:
+                os.remove(os.path.join(models_dir, name))
+            except (OSError, TypeError):
+                pass
+
+    manifest["versions"] = kept
+
+    write_manifest(models_dir, manifest)
+
+    return entry
+
+
+def set_current_version(models_dir: str, version: str) -> dict:
+    """Point the manifest at an already published version (rollback)."""
+
+    manifest = read_manifest(models_dir)
+
+    if manifest is None or find_version(manifest, version) is None:
+        raise ValueError(f"unknown model version: {version}")
+
+    manifest["current"] = version
+    write_manifest(models_dir, manifest)
+
+    return find_version(manifest, version)
@@ -0,0 +1,154 @@
+"""
+=====================================================
+🚀 ExoHabitAI — NumPy Scoring Kernels
+Single source of truth for the habitability maths
+
+Every kernel:
+✔ takes plain ndarrays (or scalars, broadcast)
+✔ writes into a caller-supplied out= buffer
+✔ allocates nothing in the hot loop
+
+Used by training (feature_engineering), the API
+(week2 feature engineering, batch scoring) and bulk
+ranking jobs.
+=====================================================
+"""
+
+import numpy as np
+
+
+# -----------------------------------------------------
+# SCIENTIFIC CONSTANTS
+# -----------------------------------------------------
+
+# (ideal, scale) pairs used by the distance-from-ideal scores
+RADIUS_IDEAL = (1.0, 1.5)
+EQT_IDEAL = (288, 200)
+TEFF_IDEAL = (5778, 2500)
+MASS_IDEAL = (1.0, 1.0)
+STAR_RADIUS_IDEAL = (1.0, 1.0)
+
+# Orbit stability: Earth-like ~365 days = ideal
+ORBIT_IDEAL = (365, 600)
+ORBIT_NEUTRAL = 0.5
+
+# Quantum fusion weights (model, HSI, SCI, orbit) + boost curve
+FUSION_WEIGHTS = (0.35, 0.30, 0.20, 0.15)
+FUSION_BOOST = 0.85
+
+
+# -----------------------------------------------------
+# BASE KERNEL
+# -----------------------------------------------------
+
+def safe_score_into(x, ideal: float, scale: float, out: np.ndarray) -> np.ndarray:
+    """
+    out = clip(1 - |x - ideal| / scale, 0, 1)
+    NaN inputs stay NaN (see _fill_nan_zero).
+    """
+    np.subtract(x, ideal, out=out)
+    np.abs(out, out=out)
+    np.divide(out, scale, out=out)
+    np.subtract(1, out, out=out)
+    np.clip(out, 0, 1, out=out)
+    return out
+
+
+def _fill_nan_zero(out: np.ndarray) -> np.ndarray:
+    """
+    In-place fillna(0) for scores already clipped to [0, 1]:
+    fmax leaves real values untouched and maps NaN -> 0.
+    """
+    return np.fmax(out, 0.0, out=out)
+
+
+# -----------------------------------------------------
+# HABITABILITY SCORE INDEX (HSI)
+# -----------------------------------------------------
+
+def hsi_into(radius, temp, out: np.ndarray, scratch: np.ndarray) -> np.ndarray:
+    """
+    HSI = (radius_score + temp_score) / 2
+    scratch must have the same shape as out.
+    """
+    _fill_nan_zero(safe_score_into(radius, *RADIUS_IDEAL, out=out))
+    _fill_nan_zero(safe_score_into(temp, *EQT_IDEAL, out=scratch))
+    np.add(out, scratch, out=out)
+    np.divide(out, 2, out=out)
+    return out
+
+
+# -----------------------------------------------------
+# STELLAR COMPATIBILITY INDEX (SCI)
+# -----------------------------------------------------
+
+def sci_into(teff, mass, rad, out: np.ndarray, scratch: np.ndarray) -> np.ndarray:
+    """
+    SCI = (teff_score + mass_score + rad_score) / 3
+    scratch must have the same shape as out.
+    """
+    _fill_nan_zero(safe_score_into(teff, *TEFF_IDEAL, out=out))
+    _fill_nan_zero(safe_score_into(mass, *MASS_IDEAL, out=scratch))
+    np.add(out, scratch, out=out)
+    _fill_nan_zero(safe_score_into(rad, *STAR_RADIUS_IDEAL, out=scratch))
+    np.add(out, scratch, out=out)
+    np.divide(out, 3, out=out)
+    return out
+
+
+# -----------------------------------------------------
+# ORBITAL STABILITY INDEX
+# -----------------------------------------------------
+
+def orbit_stability_into(orbper, out: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
+    """
+    out = clip(1 - |orbper - 365| / 600, 0, 1)
+    Zero / missing periods stay neutral (0.5).
+
+    NaN counts as missing, like the original batch code
+    (nan_to_num → 0 → neutral). The scalar
+    orbital_stability_score never sees NaN from JSON (null →
+    0); a literal float NaN there would clip to 1.0 instead.
+
+    mask: optional bool buffer (same shape as out) for the
+    neutral-period test; allocated if omitted.
+    """
+    if mask is None:
+        mask = np.empty(out.shape, dtype=bool)
+
+    ideal, scale = ORBIT_IDEAL
+
+    np.subtract(orbper, ideal, out=out)
+    np.abs(out, out=out)
+    np.divide(out, scale, out=out)
+    np.subtract(1, out, out=out)
+    np.clip(out, 0.0, 1.0, out=out)
+
+    np.isnan(orbper, out=mask)
+    np.copyto(out, ORBIT_NEUTRAL, where=mask)
+    np.equal(orbper, 0, out=mask)
+    np.copyto(out, ORBIT_NEUTRAL, where=mask)
+    return out
+
+
+# -----------------------------------------------------
+# QUANTUM FUSION ENGINE
+# -----------------------------------------------------
+
+def fusion_into(model_prob, hsi, sci, orbit_score, out: np.ndarray, scratch: np.ndarray) -> np.ndarray:
+    """
+    out = (0.35*p + 0.30*hsi + 0.20*sci + 0.15*orbit) ** 0.85
+    with every input clipped to [0, 1]. Not rounded.
+    """
+    w_model, w_hsi, w_sci, w_orbit = FUSION_WEIGHTS
+
+    np.clip(model_prob, 0, 1, out=out)
+    np.multiply(w_model, out, out=out)
+
+    for weight, values in ((w_hsi, hsi), (w_sci, sci), (w_orbit, orbit_score)):
+        np.clip(values, 0, 1, out=scratch)
+        np.multiply(weight, scratch, out=scratch)
+        np.add(out, scratch, out=out)
+
+    np.power(out, FUSION_BOOST, out=out)
+    return out
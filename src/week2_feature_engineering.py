@@ -6,74 +6,20 @@ Production Scientific Version
 """
 
 import os
-import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
 from src.utils import ensure_dir_exists, log
 
+# ⭐ ONE implementation of the habitability maths (NumPy kernels)
+from src.feature_engineering import safe_score, create_hsi, create_sci  # noqa: F401
+
 
 CLEANED_PATH = os.path.join("data", "processed", "cleaned_exoplanets.csv")
 ENGINEERED_PATH = os.path.join("data", "processed", "feature_engineered_exoplanets.csv")
 FIG_DIR = os.path.join("reports", "figures")
 
 
-# ======================================================
-# ⭐ SAFE SCORE FUNCTION
-# ======================================================
-
-def safe_score(series, ideal, scale):
-    """
-    Creates score between 0 and 1 based on distance from ideal.
-    Always returns pandas Series (API-safe).
-    """
-
-    if not isinstance(series, pd.Series):
-        series = pd.Series(series)
-
-    # Vectorized safe math
-    score = 1 - (np.abs(series - ideal) / scale)
-    score = np.clip(score, 0, 1)
-
-    return pd.Series(score, index=series.index)
-
-
-# ======================================================
-# ⭐ HABITABILITY SCORE INDEX (HSI)
-# ======================================================
-
-def create_hsi(df: pd.DataFrame) -> pd.Series:
-
-    radius = df["pl_rade"] if "pl_rade" in df.columns else pd.Series(0, index=df.index)
-    temp = df["pl_eqt"] if "pl_eqt" in df.columns else pd.Series(0, index=df.index)
-
-    radius_score = safe_score(radius, ideal=1.0, scale=1.5)
-    temp_score = safe_score(temp, ideal=288, scale=200)
-
-    return (radius_score.fillna(0) + temp_score.fillna(0)) / 2
-
-
-# ======================================================
-# ⭐ STELLAR COMPATIBILITY INDEX (SCI)
-# ======================================================
-
-def create_sci(df: pd.DataFrame) -> pd.Series:
-
-    teff = df["st_teff"] if "st_teff" in df.columns else pd.Series(0, index=df.index)
-    mass = df["st_mass"] if "st_mass" in df.columns else pd.Series(0, index=df.index)
-    rad = df["st_rad"] if "st_rad" in df.columns else pd.Series(0, index=df.index)
-
-    teff_score = safe_score(teff, ideal=5778, scale=2500)
-    mass_score = safe_score(mass, ideal=1.0, scale=1.0)
-    rad_score = safe_score(rad, ideal=1.0, scale=1.0)
-
-    return (
-        teff_score.fillna(0)
-        + mass_score.fillna(0)
-        + rad_score.fillna(0)
-    ) / 3
-
-
 # ======================================================
 # ⭐ API HELPER — USED BY BACKEND
 # ======================================================
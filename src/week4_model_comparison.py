@@ -17,6 +17,8 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 
 from src.utils import ensure_dir_exists, log
+from src.model_manifest import publish_model, file_sha256
+from src.model_artifact import artifact_path, save_artifact
 
 
 DATA_PATH = "data/processed/feature_engineered_exoplanets.csv"
@@ -125,6 +127,25 @@ joblib.dump(best_model, MODEL_PATH)
 
 log(f"Best model saved → {MODEL_PATH}")
 
+# Compact flat-array artifact (mmap-loadable, no sklearn needed)
+try:
+    save_artifact(best_model, artifact_path(MODEL_PATH), file_sha256(MODEL_PATH))
+    log(f"Forest artifact saved → {artifact_path(MODEL_PATH)}")
+except ValueError as e:
+    log(f"No forest artifact for {best_name}: {e}")
+
+# Versioned artifacts + manifest: the API hot-swaps to the best
+# model, the other candidates can be pinned with ?model_version=
+for name, auc, pipeline in results_sorted[::-1]:
+    entry = publish_model(
+        pipeline,
+        "models",
+        metrics={"roc_auc": float(auc), "model": name},
+        make_current=pipeline is best_model,
+    )
+
+    log(f"Published {name} as version {entry['version']} → models/{entry['artifact']}")
+
 
 # ======================================================
 # CREATE RANKED PLANETS FILE
@@ -0,0 +1,15 @@
+"""
+Shared pytest setup: repo root on sys.path and no
+background threads (warm-up, model watcher, job runner).
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+for name in ("EXOHABITAI_WARMUP", "EXOHABITAI_MODEL_WATCH", "EXOHABITAI_JOB_RUNNER"):
+    os.environ.setdefault(name, "0")
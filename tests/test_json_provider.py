@@ -0,0 +1,66 @@
+"""
+ExoJSONProvider: fragments, non-finite floats, real errors.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from flask import Flask
+
+from backend.json_provider import ColumnarSlice, ExoJSONProvider
+
+
+@pytest.fixture
+def provider():
+    return ExoJSONProvider(Flask(__name__))
+
+
+def test_columnar_slice_matches_plain_data(provider):
+    columns = {"score": np.array([0.5, np.nan, np.inf]), "name": np.array(["a", "b", "c"], dtype=object)}
+    text = provider.dumps({"data": ColumnarSlice(columns), "status": "success"})
+
+    assert json.loads(text) == {
+        "data": [{"name": "a", "score": 0.5}, {"name": "b", "score": None}, {"name": "c", "score": None}],
+        "status": "success",
+    }
+
+
+def test_user_strings_are_never_fragments(provider):
+    doc = {"note": "\0json-fragment:0\0", "data": ColumnarSlice({"x": np.arange(2)})}
+    assert json.loads(provider.dumps(doc)) == {"note": "\0json-fragment:0\0", "data": [{"x": 0}, {"x": 1}]}
+
+
+def test_non_finite_plain_floats_become_null(provider):
+    doc = {"a": float("nan"), "b": [float("-inf"), 1.5], "c": np.arange(3)}
+    assert json.loads(provider.dumps(doc)) == {"a": None, "b": [None, 1.5], "c": [0, 1, 2]}
+
+
+def test_same_bytes_as_plain_jsonify(provider):
+    compact = {"separators": (",", ":")}
+    doc = {"z": [1, 2.5, "é"], "a": {"k": None, "b": True}}
+    columns = {"score": np.array([0.25, 1.0]), "id": np.array([3, 4])}
+    records = [{"id": 3, "score": 0.25}, {"id": 4, "score": 1.0}]
+
+    assert provider.dumps(doc, **compact) == json.dumps(doc, sort_keys=True, **compact)
+    assert provider.dumps({**doc, "data": ColumnarSlice(columns)}, **compact) == json.dumps(
+        {**doc, "data": records}, sort_keys=True, **compact
+    )
+
+
+def test_fragments_inside_indented_output(provider):
+    text = provider.dumps({"b": np.array([1, 2]), "a": "x"}, indent=2)
+    assert text == '{\n  "a": "x",\n  "b": [1,2]\n}'
+
+
+def test_circular_reference_is_not_swallowed(provider):
+    loop = []
+    loop.append(loop)
+
+    with pytest.raises(ValueError, match="Circular reference"):
+        provider.dumps({"data": ColumnarSlice({"x": np.arange(2)}), "loop": loop})
+
+
+def test_unknown_objects_still_fail(provider):
+    with pytest.raises(TypeError):
+        provider.dumps({"x": object()})
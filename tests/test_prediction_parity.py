@@ -0,0 +1,113 @@
+"""
+Fast / batch / compiled scoring paths vs the reference
+predict_planet and the sklearn pipeline.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.config import MODEL_PATH
+from src.forest_compiler import compile_forest
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists(MODEL_PATH), reason="trained model artifact not available"
+)
+
+EARTH = {
+    "pl_rade": 1.0,
+    "pl_eqt": 255,
+    "pl_orbper": 365.25,
+    "st_teff": 5778,
+    "st_mass": 1.0,
+    "st_rad": 1.0,
+}
+
+INPUTS = tuple(EARTH)
+
+
+def _payloads():
+    rng = np.random.default_rng(11)
+    payloads = [dict(EARTH)]
+
+    # Every input missing / null in turn (imputer + neutral orbit paths)
+    for key in INPUTS:
+        payloads.append({k: v for k, v in EARTH.items() if k != key})
+        payloads.append({**EARTH, key: None})
+
+    payloads += [
+        {"pl_rade": 2.1},
+        {"pl_eqt": 400, "st_teff": 4000},
+        {**EARTH, "pl_orbper": 0},
+        {**EARTH, "pl_rade": "1.3", "st_teff": "5600"},
+        {**EARTH, "pl_name": "Kepler-442 b", "disc_year": 2015},
+        {**EARTH, "pl_rade": 20, "pl_eqt": 4000, "st_mass": 0.1},
+    ]
+
+    for _ in range(40):
+        payloads.append({
+            "pl_rade": float(rng.uniform(0.1, 20)),
+            "pl_eqt": float(rng.uniform(50, 2000)),
+            "pl_orbper": float(rng.uniform(0, 5000)),
+            "st_teff": int(rng.integers(2000, 10000)),
+            "st_mass": float(rng.uniform(0.1, 5)),
+            "st_rad": float(rng.uniform(0.1, 10)),
+        })
+
+    return payloads
+
+
+PAYLOADS = _payloads()
+
+
+@pytest.fixture(scope="module")
+def model():
+    from backend.model_registry import get_model
+    return get_model()
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_fast_path_matches_predict_planet(model, payload):
+    from backend.services.prediction_service import predict_planet, predict_planet_fast
+
+    assert predict_planet_fast(payload, model) == predict_planet(payload, model)
+
+
+def test_batch_matches_predict_planet(model):
+    from backend.services.prediction_service import predict_planet, predict_planets_batch
+
+    expected = [predict_planet(payload, model) for payload in PAYLOADS]
+    assert predict_planets_batch(PAYLOADS, model) == expected
+
+
+def test_batch_empty(model):
+    from backend.services.prediction_service import predict_planets_batch
+
+    assert predict_planets_batch([], model) == []
+
+
+def test_compiled_forest_matches_sklearn(model):
+    compiled = compile_forest(model)
+    columns = list(model.feature_names_in_)
+
+    rng = np.random.default_rng(3)
+    X = pd.DataFrame(rng.uniform(0, 6000, (3000, len(columns))), columns=columns)
+    X.iloc[:, 0] = rng.uniform(0.1, 20, len(X))
+
+    # NaN cells go through the imputer statistics
+    X = X.mask(rng.random(X.shape) < 0.1)
+
+    np.testing.assert_allclose(compiled.predict_proba(X), model.predict_proba(X), rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(compiled.predict(X), model.predict(X))
+
+
+def test_compiled_forest_single_row_and_chunking(model):
+    compiled = compile_forest(model)
+    X = pd.DataFrame([[1.0] * len(model.feature_names_in_)] * 5, columns=model.feature_names_in_)
+
+    np.testing.assert_allclose(
+        compiled.predict_proba(X.iloc[0].to_numpy()), model.predict_proba(X.iloc[:1]), rtol=0, atol=1e-12
+    )
+    np.testing.assert_array_equal(compiled.predict_proba(X, chunk_rows=2), compiled.predict_proba(X))
@@ -0,0 +1,90 @@
+"""
+/rank ?sort= on any numeric catalog column or a returned text column.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from backend.config import RANKED_DATA_PATH
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists(RANKED_DATA_PATH), reason="ranked catalog not available"
+)
+
+
+@pytest.fixture(scope="module")
+def client():
+    from backend.app import app
+    return app.test_client()
+
+
+@pytest.fixture(scope="module")
+def snapshot():
+    from backend.services.catalog import get_ranked_catalog
+    return get_ranked_catalog().get()
+
+
+def _scores(page):
+    return [np.nan if d["habitability_score"] is None else d["habitability_score"] for d in page["data"]]
+
+
+def test_unknown_sort_column_is_rejected(client):
+    response = client.get("/rank?sort=not_a_column")
+
+    assert response.status_code == 400
+    assert response.get_json()["status"] == "error"
+
+
+@pytest.mark.parametrize("order", ["desc", "asc"])
+def test_sort_by_column_not_returned(client, snapshot, order):
+    column = next(
+        c for c in snapshot.columns
+        if c not in ("pl_name", "habitability_score", "prediction")
+        and snapshot.columns[c].dtype.kind in "biuf"
+    )
+    descending = order == "desc"
+    expected = snapshot.column("habitability_score")[snapshot.permutation(column, descending)]
+
+    scores, url = [], f"/rank?sort={column}&order={order}&limit=200"
+    for _ in range(3):
+        page = client.get(url).get_json()
+        scores += _scores(page)
+        url = f"/rank?cursor={page['metadata']['next_cursor']}&limit=200"
+
+    np.testing.assert_array_equal(scores, expected[:len(scores)])
+
+
+def test_sort_by_planet_name(client, tmp_path, monkeypatch):
+    import pandas as pd
+    from backend.routes import rank
+    from backend.services.catalog import Catalog
+
+    rng = np.random.default_rng(5)
+    names = [f"Kepler-{i} b" for i in rng.integers(1, 400, 500)] + [None] * 20
+    rng.shuffle(names)
+    frame = pd.DataFrame({
+        "pl_name": names,
+        "habitability_score": rng.uniform(0, 1, len(names)),
+        "prediction": rng.integers(0, 2, len(names)),
+    })
+    path = tmp_path / "ranked.csv"
+    frame.to_csv(path, index=False)
+    catalog = Catalog(str(path))
+    monkeypatch.setattr(rank, "get_ranked_catalog", lambda: catalog)
+
+    for order in ("asc", "desc"):
+        expected = pd.read_csv(path).sort_values(
+            "pl_name", ascending=order == "asc", kind="stable", na_position="last"
+        )
+
+        names, url = [], f"/rank?sort=pl_name&order={order}&limit=200"
+        while url:
+            page = client.get(url).get_json()
+            assert page["status"] == "success"
+            names += [d["pl_name"] for d in page["data"]]
+            cursor = page["metadata"]["next_cursor"]
+            url = cursor and f"/rank?cursor={cursor}&limit=200"
+
+        assert names == [None if n != n else n for n in expected["pl_name"]]
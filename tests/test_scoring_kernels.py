@@ -0,0 +1,184 @@
+"""
+src.scoring_kernels vs the original pandas / scalar maths
+(pre-kernel code kept below as reference implementations).
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feature_engineering import create_hsi, create_sci, safe_score
+from src.scoring_kernels import (
+    fusion_into,
+    hsi_into,
+    orbit_stability_into,
+    safe_score_into,
+    sci_into,
+)
+from backend.services.prediction_service import orbital_stability_score, quantum_neural_fusion
+
+
+# =====================================================
+# 📜 REFERENCE IMPLEMENTATIONS (pre-kernel code)
+# =====================================================
+
+def _ref_safe_score(series, ideal, scale):
+    if not isinstance(series, pd.Series):
+        series = pd.Series(series)
+    score = 1 - (np.abs(series - ideal) / scale)
+    return pd.Series(np.clip(score, 0, 1), index=series.index)
+
+
+def _ref_column(df, col):
+    return df[col] if col in df.columns else pd.Series(0, index=df.index)
+
+
+def _ref_hsi(df):
+    return (
+        _ref_safe_score(_ref_column(df, "pl_rade"), 1.0, 1.5).fillna(0)
+        + _ref_safe_score(_ref_column(df, "pl_eqt"), 288, 200).fillna(0)
+    ) / 2
+
+
+def _ref_sci(df):
+    return (
+        _ref_safe_score(_ref_column(df, "st_teff"), 5778, 2500).fillna(0)
+        + _ref_safe_score(_ref_column(df, "st_mass"), 1.0, 1.0).fillna(0)
+        + _ref_safe_score(_ref_column(df, "st_rad"), 1.0, 1.0).fillna(0)
+    ) / 3
+
+
+def _ref_orbit_scores(orbper):
+    orb = np.nan_to_num(np.asarray(orbper, dtype=np.float64), nan=0.0)
+    score = np.clip(1 - np.abs(orb - 365) / 600, 0.0, 1.0)
+    return np.where(orb == 0, 0.5, score)
+
+
+def _ref_fusion(model_prob, hsi, sci, orbit_score):
+    base_score = (
+        0.35 * np.clip(model_prob, 0, 1) +
+        0.30 * np.clip(hsi, 0, 1) +
+        0.20 * np.clip(sci, 0, 1) +
+        0.15 * np.clip(orbit_score, 0, 1)
+    )
+    return np.power(base_score, 0.85)
+
+
+# =====================================================
+# 🧪 DATA
+# =====================================================
+
+@pytest.fixture
+def planets():
+    """Planet-like columns with NaN, ±inf, zero periods and edge values."""
+
+    n = 5_000
+    rng = np.random.default_rng(7)
+
+    df = pd.DataFrame({
+        "pl_rade": rng.uniform(0.1, 20, n),
+        "pl_eqt": rng.uniform(50, 2000, n),
+        "pl_orbper": rng.uniform(0, 5000, n),
+        "st_teff": rng.uniform(2000, 10000, n),
+        "st_mass": rng.uniform(0.1, 5, n),
+        "st_rad": rng.uniform(0.1, 10, n),
+    })
+
+    for col in df.columns:
+        df.loc[rng.random(n) < 0.05, col] = np.nan
+
+    df.loc[rng.random(n) < 0.02, "pl_orbper"] = 0.0
+    df.loc[0, ["pl_rade", "pl_eqt", "st_teff"]] = [1.0, 288, 5778]       # ideals
+    df.loc[1, ["pl_rade", "st_mass"]] = [np.inf, -np.inf]
+    return df
+
+
+def _same(actual, expected):
+    np.testing.assert_array_equal(np.asarray(actual), np.asarray(expected))
+
+
+# =====================================================
+# ✅ PARITY
+# =====================================================
+
+@pytest.mark.parametrize("ideal, scale", [(1.0, 1.5), (288, 200), (5778, 2500), (365, 600)])
+def test_safe_score_into_matches_reference(planets, ideal, scale):
+    for col in planets.columns:
+        values = planets[col].to_numpy()
+        out = np.empty_like(values)
+
+        assert safe_score_into(values, ideal, scale, out=out) is out
+        _same(out, _ref_safe_score(planets[col], ideal, scale))
+
+
+def test_safe_score_series_and_scalar_inputs(planets):
+    series = planets["pl_rade"]
+    result = safe_score(series, 1.0, 1.5)
+
+    assert result.index.equals(series.index)
+    _same(result, _ref_safe_score(series, 1.0, 1.5))
+    _same(safe_score(1.2, 1.0, 1.5), _ref_safe_score(pd.Series([1.2]), 1.0, 1.5))
+    _same(safe_score([np.nan, 0.4], 1.0, 1.5), _ref_safe_score([np.nan, 0.4], 1.0, 1.5))
+
+
+def test_create_hsi_sci_match_reference(planets):
+    _same(create_hsi(planets), _ref_hsi(planets))
+    _same(create_sci(planets), _ref_sci(planets))
+
+
+def test_create_hsi_sci_missing_columns(planets):
+    partial = planets[["pl_rade", "st_teff"]]
+
+    _same(create_hsi(partial), _ref_hsi(partial))
+    _same(create_sci(partial), _ref_sci(partial))
+
+
+def test_hsi_sci_kernels_fill_nan_with_zero():
+    nan = np.array([np.nan])
+    out, scratch = np.empty(1), np.empty(1)
+
+    assert hsi_into(nan, nan, out, scratch)[0] == 0.0
+    assert sci_into(nan, nan, nan, out, scratch)[0] == 0.0
+
+
+def test_orbit_stability_matches_batch_reference(planets):
+    orbper = planets["pl_orbper"].to_numpy()
+    out = np.empty_like(orbper)
+
+    assert orbit_stability_into(orbper, out=out) is out
+    _same(out, _ref_orbit_scores(orbper))
+
+
+def test_orbit_stability_nan_is_neutral():
+    orbper = np.array([np.nan, 0.0, 365.0, 5000.0])
+    _same(orbit_stability_into(orbper, out=np.empty(4)), [0.5, 0.5, 1.0, 0.0])
+
+
+def test_orbit_stability_matches_scalar_for_json_inputs(planets):
+    orbper = planets["pl_orbper"].to_numpy()
+    kernel = orbit_stability_into(orbper, out=np.empty_like(orbper))
+
+    # JSON has no NaN: missing periods arrive as null
+    scalar = [
+        orbital_stability_score({"pl_orbper": None if math.isnan(v) else v})
+        for v in orbper.tolist()
+    ]
+    _same(kernel, scalar)
+
+
+def test_fusion_matches_references(planets):
+    n = len(planets)
+    out, scratch = np.empty(n), np.empty(n)
+
+    prob = np.random.default_rng(1).uniform(-0.1, 1.1, n)
+    hsi = create_hsi(planets).to_numpy()
+    sci = create_sci(planets).to_numpy()
+    orbit = orbit_stability_into(planets["pl_orbper"].to_numpy(), out=np.empty(n))
+
+    assert fusion_into(prob, hsi, sci, orbit, out=out, scratch=scratch) is out
+    _same(out, _ref_fusion(prob, hsi, sci, orbit))
+
+    scalar = [quantum_neural_fusion(*args) for args in zip(prob, hsi, sci, orbit)]
+    assert [round(v, 4) for v in out.tolist()] == scalar